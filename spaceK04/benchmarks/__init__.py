@@ -0,0 +1,15 @@
+# ===================================================================
+# SPACEK - BENCHMARKS DE update() E draw()
+# ===================================================================
+# Roda o jogo completo (spaceK.py com tela e HUD, sem janela visível)
+# em cenários roteirizados e mede o tempo de cada seção do quadro com
+# o SpaceKProfiler (ver spacek_profile.py).
+#
+# Uso (dentro da pasta spaceK04):
+#   python -m benchmarks
+#   python -m benchmarks --frames 1200 --output depois.json
+#   python -m benchmarks --compare antes.json
+#
+# A saída é JSON com mínimo, mediana e p99 (em ms) de cada seção, para
+# comparar o desempenho entre duas versões do código.
+# ===================================================================
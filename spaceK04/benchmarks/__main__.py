@@ -0,0 +1,132 @@
+# ===================================================================
+# SPACEK - LINHA DE COMANDO DOS BENCHMARKS
+# ===================================================================
+# python -m benchmarks [--frames N] [--seed N] [--scenario NOME] [--gc]
+#                      [--output arquivo.json] [--compare antes.json]
+# ===================================================================
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+
+from benchmarks.scenarios import SCENARIOS, load_game, run_scenario
+
+# Versão do formato do JSON de resultados
+RESULT_VERSION = 1
+
+# Casas decimais dos tempos (ms) no JSON: diffs entre versões mais limpos
+RESULT_DIGITS = 4
+
+def round_times(value):
+    """Arredondar todos os tempos de um resultado (dicionários aninhados)"""
+    if isinstance(value, dict):
+        return {key: round_times(item) for key, item in value.items()}
+    if isinstance(value, float):
+        return round(value, RESULT_DIGITS)
+    return value
+
+def run_benchmarks(names, frames, seed, gc_idle=False):
+    """
+    Rodar os cenários escolhidos
+
+    Args:
+        names: Nomes dos cenários (na ordem)
+        frames: Quadros medidos por cenário
+        seed: Semente usada em todos os cenários
+        gc_idle: Coletar lixo no tempo livre dos quadros
+
+    Returns:
+        dict: Resultado completo (informações do sistema + cenários)
+    """
+    import numpy
+    import pygame
+
+    # O jogo escreve mensagens (sons, log) que não fazem parte do JSON
+    with contextlib.redirect_stdout(io.StringIO()):
+        mod, update = load_game()
+        scenarios = {name: run_scenario(mod, update, name, frames, seed, gc_idle) for name in names}
+
+    return round_times({
+        "version": RESULT_VERSION,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": numpy.__version__,
+        "machine": platform.machine(),
+        "frames": frames,
+        "seed": seed,
+        "gc_idle": gc_idle,
+        "scenarios": scenarios
+    })
+
+def compare_results(before, after):
+    """
+    Montar tabela comparando as medianas de dois resultados
+
+    Args:
+        before: Resultado antigo (JSON lido de --compare)
+        after: Resultado novo
+
+    Returns:
+        list: Linhas de texto (cenário, seção, antes, depois, variação)
+    """
+    lines = []
+    for name, scenario in after["scenarios"].items():
+        old = before.get("scenarios", {}).get(name)
+        if old is None:
+            continue
+        rows = [("update", old["update"], scenario["update"]),
+                ("draw", old["draw"], scenario["draw"])]
+        for section, stats in scenario["sections"].items():
+            if section in old["sections"]:
+                rows.append((section, old["sections"][section], stats))
+        for section, old_stats, new_stats in rows:
+            old_median = old_stats["median"]
+            new_median = new_stats["median"]
+            change = (new_median - old_median) / old_median * 100 if old_median > 0 else 0.0
+            lines.append(f"{name:16} {section:16} {old_median:9.4f} -> {new_median:9.4f} ms"
+                         f" ({change:+6.1f}%)")
+    return lines
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando
+
+    Args:
+        argv: Argumentos (None = sys.argv)
+
+    Returns:
+        int: Código de saída
+    """
+    parser = argparse.ArgumentParser(description="Mede update() e draw() do SpaceK em cenários fixos.")
+    parser.add_argument("--frames", type=int, default=600, help="quadros medidos por cenário")
+    parser.add_argument("--seed", type=int, default=1, help="semente do mundo")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="rodar só este cenário (pode repetir)")
+    parser.add_argument("--gc", action="store_true",
+                        help="coletar lixo no tempo livre dos quadros (spacek_gc.py)")
+    parser.add_argument("--output", help="gravar o JSON neste arquivo (padrão: tela)")
+    parser.add_argument("--compare", help="comparar as medianas com um JSON gravado antes")
+    args = parser.parse_args(argv)
+
+    names = args.scenario or list(SCENARIOS)
+    result = run_benchmarks(names, args.frames, args.seed, args.gc)
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as result_file:
+            result_file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as before_file:
+            before = json.load(before_file)
+        for line in compare_results(before, result):
+            print(line, file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+# ===================================================================
+# SPACEK - BENCHMARK DE MEMÓRIA DAS ENTIDADES
+# ===================================================================
+# Compara as classes do jogo (com __slots__) com versões equivalentes
+# que guardam os atributos em um __dict__ (como era antes), medindo:
+#
+#   - bytes por entidade (tracemalloc, criando milhares de entidades)
+#   - tempo de acesso a atributos (ler y e somar em x, como num update)
+#
+# As estrelas (arrays do NumPy, spacek_stars.py) são comparadas com o
+# formato antigo de um dicionário por estrela. Os aliens também ficam
+# em arrays (spacek_aliens.py): para eles são medidos os bytes por
+# alien e o tempo do passo de todos os aliens acordados de uma vez.
+#
+# Uso (dentro da pasta spaceK04):
+#   python -m benchmarks.entities
+#   python -m benchmarks.entities --count 50000 --output entidades.json
+# ===================================================================
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if GAME_DIR not in sys.path:
+    sys.path.insert(0, GAME_DIR)
+
+from pygame import Rect
+
+from spacek_aliens import SpaceKAlienStore
+from spacek_levels import ENEMY_TYPES
+from spacek_stars import SpaceKStarField
+from spacek_world import SpaceKAlien, SpaceKCoin, SpaceKLaser, SpaceKPowerup, SpaceKWorld
+
+# Casas decimais dos números no JSON
+RESULT_DIGITS = 4
+
+# Aliens e passos da medição do update dos aliens
+ALIEN_COUNT = 5000
+ALIEN_STEPS = 200
+ALIEN_WARMUP = 10   # Passos antes da medição (os aliens caem até o chão)
+
+def dict_backed(cls):
+    """
+    Criar cópia da classe sem __slots__ (atributos em um __dict__)
+
+    Args:
+        cls: Classe com __slots__
+
+    Returns:
+        type: Mesmos métodos, mas com um dicionário de atributos por objeto
+    """
+    namespace = {name: value for name, value in cls.__dict__.items()
+                 if name != "__slots__" and name not in cls.__slots__}
+    return type(cls.__name__ + "Dict", cls.__bases__, namespace)
+
+def star_dict(x, y, size, speed, twinkle, color):
+    """Estrela no formato antigo (dicionário com chaves de texto)"""
+    return {"x": x, "y": y, "size": size, "speed": speed, "twinkle": twinkle, "color": color}
+
+# Nome -> (construtor com __slots__, construtor antigo, argumentos de criação)
+ENTITIES = {
+    "laser": (SpaceKLaser, dict_backed(SpaceKLaser), lambda i: (i * 2.0, 200.0, 1)),
+    "coin": (SpaceKCoin, dict_backed(SpaceKCoin), lambda i: (i * 30.0, 250.0)),
+    "powerup": (SpaceKPowerup, dict_backed(SpaceKPowerup), lambda i: (i * 50.0, 220.0, "shield"))
+}
+
+def star_args(i):
+    """Argumentos de uma estrela no formato antigo"""
+    return (i * 7, i % 600, 2, 0.1, i % 100, (255, 255, 255))
+
+def measure_memory(factory, make_args, count):
+    """
+    Medir memória usada por `count` entidades
+
+    Args:
+        factory: Classe ou função que cria uma entidade
+        make_args: Função i -> argumentos de criação
+        count: Número de entidades
+
+    Returns:
+        float: Bytes por entidade
+
+    Os argumentos são criados antes da medição: só a entidade conta.
+    """
+    args = [make_args(i) for i in range(count)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [factory(*arg) for arg in args]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    used = after - before - sys.getsizeof(entities)
+    return used / count
+
+def update_objects(entities):
+    """Passo típico de atualização com atributos (x += y * 0.001)"""
+    for entity in entities:
+        entity.x += entity.y * 0.001
+
+def update_star_dicts(stars):
+    """Passo das estrelas no formato antigo (um dicionário por estrela)"""
+    for star in stars:
+        star["x"] -= star["speed"] * 0.5
+        if star["x"] < -200:
+            star["x"] = 1000
+        star["twinkle"] += 0.5
+
+def measure_access(factory, make_args, count, rounds):
+    """
+    Medir tempo de acesso a atributos
+
+    Args:
+        factory: Classe ou função que cria uma entidade
+        make_args: Função i -> argumentos de criação
+        count: Número de entidades
+        rounds: Repetições (vale a mais rápida)
+
+    Returns:
+        float: Nanossegundos por entidade atualizada
+    """
+    entities = [factory(*make_args(i)) for i in range(count)]
+    return best_time(lambda: update_objects(entities), rounds) * 1e9 / count
+
+def best_time(function, rounds):
+    """Menor tempo (s) de `rounds` chamadas de function()"""
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def measure_stars(count, rounds):
+    """
+    Comparar o campo de estrelas do NumPy com um dicionário por estrela
+
+    Args:
+        count: Número de estrelas
+        rounds: Repetições da medição do passo
+
+    Returns:
+        dict: Bytes e nanossegundos por estrela (novo e antigo)
+    """
+    field = SpaceKStarField()
+    field.reset(random.Random(1), 800, 600, count)
+    field_bytes = sum(array.nbytes for array in (field.x, field.y, field.size, field.speed,
+                                                 field.twinkle, field.color, field.parallax))
+    dict_bytes = measure_memory(star_dict, star_args, count)
+    stars = [star_dict(*star_args(i)) for i in range(count)]
+    return {
+        "bytes": round(field_bytes / count, RESULT_DIGITS),
+        "bytes_dict": round(dict_bytes, RESULT_DIGITS),
+        "memory_saved": round(1 - field_bytes / count / dict_bytes, RESULT_DIGITS),
+        "update_ns": round(best_time(lambda: field.update(0.5, 0.5, -200, 1000), rounds)
+                           * 1e9 / count, RESULT_DIGITS),
+        "update_ns_dict": round(best_time(lambda: update_star_dicts(stars), rounds)
+                                * 1e9 / count, RESULT_DIGITS)
+    }
+
+def alien_args(i):
+    """Argumentos de um alien (tipos alternados, todos dentro da tela)"""
+    return (i * 7 % 800, 300.0, ENEMY_TYPES[i % len(ENEMY_TYPES)], 100)
+
+def measure_aliens(count, steps):
+    """
+    Medir memória e passo dos aliens guardados em arrays
+
+    Args:
+        count: Número de aliens
+        steps: Passos de update medidos
+
+    Returns:
+        dict: Bytes por alien e milissegundos por passo (médio e máximo)
+    """
+    rng = random.Random(1)
+    args = [alien_args(i) for i in range(count)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    store = SpaceKAlienStore()
+    aliens = [SpaceKAlien(*arg, rng, store) for arg in args]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    alien_bytes = (after - before - sys.getsizeof(aliens)) / count
+
+    # Mundo real com os aliens no lugar dos do nível, sobre um chão largo
+    world = SpaceKWorld(seed=1)
+    world.aliens = store
+    world.platform_grid.insert_rect(Rect(-200, 330, world.width + 400, 20))
+    for _ in range(ALIEN_WARMUP):
+        world.tick += 1
+        world.update_enemies()
+    times = []
+    for _ in range(steps):
+        world.tick += 1
+        start = time.perf_counter()
+        world.update_enemies()
+        times.append(time.perf_counter() - start)
+    return {
+        "count": count,
+        "active": world.enemies_active,
+        "bytes": round(alien_bytes, RESULT_DIGITS),
+        "update_ms": round(sum(times) / len(times) * 1000, RESULT_DIGITS),
+        "update_ms_median": round(sorted(times)[len(times) // 2] * 1000, RESULT_DIGITS),
+        "update_ms_max": round(max(times) * 1000, RESULT_DIGITS)
+    }
+
+def run_entities(count, rounds):
+    """
+    Medir todas as entidades
+
+    Args:
+        count: Entidades criadas por medição
+        rounds: Repetições da medição de acesso
+
+    Returns:
+        dict: Resultado por entidade (bytes e ns, novo e antigo)
+    """
+    result = {}
+    for name, (slotted, legacy, make_args) in ENTITIES.items():
+        new_bytes = measure_memory(slotted, make_args, count)
+        old_bytes = measure_memory(legacy, make_args, count)
+        result[name] = {
+            "bytes": round(new_bytes, RESULT_DIGITS),
+            "bytes_dict": round(old_bytes, RESULT_DIGITS),
+            "memory_saved": round(1 - new_bytes / old_bytes, RESULT_DIGITS),
+            "access_ns": round(measure_access(slotted, make_args, count, rounds), RESULT_DIGITS),
+            "access_ns_dict": round(measure_access(legacy, make_args, count, rounds), RESULT_DIGITS)
+        }
+    result["star"] = measure_stars(count, rounds)
+    result["alien"] = measure_aliens(ALIEN_COUNT, ALIEN_STEPS)
+    return result
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando
+
+    Args:
+        argv: Argumentos (None = sys.argv)
+
+    Returns:
+        int: Código de saída
+    """
+    parser = argparse.ArgumentParser(description="Mede memória e acesso das entidades do SpaceK.")
+    parser.add_argument("--count", type=int, default=20000, help="entidades por medição")
+    parser.add_argument("--rounds", type=int, default=5, help="repetições da medição de acesso")
+    parser.add_argument("--output", help="gravar o JSON neste arquivo (padrão: tela)")
+    args = parser.parse_args(argv)
+
+    text = json.dumps({"count": args.count, "entities": run_entities(args.count, args.rounds)},
+                      indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as result_file:
+            result_file.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
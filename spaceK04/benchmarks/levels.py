@@ -0,0 +1,190 @@
+# ===================================================================
+# SPACEK - BENCHMARK DE CARGA DE NÍVEIS
+# ===================================================================
+# Gera um nível sintético grande (padrão: 50.000 entidades entre
+# plataformas, aliens, power-ups e moedas) e mede:
+#
+#   - compile_ms: ler o JSON e compilar (arrays + índice espacial)
+#   - cache_load_ms: ler o nível compilado do cache binário (.npz)
+#   - grid_fill_ms: montar a grade de plataformas a partir do índice
+#   - grid_build_ms: montar a mesma grade inserindo plataforma por
+#     plataforma (como era feito antes do índice pré-calculado)
+#   - stream: câmera atravessando o nível inteiro com o streaming em
+#     pedaços (spacek_stream.py) - tempo médio e máximo por passo e o
+#     maior número de objetos vivos ao mesmo tempo
+#
+# Uso (dentro da pasta spaceK04):
+#   python -m benchmarks.levels
+#   python -m benchmarks.levels --entities 100000 --output niveis.json
+# ===================================================================
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if GAME_DIR not in sys.path:
+    sys.path.insert(0, GAME_DIR)
+
+from pygame import Rect
+
+from spacek_collision import SpaceKSpatialHash
+from spacek_levels import (ENEMY_TYPES, LEVEL_FORMAT_VERSION, POWERUP_TYPES,
+                           SpaceKLevelData, compile_level)
+from spacek_world import SpaceKWorld
+
+# Quanto a câmera anda por passo na medição do streaming (velocidade máxima do jogador)
+STREAM_STEP = 6
+
+# Casas decimais dos números no JSON
+RESULT_DIGITS = 4
+
+def synthetic_level(entities, seed):
+    """
+    Gerar a descrição de um nível grande (mesmo formato de levels/*.json)
+
+    Args:
+        entities: Número total de entidades
+        seed: Semente do gerador
+
+    Returns:
+        dict: Nível com 1/4 das entidades de cada tipo, espalhadas em X
+    """
+    rng = random.Random(seed)
+    quarter = entities // 4
+    length = quarter * 200  # Uma plataforma a cada 200 px, em média
+    return {
+        "version": LEVEL_FORMAT_VERSION,
+        "name": "SINTÉTICO",
+        "end_x": length,
+        "platforms": [[rng.randrange(length), rng.randrange(250, 520), rng.randrange(60, 300), 20]
+                      for _ in range(quarter)],
+        "enemies": [[rng.randrange(length), rng.randrange(200, 500), rng.choice(ENEMY_TYPES),
+                     rng.randrange(40, 200)] for _ in range(quarter)],
+        "powerups": [[rng.randrange(length), rng.randrange(200, 500), rng.choice(POWERUP_TYPES)]
+                     for _ in range(quarter)],
+        "coins": [[rng.randrange(length), rng.randrange(200, 500)]
+                  for _ in range(entities - 3 * quarter)]
+    }
+
+def best_time(function, rounds):
+    """Menor tempo (s) de `rounds` chamadas de function()"""
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def build_grid(platforms):
+    """Montar a grade inserindo uma plataforma por vez"""
+    grid = SpaceKSpatialHash()
+    for rect in platforms:
+        grid.insert_rect(rect)
+    return grid
+
+def measure_stream(level, seed):
+    """
+    Medir o streaming com a câmera atravessando o nível
+
+    Args:
+        level: SpaceKLevelData
+        seed: Semente do mundo
+
+    Returns:
+        dict: Tempo por passo (ms), pedaços carregados, objetos vivos e
+              aliens guardados fora da janela (quantos e bytes reservados)
+    """
+    world = SpaceKWorld(seed=seed)
+    world.level_loader.levels[1] = level  # Nível sintético no lugar do nível 1
+    world.reset(seed)
+    times = []
+    for camera_x in range(0, level.end_x, STREAM_STEP):
+        world.camera_x = camera_x
+        world.player_x = camera_x + world.width // 2.5
+        start = time.perf_counter()
+        world.update_stream()
+        times.append(time.perf_counter() - start)
+    stats = world.stream.stats()
+    parking = world.aliens.parking_stats()
+    return {
+        "steps": len(times),
+        "mean_ms": round(sum(times) / len(times) * 1000, RESULT_DIGITS),
+        "max_ms": round(max(times) * 1000, RESULT_DIGITS),
+        "chunks_total": stats["chunks_total"],
+        "chunks_loaded": stats["chunks_loaded"],
+        "peak_entities": stats["peak_entities"],
+        "saved_aliens": parking["saved"],
+        "saved_bytes": parking["bytes"]
+    }
+
+def run_levels(entities, rounds, seed):
+    """
+    Medir compilação e carga de um nível sintético
+
+    Args:
+        entities: Número de entidades do nível
+        rounds: Repetições de cada medição (vale a mais rápida)
+        seed: Semente do nível sintético
+
+    Returns:
+        dict: Tempos em milissegundos e tamanhos dos arquivos em bytes
+    """
+    source_text = json.dumps(synthetic_level(entities, seed))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_path = os.path.join(temp_dir, "level.npz")
+        compile_time = best_time(lambda: compile_level(json.loads(source_text)), rounds)
+        level = compile_level(json.loads(source_text))
+        level.save(cache_path)
+        load_time = best_time(lambda: SpaceKLevelData.load(cache_path), rounds)
+        cache_bytes = os.path.getsize(cache_path)
+
+    platforms = [Rect(*row) for row in level.platforms.tolist()]
+    grid = SpaceKSpatialHash()
+    return {
+        "entities": level.entity_count(),
+        "json_bytes": len(source_text.encode("utf-8")),
+        "cache_bytes": cache_bytes,
+        "compile_ms": round(compile_time * 1000, RESULT_DIGITS),
+        "cache_load_ms": round(load_time * 1000, RESULT_DIGITS),
+        "grid_fill_ms": round(best_time(lambda: level.fill_platform_grid(grid, platforms), rounds)
+                              * 1000, RESULT_DIGITS),
+        "grid_build_ms": round(best_time(lambda: build_grid(platforms), rounds) * 1000,
+                               RESULT_DIGITS),
+        "stream": measure_stream(level, seed)
+    }
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando
+
+    Args:
+        argv: Argumentos (None = sys.argv)
+
+    Returns:
+        int: Código de saída
+    """
+    parser = argparse.ArgumentParser(description="Mede compilação e carga de níveis do SpaceK.")
+    parser.add_argument("--entities", type=int, default=50000, help="entidades do nível sintético")
+    parser.add_argument("--rounds", type=int, default=5, help="repetições de cada medição")
+    parser.add_argument("--seed", type=int, default=1, help="semente do nível sintético")
+    parser.add_argument("--output", help="gravar o JSON neste arquivo (padrão: tela)")
+    args = parser.parse_args(argv)
+
+    text = json.dumps(run_levels(args.entities, args.rounds, args.seed), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as result_file:
+            result_file.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
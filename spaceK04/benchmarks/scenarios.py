@@ -0,0 +1,244 @@
+# ===================================================================
+# SPACEK - CENÁRIOS DOS BENCHMARKS
+# ===================================================================
+# Carrega o spaceK.py do mesmo jeito que o "python -m pgzero" e roda
+# cada cenário quadro a quadro (update + draw), sempre com a mesma
+# semente, guardando os tempos de cada seção no SpaceKProfiler.
+# ===================================================================
+
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+from types import ModuleType
+
+# Sem janela e sem placa de som: o desenho acontece em uma tela virtual
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# Pasta do jogo (spaceK.py, sons e módulos spacek_*)
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if GAME_DIR not in sys.path:
+    sys.path.insert(0, GAME_DIR)
+
+from pgzero.constants import keys
+
+from spacek_gc import SpaceKGCScheduler
+from spacek_profile import SpaceKProfiler, percentile
+
+# Tempo de cada quadro entregue ao update() (um passo de simulação por quadro)
+FRAME_DT = 1 / 60
+
+# Quadros rodados antes de medir (caches de desenho e de texto aquecem)
+WARMUP_FRAMES = 30
+
+def load_game():
+    """
+    Carregar spaceK.py como o pgzero faz
+
+    Returns:
+        tuple: (módulo do jogo, função update com o dt do pgzero)
+
+    As mensagens escritas durante a carga (sons, log) são descartadas.
+    """
+    from pgzero.runner import prepare_mod
+    from pgzero.game import PGZeroGame
+
+    os.chdir(GAME_DIR)  # Sons são procurados a partir da pasta do jogo
+    sys._pgzrun = True   # pgzrun.go() não abre o laço do jogo
+
+    path = os.path.join(GAME_DIR, "spaceK.py")
+    mod = ModuleType("spaceK")
+    mod.__file__ = path
+    sys.modules["spaceK"] = mod
+    prepare_mod(mod)
+    with contextlib.redirect_stdout(io.StringIO()):
+        with open(path, encoding="utf-8") as source:
+            exec(compile(source.read(), path, "exec"), mod.__dict__)
+        game = PGZeroGame(mod)
+        game.reinit_screen()
+        mod.sound_bank.wait()  # Sons prontos antes de medir
+    return mod, game.get_update_func()
+
+# ===================================================================
+# CENÁRIOS
+# ===================================================================
+# Cada cenário tem uma função de preparo (chamada uma vez, depois de
+# começar a partida) e uma função por quadro (chamada antes do update).
+
+def press(mod, key_name):
+    """Pressionar uma tecla como o pgzero faria"""
+    mod.on_key_down(getattr(keys, key_name))
+
+def keep_alive(mod):
+    """Impedir game over durante o cenário (vidas e oxigênio cheios)"""
+    mod.world.player_lives = 3
+    mod.world.oxygen = 100
+
+def setup_idle(mod):
+    """Nível 1 parado: só a simulação e o desenho básicos"""
+
+def frame_idle(mod, frame):
+    keep_alive(mod)
+
+def setup_run_level2(mod):
+    """Nível 2 desde o começo, correndo para a direita"""
+    world = mod.world
+    world.current_level = 2
+    world.load_level(2)
+    world.player_x = 100
+    world.player_y = 500
+    world.save_previous_positions()
+    press(mod, "D")
+
+def frame_run_level2(mod, frame):
+    keep_alive(mod)
+    if frame % 20 == 0:
+        press(mod, "SPACE")  # Pulo/jetpack para passar pelos buracos
+    world = mod.world
+    if world.current_level != 2 or world.player_y > world.height:
+        setup_run_level2(mod)  # Recomeçar a corrida (fim do nível ou queda)
+
+def setup_laser_spam(mod):
+    """Laser a cada quadro: a lista fica sempre no limite de 5 lasers"""
+
+def frame_laser_spam(mod, frame):
+    keep_alive(mod)
+    press(mod, "X")
+
+def setup_particle_bursts(mod):
+    """Explosões de 40 faíscas iguais às de fim de nível"""
+
+def frame_particle_bursts(mod, frame):
+    keep_alive(mod)
+    if frame % 15 == 0:
+        world = mod.world
+        world.create_particles(world.player_x + 15, world.player_y + 20,
+                               (0, 255, 0), 40, "spark")
+
+def setup_victory_rain(mod):
+    """Tela de vitória com a chuva de partículas de celebração"""
+    mod.world.state = "victory"
+    mod.game_state = "victory"
+
+def frame_victory_rain(mod, frame):
+    pass
+
+def setup_menu(mod):
+    """Menu principal parado (estrelas andando, mouse passando nos botões)"""
+    mod.game_state = "menu"
+
+def setup_menu_dirty(mod):
+    """Menu principal desenhado só nas regiões alteradas"""
+    mod.game_state = "menu"
+    mod.dirty_rendering = True
+
+def frame_menu(mod, frame):
+    if frame % 30 == 0:
+        # Passar o mouse por cima de um botão e sair dele
+        mod.on_mouse_move((mod.WIDTH // 2, 330) if frame % 60 == 0 else (40, 40))
+
+# Nome -> (preparo, quadro), na ordem em que rodam
+SCENARIOS = {
+    "idle_level1": (setup_idle, frame_idle),
+    "run_level2": (setup_run_level2, frame_run_level2),
+    "laser_spam": (setup_laser_spam, frame_laser_spam),
+    "particle_bursts": (setup_particle_bursts, frame_particle_bursts),
+    "victory_rain": (setup_victory_rain, frame_victory_rain),
+    "menu": (setup_menu, frame_menu),
+    "menu_dirty": (setup_menu_dirty, frame_menu)
+}
+
+def time_stats(values):
+    """
+    Mínimo, mediana, p99 e média de uma lista de tempos
+
+    Args:
+        values: Tempos em segundos (não vazia)
+
+    Returns:
+        dict: Estatísticas em milissegundos
+    """
+    ordered = sorted(value * 1000 for value in values)
+    return {
+        "min": ordered[0],
+        "median": percentile(ordered, 0.5),
+        "p99": percentile(ordered, 0.99),
+        "mean": sum(ordered) / len(ordered)
+    }
+
+def run_scenario(mod, update, name, frames, seed, gc_idle=False):
+    """
+    Rodar um cenário e medir cada quadro
+
+    Args:
+        mod: Módulo do jogo (load_game)
+        update: Função update do pgzero (load_game)
+        name: Nome do cenário em SCENARIOS
+        frames: Quadros medidos (depois do aquecimento)
+        seed: Semente do mundo e do random usado no desenho
+        gc_idle: Coletar lixo no tempo livre dos quadros (spacek_gc.py)
+
+    Returns:
+        dict: Tempos de update, draw, de cada seção (ms) e das coletas de lixo
+    """
+    setup, on_frame = SCENARIOS[name]
+    random.seed(seed)  # Efeitos de desenho (chama do jetpack) também repetem
+    mod.game_state = "playing"
+    mod.input_player = None
+    mod.setup_spacek(seed)
+    mod.sim_clock.reset()
+    mod.dirty_rendering = False
+    mod.dirty_screen = None
+    mod.idle_throttle.touch()
+    setup(mod)
+
+    profiler = SpaceKProfiler(history_size=None)
+    mod.profiler = profiler
+    mod.world.profiler = profiler
+
+    # As coletas de lixo são medidas sempre; com gc_idle elas são agendadas
+    collector = SpaceKGCScheduler(FRAME_DT)
+    collector.attach()
+    if gc_idle:
+        collector.enable()
+        mod.gc_scheduler = collector
+
+    update_times = []
+    draw_times = []
+    try:
+        for frame in range(WARMUP_FRAMES + frames):
+            if frame == WARMUP_FRAMES:
+                profiler.clear()
+                collector.clear_stats()
+                update_times.clear()
+                draw_times.clear()
+            on_frame(mod, frame)
+            start = time.perf_counter()
+            update(FRAME_DT)
+            middle = time.perf_counter()
+            mod.draw()
+            end = time.perf_counter()
+            update_times.append(middle - start)
+            draw_times.append(end - middle)
+    finally:
+        mod.profiler = None
+        mod.world.profiler = None
+        mod.gc_scheduler = None
+        mod.dirty_rendering = False
+        gc_stats = collector.stats()
+        if gc_idle:
+            collector.disable()
+        collector.detach()
+
+    return {
+        "frames": frames,
+        "final_state": mod.game_state,
+        "update": time_stats(update_times),
+        "draw": time_stats(draw_times),
+        "sections": profiler.summary(),
+        "gc": gc_stats
+    }
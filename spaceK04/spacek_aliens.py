@@ -0,0 +1,659 @@
+# ===================================================================
+# SPACEK - ALIENS VETORIZADOS (NUMPY) POR TIPO
+# ===================================================================
+# Os dados dos aliens ficam em arrays do NumPy, um array por atributo,
+# separados por comportamento:
+#
+#   - "walker": aliens padrão e robôs (gravidade + patrulha com pausas)
+#   - "jumper": saltadores (gravidade + pulos com timer)
+#   - "flyer":  voadores (onda senoidal, sem gravidade)
+#
+# Cada passo atualiza todos os aliens de um grupo com poucas operações
+# vetorizadas (patrulha, gravidade, voo, timers de animação). Só os
+# eventos raros usam laço em Python, na ordem dos índices: sorteios
+# (piscar, pausar, pular) e a busca de plataforma de quem está caindo
+# fora da plataforma onde pisou por último.
+#
+# O SpaceKAlien (spacek_world.py) continua existindo para o resto do
+# jogo, mas só guarda o grupo e o índice: ler ou escrever alien.x lê ou
+# escreve o array do grupo.
+#
+# Gravidade e velocidades são por segundo e ficam convertidas para um
+# passo da simulação em SpaceKAlienTiming. Os timers (animação, piscar,
+# pausas e pulos) contam quadros de 1/60 s: cada passo desconta
+# `frames` quadros, então os sorteios continuam os mesmos a qualquer
+# taxa de passos (ver spacek_loop.py).
+# ===================================================================
+
+import numpy as np
+from pygame import Rect
+
+from spacek_loop import TICK_RATE, frames_per_tick
+
+# Tamanho de todos os aliens
+ALIEN_WIDTH = 30
+ALIEN_HEIGHT = 30
+
+# Física e movimento
+ALIEN_GRAVITY = 1800       # px/s²
+ALIEN_PATROL_SPEED = 120   # px/s (voadores: FLYER_SPEED_FACTOR dessa velocidade)
+FLYER_SPEED_FACTOR = 0.7
+FLYER_WAVE_SPEED = 7.2     # Avanço da onda do voo em radianos/s
+FLYER_WAVE_HEIGHT = 35     # Altura da onda do voo
+WALKING_SPEED = 30         # px/s: acima disso a animação é "walking"
+
+# Espaço inicial de cada grupo (cresce dobrando quando enche)
+ALIEN_GROUP_CAPACITY = 64
+
+# Campos guardados por alien: nome -> tipo do array
+ALIEN_FIELDS = {
+    "x": np.float64, "y": np.float64,
+    "prev_x": np.float64, "prev_y": np.float64,   # Posição no passo anterior (interpolação)
+    "vx": np.float64, "vy": np.float64,
+    "speed": np.float64,                          # Velocidade da patrulha (sem sinal)
+    "direction": np.int8,                         # Sentido da patrulha (1 ou -1)
+    "start_x": np.float64,                        # Centro do território
+    "territory_size": np.int32,                   # Raio do território
+    "on_ground": np.bool_,
+    "supported": np.bool_,                        # Tem plataforma de apoio guardada
+    "support_left": np.float64, "support_right": np.float64,
+    "support_top": np.float64, "support_bottom": np.float64,
+    # Timers em quadros de 1/60 s (avançam `frames` por passo)
+    "idle_timer": np.float64, "walk_timer": np.float64, "breathing_timer": np.float64,
+    "blink_timer": np.float64, "is_blinking": np.bool_,
+    "walking": np.bool_,                          # Animação "walking" (senão "idle")
+    "animation_frame": np.int32, "animation_timer": np.float64,
+    "health": np.int32, "max_health": np.int32, "alive": np.bool_,
+    "facing": np.int8, "glow_timer": np.float64, "patrol_pause_timer": np.float64,
+    "flight_offset": np.float64, "base_y": np.float64,   # Só voadores
+    "jump_timer": np.float64,                             # Só saltadores
+    "sleeping": np.bool_, "sleep_tick": np.int64          # Longe da câmera
+}
+
+# Registro com todos os campos de um alien (aliens guardados fora da janela)
+ALIEN_RECORD = np.dtype(list(ALIEN_FIELDS.items()))
+
+# Grupo de cada tipo de alien
+ALIEN_GROUPS = {"jumper": "jumper", "flyer": "flyer"}
+DEFAULT_ALIEN_GROUP = "walker"
+
+class SpaceKAlienTiming:
+    """
+    Física dos aliens convertida para a duração de um passo
+    """
+
+    def __init__(self, tick_rate=TICK_RATE):
+        """
+        Converter as constantes por segundo
+
+        Args:
+            tick_rate: Passos da simulação por segundo
+        """
+        tick_dt = 1.0 / tick_rate
+        self.tick_rate = tick_rate
+        self.frames = frames_per_tick(tick_dt)                  # Quadros de 1/60 s por passo
+        self.gravity = ALIEN_GRAVITY * tick_dt * tick_dt       # px/passo a cada passo
+        self.patrol_speed = ALIEN_PATROL_SPEED * tick_dt       # px/passo
+        self.wave_step = FLYER_WAVE_SPEED * tick_dt            # Radianos por passo
+        self.walking_speed = WALKING_SPEED * tick_dt           # px/passo
+
+class SpaceKAlienGroup:
+    """
+    Aliens de um mesmo comportamento em arrays do NumPy
+
+    Só as `count` primeiras posições dos arrays estão em uso; handles[i]
+    é o SpaceKAlien que aponta para a posição i.
+    """
+
+    def __init__(self, kind, timing, capacity=ALIEN_GROUP_CAPACITY):
+        """
+        Inicializar grupo vazio
+
+        Args:
+            kind: "walker", "jumper" ou "flyer"
+            timing: SpaceKAlienTiming com a física por passo
+            capacity: Espaço inicial dos arrays
+        """
+        self.kind = kind
+        self.timing = timing
+        self.count = 0
+        self.handles = []
+        self.capacity = capacity
+        for name, dtype in ALIEN_FIELDS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def add(self, handle, values):
+        """
+        Adicionar um alien ao grupo
+
+        Args:
+            handle: SpaceKAlien que vai apontar para os dados
+            values: Dicionário campo -> valor inicial (os outros ficam 0)
+        """
+        if self.count == self.capacity:
+            self.grow(self.capacity * 2)
+        index = self.count
+        for name in ALIEN_FIELDS:
+            getattr(self, name)[index] = values.get(name, 0)
+        handle.group = self
+        handle.index = index
+        self.handles.append(handle)
+        self.count += 1
+
+    def copy_to(self, index, records, slot):
+        """
+        Copiar os dados de um alien para um array de registros
+
+        Args:
+            index: Posição do alien no grupo
+            records: Array do NumPy com tipo ALIEN_RECORD
+            slot: Posição de destino em records
+        """
+        record = records[slot:slot + 1]
+        for name in ALIEN_FIELDS:
+            record[name] = getattr(self, name)[index]
+
+    def grow(self, capacity):
+        """Aumentar o espaço dos arrays (os dados em uso são copiados)"""
+        for name, dtype in ALIEN_FIELDS.items():
+            array = np.zeros(capacity, dtype=dtype)
+            array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def retain(self, keep):
+        """
+        Manter só os aliens de `keep`, na ordem atual
+
+        Args:
+            keep: Conjunto de SpaceKAlien que continuam no jogo
+        """
+        kept = [i for i, handle in enumerate(self.handles) if handle in keep]
+        if len(kept) == self.count:
+            return
+        order = np.array(kept, dtype=np.int64)
+        count = len(kept)
+        for name in ALIEN_FIELDS:
+            array = getattr(self, name)
+            array[:count] = array[order]
+        self.handles = [self.handles[i] for i in kept]
+        for index, handle in enumerate(self.handles):
+            handle.index = index
+        self.count = count
+
+    def clear(self):
+        """Remover todos os aliens do grupo"""
+        self.handles = []
+        self.count = 0
+
+    # ===============================
+    # NÍVEL DE DETALHE (DORMIR / ACORDAR)
+    # ===============================
+
+    def update_sleep(self, tick, wake_left, wake_right, sleep_left, sleep_right):
+        """
+        Adormecer aliens longe da câmera e acordar os que chegaram perto
+
+        Args:
+            tick: Passo atual do mundo
+            wake_left, wake_right: Faixa X onde o território acorda o alien
+            sleep_left, sleep_right: Faixa X fora da qual ele dorme
+
+        Returns:
+            numpy.ndarray: Máscara dos aliens vivos e acordados
+
+        Um alien dormindo não é atualizado: sem gravidade, colisão,
+        animação nem sorteios. Quando acorda, a patrulha é calculada de
+        uma vez pelo tempo que passou (ver wake).
+        """
+        n = self.count
+        alive = self.alive[:n]
+        sleeping = self.sleeping[:n]
+        reach = self.territory_size[:n] + ALIEN_WIDTH
+        left = self.start_x[:n] - reach
+        right = self.start_x[:n] + reach
+
+        go_sleep = alive & ~sleeping & ((right < sleep_left) | (left > sleep_right))
+        if go_sleep.any():
+            sleeping[go_sleep] = True
+            self.sleep_tick[:n][go_sleep] = tick
+
+        wake = alive & sleeping & (right >= wake_left) & (left <= wake_right)
+        if wake.any():
+            self.wake(np.flatnonzero(wake), tick)
+        return alive & ~sleeping
+
+    def wake(self, indices, tick):
+        """
+        Acordar aliens, avançando a patrulha pelo tempo que dormiram
+
+        Args:
+            indices: Índices dos aliens que acordam
+            tick: Passo atual do mundo
+
+        A posição vem da própria patrulha: ida e volta no território na
+        velocidade da patrulha, como se eles não tivessem parado. Pausas
+        em andamento são descontadas primeiro; a altura fica onde estava
+        (voadores seguem a onda do voo) e a gravidade volta no próximo passo.
+        """
+        self.sleeping[indices] = False
+        frames = self.timing.frames
+        elapsed = (tick - self.sleep_tick[indices]) * frames   # Quadros dormindo
+        self.advance_animations(indices, elapsed)
+
+        # Pausa que estava em andamento
+        pause = self.patrol_pause_timer[indices]
+        paused = np.minimum(pause, elapsed)
+        pause = pause - paused
+        self.patrol_pause_timer[indices] = pause
+        moving = (elapsed - paused) / frames   # Passos andando
+
+        # Patrulha analítica: vai e volta entre start_x - território e
+        # start_x + território (caminho de ida e volta de 4 * território)
+        territory = self.territory_size[indices].astype(np.float64)
+        start = self.start_x[indices]
+        speed = self.speed[indices]
+        direction = self.direction[indices]
+        span = territory * 2
+        offset = np.clip(self.x[indices] - start + territory, 0, span)
+        phase = np.where(direction > 0, offset, span * 2 - offset)
+        phase = (phase + speed * moving) % np.maximum(span * 2, 1)
+        forward = phase <= span
+        patrol = (moving > 0) & (speed > 0) & (span > 0)
+        x = np.where(patrol, start - territory + np.where(forward, phase, span * 2 - phase),
+                     self.x[indices])
+        direction = np.where(patrol, np.where(forward, 1, -1), direction)
+        self.x[indices] = x
+        self.direction[indices] = direction
+        self.facing[indices] = direction
+        self.vx[indices] = np.where(pause > 0, 0.0, direction * speed)
+
+        if self.kind == "flyer":
+            offset = self.flight_offset[indices] + self.timing.wave_step * moving
+            self.flight_offset[indices] = offset
+            self.y[indices] = self.base_y[indices] + np.sin(offset) * FLYER_WAVE_HEIGHT
+        else:
+            self.vy[indices] = 0
+            if self.kind == "jumper":
+                self.jump_timer[indices] = np.maximum(0, self.jump_timer[indices] - moving * frames)
+
+        # Acordaram em outro lugar: não interpolar a partir da posição antiga
+        self.prev_x[indices] = self.x[indices]
+        self.prev_y[indices] = self.y[indices]
+
+    def advance_animations(self, indices, frames):
+        """
+        Avançar os timers de animação de vários quadros de uma vez
+
+        Args:
+            indices: Índices dos aliens
+            frames: Quadros de 1/60 s de cada um
+
+        Versão resumida de update_animations para quem acorda (sem
+        sorteios: a próxima piscada só é antecipada).
+        """
+        timer = self.animation_timer[indices] + frames
+        self.animation_frame[indices] = (self.animation_frame[indices] + timer // 31) % 8
+        self.animation_timer[indices] = timer % 31
+        self.breathing_timer[indices] = (self.breathing_timer[indices] + frames) % 101
+        self.blink_timer[indices] = np.maximum(1, self.blink_timer[indices] - frames)
+
+    # ===============================
+    # PASSO DE SIMULAÇÃO
+    # ===============================
+
+    def update_animations(self, awake, rng):
+        """
+        Atualizar timers de animação dos aliens acordados
+
+        REQUISITO ATENDIDO: "animações de sprite (andar, parado, respirando, etc.)"
+
+        Args:
+            awake: Máscara dos aliens acordados
+            rng: random.Random do mundo (próxima piscada)
+        """
+        n = self.count
+        frames = awake * self.timing.frames   # Quadros de 1/60 s deste passo
+        animation_timer = self.animation_timer[:n]
+        breathing_timer = self.breathing_timer[:n]
+        blink_timer = self.blink_timer[:n]
+        animation_timer += frames
+        breathing_timer += frames
+        blink_timer -= frames
+
+        # Andando ou parado, pela velocidade no início do passo
+        walking = np.abs(self.vx[:n]) > self.timing.walking_speed
+        self.walking[:n] = np.where(awake, walking, self.walking[:n])
+        self.walk_timer[:n] += frames * walking
+        self.idle_timer[:n] += frames * ~walking
+
+        # Ciclo de respiração (sempre ativo)
+        breathing_timer[breathing_timer > 100] = 0
+
+        # Sistema de piscar natural
+        blink = awake & (blink_timer <= 0)
+        is_blinking = self.is_blinking[:n]
+        is_blinking[awake & ~blink & (blink_timer > 480)] = False
+        if blink.any():
+            is_blinking[blink] = True
+            for index in np.flatnonzero(blink).tolist():
+                blink_timer[index] = rng.randint(200, 500)  # Próxima piscada
+
+        # Avançar frames da animação
+        advance = awake & (animation_timer > 30)
+        animation_timer[advance] = 0
+        frames = self.animation_frame[:n]
+        frames[advance] = (frames[advance] + 1) % 8
+
+    def update(self, world, awake):
+        """
+        Avançar um passo dos aliens acordados do grupo
+
+        REQUISITO ATENDIDO: "Eles se movem em seu território"
+
+        Args:
+            world: SpaceKWorld (gerador, grade de plataformas e sons)
+            awake: Máscara dos aliens vivos e acordados
+        """
+        n = self.count
+        rng = world.rng
+        timing = self.timing
+        self.update_animations(awake, rng)
+
+        # Pausa na patrulha: parado e sem física até o timer acabar
+        pause = self.patrol_pause_timer[:n]
+        paused = awake & (pause > 0)
+        pause -= paused * timing.frames
+        vx = self.vx[:n]
+        np.copyto(vx, 0.0, where=paused)
+        self.walking[:n] &= ~paused
+        moving = awake & ~paused
+        if not moving.any():
+            return
+
+        # Depois de uma pausa a patrulha continua no sentido guardado
+        direction = self.direction[:n]
+        speed = self.speed[:n]
+        np.copyto(vx, direction * speed, where=moving)
+
+        x = self.x[:n]
+        y = self.y[:n]
+        vy = self.vy[:n]
+        if self.kind == "flyer":
+            # Voador: movimento em padrão senoidal no ar
+            offset = self.flight_offset[:n]
+            offset += timing.wave_step * moving
+            np.copyto(y, self.base_y[:n] + np.sin(offset) * FLYER_WAVE_HEIGHT, where=moving)
+        else:
+            vy += timing.gravity * moving
+            if self.kind == "jumper":
+                self.on_ground[:n] &= ~moving
+            self.collide_platforms(world, moving)
+
+        if self.kind == "jumper":
+            # Pulo quando o timer acaba e o saltador está no chão
+            jump_timer = self.jump_timer[:n]
+            jump_timer -= moving * timing.frames
+            jumps = moving & (jump_timer <= 0) & self.on_ground[:n]
+            for index in np.flatnonzero(jumps).tolist():
+                vy[index] = rng.randint(-12, -8) * timing.frames   # Força do pulo (px por 1/60 s)
+                jump_timer[index] = rng.randint(40, 80)            # Próximo pulo
+                world.emit_sound("jump", x[index])         # Som de pulo do alien
+
+        # Inverter o sentido no limite do território
+        distance = x - self.start_x[:n]
+        territory = self.territory_size[:n]
+        bounce = moving & (((distance > territory) & (direction > 0)) |
+                           ((distance < -territory) & (direction < 0)))
+        if bounce.any():
+            direction[bounce] = -direction[bounce]
+            vx[bounce] = -vx[bounce]
+            if self.kind == "flyer":
+                for index in np.flatnonzero(bounce).tolist():
+                    pause[index] = rng.randint(30, 60)     # Voadores sempre pausam
+            elif self.kind == "walker":
+                for index in np.flatnonzero(bounce).tolist():
+                    if rng.randint(0, 100) < 30:           # 30% de chance de pausar
+                        pause[index] = rng.randint(60, 120)
+
+        # Direção do olhar e movimento
+        np.copyto(self.facing[:n], direction, where=moving)
+        x += vx * moving
+        y += vy * moving
+
+    def collide_platforms(self, world, moving):
+        """
+        Pousar aliens que caem sobre plataformas
+
+        Args:
+            world: SpaceKWorld (grade de plataformas e fundo do nível)
+            moving: Máscara dos aliens que se movem neste passo
+
+        Cada alien guarda a última plataforma onde pisou. Quem ainda está
+        sobre ela e pousa nela é resolvido de forma vetorizada; quem
+        continua caindo (fora dela, nunca pisou, ou no ar acima dela,
+        podendo cair em outra plataforma mais alta) procura na grade
+        espacial.
+        """
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        vy = self.vy[:n]
+        top = self.support_top[:n]
+        over = (moving & self.supported[:n] & (x + ALIEN_WIDTH > self.support_left[:n])
+                & (x < self.support_right[:n]) & (y < self.support_bottom[:n]))
+        land = over & (vy > 0) & (y + ALIEN_HEIGHT > top)
+        np.copyto(y, top - ALIEN_HEIGHT, where=land)
+        np.copyto(vy, 0.0, where=land)
+        self.on_ground[:n] |= land
+
+        # Quem pousou ficou com vy = 0 e quem está encostado na própria
+        # plataforma não cruza outra; os outros que descem (inclusive
+        # no ar acima da plataforma) podem cair em qualquer uma. Abaixo
+        # da plataforma mais baixa do nível não há onde pousar
+        resting = over & (y + ALIEN_HEIGHT >= top)
+        falling = moving & ~resting & (vy > 0) & (y < world.level_bottom)
+        if not falling.any():
+            return
+        platform_grid = world.platform_grid
+        for index in np.flatnonzero(falling).tolist():
+            alien_rect = Rect(x[index], y[index], ALIEN_WIDTH, ALIEN_HEIGHT)
+            for plat in platform_grid.query_rect(alien_rect):
+                if alien_rect.colliderect(plat):
+                    y[index] = plat.top - ALIEN_HEIGHT
+                    vy[index] = 0
+                    self.on_ground[index] = True
+                    self.supported[index] = True
+                    self.support_left[index] = plat.left
+                    self.support_right[index] = plat.right
+                    self.support_top[index] = plat.top
+                    self.support_bottom[index] = plat.bottom
+
+class SpaceKAlienStore:
+    """
+    Todos os aliens do nível, em um SpaceKAlienGroup por comportamento
+    """
+
+    def __init__(self, tick_rate=TICK_RATE):
+        """
+        Inicializar os grupos vazios
+
+        Args:
+            tick_rate: Passos da simulação por segundo
+        """
+        self.timing = SpaceKAlienTiming(tick_rate)
+        self.groups = {kind: SpaceKAlienGroup(kind, self.timing)
+                       for kind in ("walker", "jumper", "flyer")}
+        self.active = 0     # Aliens vivos atualizados no último passo
+        self.sleeping = 0   # Aliens vivos dormindo no último passo
+
+        # Aliens vivos cujo pedaço saiu da janela: um registro por alien
+        # do nível (tamanho fixo, reservado em reserve_parking)
+        self.parked = np.zeros(0, dtype=ALIEN_RECORD)
+        self.parked_mask = np.zeros(0, dtype=bool)
+
+    def set_tick_rate(self, tick_rate):
+        """
+        Trocar a taxa de passos (antes de criar os aliens do nível)
+
+        Args:
+            tick_rate: Passos da simulação por segundo
+        """
+        self.timing = SpaceKAlienTiming(tick_rate)
+        for group in self.groups.values():
+            group.timing = self.timing
+
+    def __len__(self):
+        """Número de aliens guardados"""
+        return sum(group.count for group in self.groups.values())
+
+    def add(self, handle, alien_type, values):
+        """
+        Adicionar alien no grupo do seu tipo
+
+        Args:
+            handle: SpaceKAlien que vai apontar para os dados
+            alien_type: Tipo do alien ("standard", "alien", "robot", "jumper", "flyer")
+            values: Dicionário campo -> valor inicial
+        """
+        self.groups[ALIEN_GROUPS.get(alien_type, DEFAULT_ALIEN_GROUP)].add(handle, values)
+
+    def retain(self, handles):
+        """
+        Manter só os aliens da lista (os outros saíram do nível)
+
+        Args:
+            handles: SpaceKAlien que continuam no jogo
+        """
+        keep = set(handles)
+        for group in self.groups.values():
+            group.retain(keep)
+
+    def clear(self):
+        """Remover todos os aliens"""
+        for group in self.groups.values():
+            group.clear()
+
+    # ===============================
+    # ALIENS FORA DA JANELA DO STREAMING
+    # ===============================
+
+    def reserve_parking(self, count):
+        """
+        Reservar espaço para guardar os aliens de um nível (esvazia o atual)
+
+        Args:
+            count: Número de aliens do nível
+        """
+        self.parked = np.zeros(count, dtype=ALIEN_RECORD)
+        self.parked_mask = np.zeros(count, dtype=bool)
+
+    def park(self, alien, slot):
+        """
+        Guardar os dados de um alien vivo que vai sair dos arrays
+
+        Args:
+            alien: SpaceKAlien (ainda dentro de um grupo)
+            slot: Índice do alien no nível
+        """
+        alien.group.copy_to(alien.index, self.parked, slot)
+        self.parked_mask[slot] = True
+
+    def unpark(self, slot):
+        """
+        Retirar os dados guardados de um alien
+
+        Args:
+            slot: Índice do alien no nível
+
+        Returns:
+            dict: Campo -> valor (aceito por add()), ou None se o alien
+                  não foi guardado
+        """
+        if not self.parked_mask[slot]:
+            return None
+        self.parked_mask[slot] = False
+        record = self.parked[slot]
+        return {name: record[name].item() for name in ALIEN_FIELDS}
+
+    def parking_stats(self):
+        """
+        Uso do espaço de aliens guardados
+
+        Returns:
+            dict: Aliens guardados agora, registros reservados e bytes
+        """
+        return {
+            "saved": int(np.count_nonzero(self.parked_mask)),
+            "slots": len(self.parked),
+            "bytes": self.parked.nbytes + self.parked_mask.nbytes
+        }
+
+    def save_previous(self):
+        """Guardar as posições atuais como posições do passo anterior"""
+        for group in self.groups.values():
+            n = group.count
+            group.prev_x[:n] = group.x[:n]
+            group.prev_y[:n] = group.y[:n]
+
+    def update(self, world):
+        """
+        Avançar um passo de todos os aliens
+
+        Args:
+            world: SpaceKWorld (câmera, margens de sono, gerador, plataformas)
+
+        Aliens cujo território chega perto da tela (world.enemy_wake_margin)
+        têm a simulação completa; os que ficam longe (enemy_sleep_margin)
+        dormem.
+        """
+        camera_x = world.camera_x
+        wake_left = camera_x - world.enemy_wake_margin
+        wake_right = camera_x + world.width + world.enemy_wake_margin
+        sleep_left = camera_x - world.enemy_sleep_margin
+        sleep_right = camera_x + world.width + world.enemy_sleep_margin
+        active = 0
+        sleeping = 0
+        for group in self.groups.values():
+            if group.count == 0:
+                continue
+            awake = group.update_sleep(world.tick, wake_left, wake_right, sleep_left, sleep_right)
+            group.update(world, awake)
+            awake_count = int(np.count_nonzero(awake))
+            active += awake_count
+            sleeping += int(np.count_nonzero(group.alive[:group.count])) - awake_count
+        self.active = active
+        self.sleeping = sleeping
+
+    def awake_entries(self):
+        """
+        Aliens vivos e acordados com suas posições
+
+        Returns:
+            list: Tuplas (alien, x, y), grupo a grupo
+        """
+        entries = []
+        for group in self.groups.values():
+            n = group.count
+            indices = np.flatnonzero(group.alive[:n] & ~group.sleeping[:n])
+            handles = group.handles
+            entries.extend(zip([handles[i] for i in indices.tolist()],
+                               group.x[indices].tolist(), group.y[indices].tolist()))
+        return entries
+
+    def visible(self, left, right):
+        """
+        Aliens com X dentro de uma faixa (para desenhar)
+
+        Args:
+            left, right: Faixa X em coordenadas do mundo
+
+        Returns:
+            list: SpaceKAlien na faixa, grupo a grupo
+        """
+        found = []
+        for group in self.groups.values():
+            x = group.x[:group.count]
+            handles = group.handles
+            found.extend(handles[i] for i in np.flatnonzero((x > left) & (x < right)).tolist())
+        return found
@@ -0,0 +1,385 @@
+# ===================================================================
+# SPACEK - BANCO DE SONS
+# ===================================================================
+# Carrega os efeitos sonoros sem travar a abertura do jogo:
+#
+# - Cada arquivo é decodificado uma vez só, mesmo que vários nomes
+#   apontem para ele (ex.: "click" e "powerup")
+# - A decodificação roda em uma thread em segundo plano enquanto o
+#   menu já está na tela
+# - O áudio decodificado (PCM) é guardado em disco, com o nome baseado
+#   no hash do arquivo; nas próximas execuções o mp3 não é decodificado
+#
+# Enquanto um som não fica pronto, get() devolve None e quem toca o
+# som simplesmente não toca nada.
+#
+# Os sons prontos são tocados pelo SpaceKVoicePool (final do arquivo).
+# ===================================================================
+
+import hashlib
+import os
+import threading
+import time
+
+import pygame
+
+# Pasta do cache de áudio decodificado (relativa à pasta do jogo)
+SOUND_CACHE_DIR = os.path.join(".spacek_cache", "sounds")
+
+def sound_file_hash(path):
+    """
+    Calcular hash SHA-1 do conteúdo de um arquivo
+
+    Args:
+        path: Caminho do arquivo
+
+    Returns:
+        str: Hash em hexadecimal
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as sound_file:
+        for block in iter(lambda: sound_file.read(65536), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+class SpaceKSoundBank:
+    """
+    Banco de sons com carregamento em segundo plano e cache em disco
+
+    `sounds` é o dicionário nome -> pygame.mixer.Sound dos sons que já
+    estão prontos; ele vai sendo preenchido pela thread de carregamento.
+    """
+
+    def __init__(self, sound_files, cache_dir=SOUND_CACHE_DIR, log=None):
+        """
+        Inicializar banco de sons
+
+        Args:
+            sound_files: Dicionário nome -> caminho do arquivo
+            cache_dir: Pasta do cache de PCM (None = sem cache em disco)
+            log: SpaceKLogger para mensagens (opcional)
+        """
+        self.sound_files = dict(sound_files)
+        self.cache_dir = cache_dir
+        self.log = log
+        self.sounds = {}          # nome -> Sound (só os prontos)
+        self.failed = {}          # caminho -> mensagem de erro
+        self.thread = None
+        self.done = threading.Event()
+
+        # Agrupar nomes por arquivo (cada arquivo é decodificado uma vez)
+        self.paths = {}           # caminho -> lista de nomes
+        for name, path in self.sound_files.items():
+            self.paths.setdefault(path, []).append(name)
+
+        # Estatísticas do carregamento
+        self.decoded = 0          # Arquivos decodificados do mp3
+        self.cache_hits = 0       # Arquivos lidos do cache de PCM
+        self.load_time = 0.0      # Segundos gastos carregando tudo
+
+    def start(self):
+        """Começar a carregar os sons em uma thread em segundo plano"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.load_all, name="spacek-sounds", daemon=True)
+            self.thread.start()
+
+    def wait(self, timeout=None):
+        """
+        Esperar o carregamento terminar
+
+        Args:
+            timeout: Tempo máximo em segundos (None = sem limite)
+
+        Returns:
+            bool: True se todos os sons já foram processados
+        """
+        return self.done.wait(timeout)
+
+    def is_ready(self, name):
+        """Verificar se um som já pode ser tocado"""
+        return name in self.sounds
+
+    def is_pending(self, name):
+        """Verificar se um som ainda está sendo carregado"""
+        return name in self.sound_files and name not in self.sounds and not self.done.is_set()
+
+    def get(self, name):
+        """
+        Obter um som pronto
+
+        Args:
+            name: Nome do som
+
+        Returns:
+            pygame.mixer.Sound: Som, ou None se não existe ou não está pronto
+        """
+        return self.sounds.get(name)
+
+    def load_all(self):
+        """Carregar todos os arquivos (executado pela thread)"""
+        start = time.perf_counter()
+        try:
+            for path, names in self.paths.items():
+                try:
+                    sound = self.load_sound(path)
+                except Exception as e:
+                    self.failed[path] = str(e)
+                    if self.log:
+                        self.log.warning("❌ Falha ao carregar som %s: %s", path, e)
+                    continue
+                for name in names:
+                    self.sounds[name] = sound
+                if self.log:
+                    self.log.debug("✅ Som carregado: %s", path)
+        finally:
+            self.load_time = time.perf_counter() - start
+            self.done.set()
+        if self.log:
+            self.log.info("%d de %d sons carregados em %.2f s (%d do cache)",
+                          len(self.sounds), len(self.sound_files), self.load_time, self.cache_hits)
+
+    def cache_path(self, path):
+        """
+        Caminho do arquivo de cache de PCM de um som
+
+        Args:
+            path: Caminho do arquivo de som original
+
+        Returns:
+            str: Caminho no cache, ou None se o cache está desligado
+
+        O nome inclui o formato do mixer (frequência, tamanho da amostra e
+        canais), porque o PCM decodificado depende dele.
+        """
+        if self.cache_dir is None:
+            return None
+        frequency, size, channels = pygame.mixer.get_init()
+        name = f"{sound_file_hash(path)}_{frequency}_{size}_{channels}.pcm"
+        return os.path.join(self.cache_dir, name)
+
+    def load_sound(self, path):
+        """
+        Carregar um arquivo, usando o cache de PCM quando possível
+
+        Args:
+            path: Caminho do arquivo de som
+
+        Returns:
+            pygame.mixer.Sound: Som pronto para tocar
+        """
+        cache_file = self.cache_path(path)
+        if cache_file is not None and os.path.exists(cache_file):
+            try:
+                with open(cache_file, "rb") as pcm_file:
+                    sound = pygame.mixer.Sound(buffer=pcm_file.read())
+                self.cache_hits += 1
+                return sound
+            except (OSError, pygame.error) as e:
+                if self.log:
+                    self.log.warning("Cache de som inválido %s: %s", cache_file, e)
+
+        # Sem cache: decodificar o arquivo original e guardar o PCM
+        sound = pygame.mixer.Sound(path)
+        self.decoded += 1
+        if cache_file is not None:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                temp_file = f"{cache_file}.{os.getpid()}.tmp"
+                with open(temp_file, "wb") as pcm_file:
+                    pcm_file.write(sound.get_raw())
+                os.replace(temp_file, cache_file)  # Troca atômica
+            except OSError as e:
+                if self.log:
+                    self.log.warning("Não foi possível gravar cache de som %s: %s", cache_file, e)
+        return sound
+
+    def stats(self):
+        """
+        Estatísticas do carregamento
+
+        Returns:
+            dict: Sons prontos, arquivos, decodificados, lidos do cache,
+                  falhas e tempo total
+        """
+        return {
+            "ready": len(self.sounds),
+            "names": len(self.sound_files),
+            "files": len(self.paths),
+            "decoded": self.decoded,
+            "cache_hits": self.cache_hits,
+            "failed": len(self.failed),
+            "done": self.done.is_set(),
+            "load_time": self.load_time
+        }
+
+# ===================================================================
+# VOICE POOL (CANAIS DE ÁUDIO LIMITADOS)
+# ===================================================================
+# Em lutas grandes vários aliens pulam e morrem no mesmo frame. Em vez
+# de abrir um canal do mixer para cada pedido, os sons passam por um
+# conjunto fixo de canais com regras por som:
+#
+# - max_concurrent: quantas cópias do mesmo som tocam ao mesmo tempo
+# - cooldown: tempo mínimo entre duas cópias do mesmo som
+# - priority: quando todos os canais estão ocupados, um som mais
+#   importante "rouba" o canal do som menos importante
+# - sons com posição muito longe da câmera não são tocados
+
+# Número de canais do mixer usados pelos efeitos
+VOICE_CHANNELS = 8
+
+# Distância máxima (em pixels, a partir do centro da tela) para um som
+# posicionado ser tocado
+VOICE_CULL_DISTANCE = 700
+
+# Regras por som: (prioridade, máximo simultâneo, cooldown em segundos)
+SOUND_SETTINGS = {
+    "click": (5, 1, 0.05),
+    "hurt": (5, 2, 0.10),
+    "enemy_death": (4, 3, 0.05),
+    "explosion": (4, 2, 0.10),
+    "powerup": (4, 1, 0.10),
+    "laser_hit": (3, 3, 0.04),
+    "collect": (3, 2, 0.05),
+    "laser_shoot": (2, 3, 0.05),
+    "jetpack": (2, 1, 0.10),
+    "jump": (1, 2, 0.08)
+}
+
+# Regra para sons que não estão em SOUND_SETTINGS
+DEFAULT_SOUND_SETTING = (1, 2, 0.05)
+
+class SpaceKVoicePool:
+    """
+    Conjunto fixo de canais do mixer com limites por som e prioridade
+
+    play() decide se um pedido de som toca, e em qual canal. Os
+    contadores mostram quantos pedidos foram tocados, cortados pela
+    distância, pelo cooldown ou pelo limite, e quantos roubaram canal.
+    """
+
+    def __init__(self, channel_count=VOICE_CHANNELS, settings=None,
+                 cull_distance=VOICE_CULL_DISTANCE, view_width=800):
+        """
+        Inicializar voice pool
+
+        Args:
+            channel_count: Número de canais do mixer
+            settings: Regras por som (None = SOUND_SETTINGS)
+            cull_distance: Distância máxima do centro da tela para tocar
+            view_width: Largura da tela (para achar o centro da câmera)
+        """
+        if pygame.mixer.get_num_channels() < channel_count:
+            pygame.mixer.set_num_channels(channel_count)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channel_count)]
+        self.voices = [None] * channel_count  # canal -> (nome, prioridade, início)
+        self.settings = SOUND_SETTINGS if settings is None else settings
+        self.cull_distance = cull_distance
+        self.view_width = view_width
+        self.last_played = {}                 # nome -> momento em que tocou
+
+        # Estatísticas
+        self.played = 0
+        self.culled = 0           # Longe demais da câmera
+        self.cooldown_skips = 0   # Pedido cedo demais
+        self.limit_skips = 0      # Já tocando o máximo de cópias
+        self.stolen = 0           # Canal tomado de um som menos importante
+        self.dropped = 0          # Todos os canais ocupados com sons importantes
+
+    def active_voices(self):
+        """
+        Liberar canais que já terminaram e contar vozes por som
+
+        Returns:
+            dict: nome -> número de cópias tocando agora
+        """
+        counts = {}
+        for index, voice in enumerate(self.voices):
+            if voice is None:
+                continue
+            if not self.channels[index].get_busy():
+                self.voices[index] = None
+            else:
+                counts[voice[0]] = counts.get(voice[0], 0) + 1
+        return counts
+
+    def play(self, name, sound, x=None, camera_x=0.0, now=None):
+        """
+        Tocar um som respeitando as regras do pool
+
+        Args:
+            name: Nome do som (chave de SOUND_SETTINGS)
+            sound: pygame.mixer.Sound a tocar
+            x: Posição X do som no mundo (None = sempre audível)
+            camera_x: Posição atual da câmera
+            now: Momento atual em segundos (None = relógio do sistema)
+
+        Returns:
+            pygame.mixer.Channel: Canal usado, ou None se o som não tocou
+        """
+        priority, max_concurrent, cooldown = self.settings.get(name, DEFAULT_SOUND_SETTING)
+
+        # Sons longe da câmera não são ouvidos
+        if x is not None and abs(x - (camera_x + self.view_width / 2)) > self.cull_distance:
+            self.culled += 1
+            return None
+
+        if now is None:
+            now = time.perf_counter()
+        last = self.last_played.get(name)
+        if last is not None and now - last < cooldown:
+            self.cooldown_skips += 1
+            return None
+
+        counts = self.active_voices()
+        if counts.get(name, 0) >= max_concurrent:
+            self.limit_skips += 1
+            return None
+
+        # Canal livre, ou o canal do som menos importante (o mais antigo
+        # em caso de empate) se ele for menos importante que este
+        index = None
+        victim = None
+        for i, voice in enumerate(self.voices):
+            if voice is None:
+                index = i
+                break
+            if voice[1] < priority and (victim is None or voice[1:] < self.voices[victim][1:]):
+                victim = i
+        if index is None:
+            if victim is None:
+                self.dropped += 1
+                return None
+            index = victim
+            self.stolen += 1
+
+        channel = self.channels[index]
+        channel.play(sound)
+        self.voices[index] = (name, priority, now)
+        self.last_played[name] = now
+        self.played += 1
+        return channel
+
+    def stop_all(self):
+        """Parar todos os sons do pool"""
+        for index, channel in enumerate(self.channels):
+            channel.stop()
+            self.voices[index] = None
+
+    def stats(self):
+        """
+        Estatísticas do voice pool
+
+        Returns:
+            dict: Canais, vozes ativas e contadores de pedidos
+        """
+        return {
+            "channels": len(self.channels),
+            "active": sum(self.active_voices().values()),
+            "played": self.played,
+            "culled": self.culled,
+            "cooldown_skips": self.cooldown_skips,
+            "limit_skips": self.limit_skips,
+            "stolen": self.stolen,
+            "dropped": self.dropped
+        }
@@ -0,0 +1,203 @@
+# ===================================================================
+# SPACEK - SISTEMA DE COLISÕES
+# ===================================================================
+# Estruturas auxiliares para detecção de colisões do SpaceKWorld.
+#
+# Em vez de testar cada laser contra cada alien (e cada alien contra
+# todas as plataformas), os objetos são guardados em uma grade de
+# células. Uma consulta só olha as células que a área toca, então o
+# custo depende de quantos objetos estão por perto, não do tamanho
+# do nível.
+# ===================================================================
+
+import math
+
+# Tamanho de cada célula da grade em pixels.
+# Aliens, power-ups e o astronauta têm ~30 px: com células de 60 px
+# cada entidade ocupa de 1 a 4 células e as plataformas (20 px de
+# altura) ficam em uma ou duas linhas da grade.
+SPATIAL_CELL_SIZE = 60
+
+class SpaceKSpatialHash:
+    """
+    Grade espacial uniforme (spatial hash) para consultas de colisão
+
+    Cada objeto é inserido em todas as células que sua caixa toca.
+    query() devolve os candidatos próximos de uma área, na mesma ordem
+    em que foram inseridos (assim o resultado é igual ao de percorrer
+    a lista original, só que sem olhar os objetos distantes).
+
+    O teste exato (colliderect) continua sendo feito por quem consulta.
+    """
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        """
+        Inicializar grade espacial
+
+        Args:
+            cell_size: Tamanho de cada célula em pixels
+        """
+        self.cell_size = cell_size
+        self.cells = {}        # (coluna, linha) -> lista de (ordem, objeto)
+        self.count = 0         # Número de objetos inseridos (define a ordem)
+
+    def clear(self):
+        """Remover todos os objetos da grade"""
+        self.cells.clear()
+        self.count = 0
+
+    def cell_range(self, x, y, width, height):
+        """
+        Calcular as células tocadas por uma caixa
+
+        Args:
+            x, y, width, height: Caixa em coordenadas do mundo
+
+        Returns:
+            tuple: (coluna inicial, coluna final, linha inicial, linha final)
+
+        A caixa é aumentada em 1 px de cada lado porque pygame.Rect
+        arredonda posições fracionárias para inteiros.
+        """
+        size = self.cell_size
+        return (int((x - 1) // size), int((x + width + 1) // size),
+                int((y - 1) // size), int((y + height + 1) // size))
+
+    def insert(self, item, x, y, width, height):
+        """
+        Inserir objeto em todas as células que sua caixa toca
+
+        Args:
+            item: Objeto a ser guardado (plataforma, alien, moeda...)
+            x, y, width, height: Caixa do objeto em coordenadas do mundo
+        """
+        entry = (self.count, item)
+        self.count += 1
+        cells = self.cells
+        col_start, col_end, row_start, row_end = self.cell_range(x, y, width, height)
+        for col in range(col_start, col_end + 1):
+            for row in range(row_start, row_end + 1):
+                bucket = cells.get((col, row))
+                if bucket is None:
+                    cells[(col, row)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def insert_rect(self, rect):
+        """
+        Inserir um Rect (usado para as plataformas do nível)
+
+        Args:
+            rect: pygame.Rect a ser guardado
+        """
+        self.insert(rect, rect.x, rect.y, rect.width, rect.height)
+
+    def query(self, x, y, width, height):
+        """
+        Buscar objetos próximos de uma caixa
+
+        Args:
+            x, y, width, height: Caixa de consulta em coordenadas do mundo
+
+        Returns:
+            list: Objetos candidatos, sem repetição, na ordem de inserção
+        """
+        cells = self.cells
+        found = {}
+        col_start, col_end, row_start, row_end = self.cell_range(x, y, width, height)
+        for col in range(col_start, col_end + 1):
+            for row in range(row_start, row_end + 1):
+                bucket = cells.get((col, row))
+                if bucket:
+                    for order, item in bucket:
+                        found[order] = item
+        if len(found) < 2:
+            return list(found.values())
+        return [found[order] for order in sorted(found)]
+
+    def query_rect(self, rect):
+        """
+        Buscar objetos próximos de um Rect
+
+        Args:
+            rect: pygame.Rect de consulta
+
+        Returns:
+            list: Objetos candidatos, sem repetição, na ordem de inserção
+        """
+        return self.query(rect.x, rect.y, rect.width, rect.height)
+
+# ===================================================================
+# COLISÃO CONTÍNUA (SWEPT AABB)
+# ===================================================================
+# Testar só a posição final de um objeto rápido deixa ele atravessar
+# alvos finos: um laser a 18 px/frame pula um alien de 30 px se a
+# velocidade dobrar, e uma queda a 15 px/frame pula uma plataforma de
+# 20 px. O teste contínuo calcula EM QUE MOMENTO do movimento as caixas
+# se encostam, então funciona em qualquer velocidade.
+
+def swept_aabb(x, y, width, height, dx, dy, tx, ty, twidth, theight):
+    """
+    Calcular o tempo de impacto de uma caixa em movimento contra outra parada
+
+    Args:
+        x, y, width, height: Caixa em movimento na posição inicial
+        dx, dy: Deslocamento da caixa durante o frame
+        tx, ty, twidth, theight: Caixa parada (alvo)
+
+    Returns:
+        float: Fração do movimento (0 a 1) em que as caixas passam a se
+               sobrepor (0 se já começam sobrepostas), ou None se não
+               há colisão neste frame
+
+    Encostar sem sobrepor não conta como colisão (mesma regra do
+    pygame.Rect.colliderect).
+    """
+    # Caixas já sobrepostas no início do movimento
+    if x < tx + twidth and x + width > tx and y < ty + theight and y + height > ty:
+        return 0.0
+
+    # Tempos de entrada e saída no eixo X
+    if dx > 0:
+        x_entry = (tx - (x + width)) / dx
+        x_exit = (tx + twidth - x) / dx
+    elif dx < 0:
+        x_entry = (tx + twidth - x) / dx
+        x_exit = (tx - (x + width)) / dx
+    elif x + width <= tx or x >= tx + twidth:
+        return None  # Parado em X e fora do alcance do alvo
+    else:
+        x_entry, x_exit = -math.inf, math.inf
+
+    # Tempos de entrada e saída no eixo Y
+    if dy > 0:
+        y_entry = (ty - (y + height)) / dy
+        y_exit = (ty + theight - y) / dy
+    elif dy < 0:
+        y_entry = (ty + theight - y) / dy
+        y_exit = (ty - (y + height)) / dy
+    elif y + height <= ty or y >= ty + theight:
+        return None  # Parado em Y e fora do alcance do alvo
+    else:
+        y_entry, y_exit = -math.inf, math.inf
+
+    # A sobreposição começa quando os dois eixos já entraram
+    entry = max(x_entry, y_entry)
+    exit_time = min(x_exit, y_exit)
+    if entry >= exit_time or entry < 0 or entry >= 1:
+        return None
+    return entry
+
+def swept_bounds(x, y, width, height, dx, dy):
+    """
+    Calcular a caixa que envolve todo o movimento de um frame
+
+    Args:
+        x, y, width, height: Caixa na posição inicial
+        dx, dy: Deslocamento durante o frame
+
+    Returns:
+        tuple: (x, y, width, height) cobrindo as posições inicial e final
+               (usado para consultar a grade espacial)
+    """
+    return (min(x, x + dx), min(y, y + dy), width + abs(dx), height + abs(dy))
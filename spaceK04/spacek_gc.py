@@ -0,0 +1,231 @@
+# ===================================================================
+# SPACEK - COLETA DE LIXO NO TEMPO LIVRE DO QUADRO
+# ===================================================================
+# O coletor de lixo do CPython (gc) roda sozinho quando muitos objetos
+# foram criados, no meio de qualquer quadro. Com muitas partículas,
+# lasers e textos sendo criados, essas coletas caem no meio do update()
+# ou do draw() e viram travadas de 10-20 ms.
+#
+# Com o agendador ligado (opcional):
+#
+#   - a coleta automática fica desligada (gc.disable)
+#   - no fim de cada quadro, se sobrou tempo do orçamento (ex.: 16,7 ms
+#     a 60 fps), é feita a coleta da geração pendente que couber nessa
+#     folga, pela estimativa do custo de cada geração
+#   - se a geração 0 acumular objetos demais sem folga nenhuma, ela é
+#     coletada mesmo assim (a memória não cresce sem limite)
+#   - depois de carregar um nível, os objetos que existem (nível,
+#     caches, módulos) são congelados (gc.freeze): ficam fora das
+#     coletas seguintes, que passam a olhar só os objetos novos
+#
+# Ligado ou não, o agendador mede todas as coletas (gc.callbacks):
+# quantas por geração, quanto tempo pararam o jogo e por quê.
+#
+# Uso: SPACEK_GC=idle python spaceK.py, ou F4 durante o jogo.
+# ===================================================================
+
+import gc
+import os
+from time import perf_counter
+
+# Orçamento padrão de um quadro (60 fps)
+GC_FRAME_BUDGET = 1 / 60
+
+# Folga mínima deixada livre no fim do quadro (troca de tela, eventos)
+GC_FRAME_MARGIN = 0.002
+
+# Estimativa inicial do custo (s) de coletar cada geração; depois ela
+# acompanha as coletas medidas (média móvel)
+GC_INITIAL_COST = (0.0003, 0.001, 0.005)
+GC_COST_SMOOTHING = 0.25
+
+# Geração 0 com mais de GC_FORCE_FACTOR vezes o limite do gc é coletada
+# mesmo sem folga
+GC_FORCE_FACTOR = 8
+
+# Agendador ligado desde o início (SPACEK_GC=idle)
+GC_SCHEDULER_DEFAULT = os.environ.get("SPACEK_GC", "auto").strip().lower() == "idle"
+
+class SpaceKGCScheduler:
+    """
+    Coleta de lixo feita no tempo livre dos quadros
+
+    - attach() / detach(): começar / parar de medir as coletas
+    - enable() / disable(): ligar / desligar o agendamento
+    - begin_frame() no início do update() e end_frame() no fim do draw()
+    - freeze(chave): congelar os objetos atuais quando a chave (versão
+      do nível) muda
+    """
+
+    def __init__(self, budget=GC_FRAME_BUDGET, margin=GC_FRAME_MARGIN):
+        """
+        Inicializar agendador (desligado e sem medir)
+
+        Args:
+            budget: Duração de um quadro em segundos
+            margin: Folga deixada livre no fim do quadro
+        """
+        self.budget = budget
+        self.margin = margin
+        self.enabled = False
+        self.attached = False
+        self.frame_start = None
+        self.frozen_key = None
+        self.cost = list(GC_INITIAL_COST)  # Custo estimado de cada geração (s)
+        self.reason = None                  # Motivo da coleta em andamento (None = automática)
+        self.collect_start = None
+        self.clear_stats()
+
+    def clear_stats(self):
+        """Zerar as estatísticas"""
+        self.collections = [0, 0, 0]          # Coletas por geração
+        self.pause_total = [0.0, 0.0, 0.0]    # Tempo parado por geração (s)
+        self.pause_max = [0.0, 0.0, 0.0]      # Maior parada por geração (s)
+        self.play_pause_max = 0.0             # Maior parada fora da carga de nível (s)
+        self.reasons = {"idle": 0, "forced": 0, "freeze": 0, "automatic": 0}
+        self.deferred_frames = 0              # Quadros sem folga com coleta pendente
+
+    # ===============================
+    # MEDIÇÃO
+    # ===============================
+
+    def attach(self):
+        """Começar a medir todas as coletas (gc.callbacks)"""
+        if not self.attached:
+            gc.callbacks.append(self.on_collect)
+            self.attached = True
+
+    def detach(self):
+        """Parar de medir as coletas"""
+        if self.attached:
+            gc.callbacks.remove(self.on_collect)
+            self.attached = False
+
+    def on_collect(self, phase, info):
+        """
+        Medir uma coleta (chamado pelo gc no início e no fim)
+
+        Args:
+            phase: "start" ou "stop"
+            info: Dicionário do gc com a geração coletada
+        """
+        if phase == "start":
+            self.collect_start = perf_counter()
+            return
+        if self.collect_start is None:
+            return
+        elapsed = perf_counter() - self.collect_start
+        self.collect_start = None
+        generation = info["generation"]
+        self.collections[generation] += 1
+        self.pause_total[generation] += elapsed
+        self.pause_max[generation] = max(self.pause_max[generation], elapsed)
+        reason = self.reason or "automatic"
+        self.reasons[reason] += 1
+        if reason != "freeze":
+            self.play_pause_max = max(self.play_pause_max, elapsed)
+        self.cost[generation] += (elapsed - self.cost[generation]) * GC_COST_SMOOTHING
+
+    # ===============================
+    # AGENDAMENTO
+    # ===============================
+
+    def enable(self):
+        """Ligar o agendamento (a coleta automática fica desligada)"""
+        self.attach()
+        gc.disable()
+        self.enabled = True
+
+    def disable(self):
+        """Desligar o agendamento e devolver a coleta ao automático"""
+        gc.enable()
+        gc.unfreeze()
+        self.enabled = False
+        self.frozen_key = None
+
+    def begin_frame(self):
+        """Marcar o início do trabalho do quadro (início do update)"""
+        self.frame_start = perf_counter()
+
+    def end_frame(self):
+        """
+        Fim do trabalho do quadro (fim do draw): coletar se houver folga
+
+        Returns:
+            int: Geração coletada (-1 = nenhuma)
+        """
+        if not self.enabled or self.frame_start is None:
+            return -1
+        slack = self.budget - (perf_counter() - self.frame_start) - self.margin
+        self.frame_start = None
+
+        counts = gc.get_count()
+        thresholds = gc.get_threshold()
+        pending = [generation for generation in (2, 1, 0)
+                   if counts[generation] >= thresholds[generation]]
+        if not pending:
+            return -1
+
+        # A geração pendente mais velha que couber na folga
+        for generation in pending:
+            if self.cost[generation] <= slack:
+                self.collect(generation, "idle")
+                return generation
+
+        # Sem folga: só a geração 0, e só se ela já acumulou demais
+        if counts[0] >= thresholds[0] * GC_FORCE_FACTOR:
+            self.collect(0, "forced")
+            return 0
+        self.deferred_frames += 1
+        return -1
+
+    def collect(self, generation, reason):
+        """
+        Coletar uma geração agora
+
+        Args:
+            generation: 0, 1 ou 2
+            reason: Motivo registrado nas estatísticas
+        """
+        self.reason = reason
+        try:
+            gc.collect(generation)
+        finally:
+            self.reason = None
+
+    def freeze(self, key):
+        """
+        Congelar os objetos atuais depois de carregar um nível
+
+        Args:
+            key: Identificação do nível carregado (ex.: level_version);
+                 nada é feito se for a mesma da última vez
+
+        O lixo é coletado antes (uma coleta completa, junto com a carga do
+        nível) para não congelar objetos que já iam embora.
+        """
+        if not self.enabled or key == self.frozen_key:
+            return
+        self.collect(2, "freeze")
+        gc.freeze()
+        self.frozen_key = key
+
+    def stats(self):
+        """
+        Estatísticas das coletas medidas
+
+        Returns:
+            dict: Coletas e paradas (ms) por geração, maior parada fora da
+                  carga de nível, coletas por motivo, quadros adiados e
+                  objetos congelados
+        """
+        return {
+            "enabled": self.enabled,
+            "collections": list(self.collections),
+            "pause_ms_total": [pause * 1000 for pause in self.pause_total],
+            "pause_ms_max": [pause * 1000 for pause in self.pause_max],
+            "play_pause_ms_max": self.play_pause_max * 1000,
+            "reasons": dict(self.reasons),
+            "deferred_frames": self.deferred_frames,
+            "frozen": gc.get_freeze_count()
+        }
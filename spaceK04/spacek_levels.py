@@ -0,0 +1,469 @@
+# ===================================================================
+# SPACEK - NÍVEIS EM ARQUIVO (FORMATO JSON + CACHE BINÁRIO)
+# ===================================================================
+# Cada nível fica em um arquivo levels/levelN.json:
+#
+#   {"version": 1, "name": "ESTAÇÃO ESPACIAL", "end_x": 2400,
+#    "platforms": [[x, y, largura, altura], ...],
+#    "enemies":   [[x, y, tipo, território], ...],
+#    "powerups":  [[x, y, tipo], ...],
+#    "coins":     [[x, y], ...]}
+#
+# Na primeira carga o JSON é "compilado" para arrays do NumPy (um
+# array por atributo) junto com o índice espacial das plataformas já
+# montado, e gravado em .spacek_cache/levels/. Nas próximas cargas o
+# arquivo binário é lido direto, sem interpretar texto nem montar a
+# grade de colisão objeto por objeto. Se o JSON mudar, o hash do
+# arquivo muda e o cache é refeito.
+#
+# O nível compilado também é dividido em pedaços (chunks) horizontais
+# de STREAM_CHUNK_WIDTH pixels, com a lista de aliens, power-ups e
+# moedas de cada pedaço, para o streaming do nível (spacek_stream.py).
+# ===================================================================
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from spacek_collision import SpaceKSpatialHash, SPATIAL_CELL_SIZE
+
+# Versão do formato dos arquivos de nível (JSON) e do cache binário
+LEVEL_FORMAT_VERSION = 1
+LEVEL_CACHE_VERSION = 2
+
+# Largura dos pedaços do nível usados no streaming
+STREAM_CHUNK_WIDTH = 800
+
+# Pasta dos níveis e do cache compilado (dentro da pasta do jogo, de
+# qualquer pasta que o jogo seja aberto)
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+LEVEL_DIR = os.path.join(GAME_DIR, "levels")
+LEVEL_CACHE_DIR = os.path.join(GAME_DIR, ".spacek_cache", "levels")
+
+# Tipos guardados como números nos arrays (índice na tupla)
+ENEMY_TYPES = ("standard", "alien", "jumper", "flyer", "robot")
+POWERUP_TYPES = ("energy", "oxygen", "life", "jetpack", "shield", "speed")
+
+def level_path(level, level_dir=LEVEL_DIR):
+    """
+    Caminho do arquivo JSON de um nível
+
+    Args:
+        level: Número do nível
+        level_dir: Pasta dos níveis
+
+    Returns:
+        str: Caminho de levelN.json
+    """
+    return os.path.join(level_dir, f"level{level}.json")
+
+def type_codes(names, table, kind):
+    """
+    Converter nomes de tipo em códigos numéricos
+
+    Args:
+        names: Nomes lidos do arquivo
+        table: Tupla de nomes válidos (ENEMY_TYPES ou POWERUP_TYPES)
+        kind: Nome do campo (para a mensagem de erro)
+
+    Returns:
+        numpy.ndarray: Código de cada nome (uint8)
+
+    Raises:
+        ValueError: Se algum nome não existe na tabela
+    """
+    codes = []
+    for name in names:
+        if name not in table:
+            raise ValueError(f"Tipo de {kind} desconhecido: {name!r}")
+        codes.append(table.index(name))
+    return np.array(codes, dtype=np.uint8)
+
+def int_columns(rows, columns, kind):
+    """
+    Converter linhas [x, y, ...] em array de inteiros
+
+    Args:
+        rows: Lista de linhas do arquivo
+        columns: Número de colunas numéricas no início de cada linha
+        kind: Nome do campo (para a mensagem de erro)
+
+    Returns:
+        numpy.ndarray: Array (linhas, columns) de int32
+
+    Raises:
+        ValueError: Se alguma linha tem menos colunas que o esperado
+    """
+    if any(len(row) < columns for row in rows):
+        raise ValueError(f"Linha de {kind} incompleta (esperado {columns} números)")
+    return np.array([row[:columns] for row in rows], dtype=np.int32).reshape(len(rows), columns)
+
+def chunk_index(xs, chunk_width, chunk_count):
+    """
+    Agrupar entidades pelo pedaço do nível onde começam
+
+    Args:
+        xs: Posição X de cada entidade (array)
+        chunk_width: Largura dos pedaços
+        chunk_count: Número de pedaços do nível
+
+    Returns:
+        tuple: (offsets, order) - os índices das entidades do pedaço c são
+               order[offsets[c]:offsets[c + 1]], em ordem crescente
+    """
+    chunks = np.clip(xs // chunk_width, 0, chunk_count - 1)
+    order = np.argsort(chunks, kind="stable").astype(np.int32)
+    offsets = np.zeros(chunk_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(chunks, minlength=chunk_count), out=offsets[1:])
+    return offsets, order
+
+class SpaceKLevelData:
+    """
+    Nível compilado: arrays do NumPy prontos para o SpaceKWorld
+
+    Atributos:
+    - platforms: (n, 4) int32 com x, y, largura, altura
+    - enemies: (n, 3) int32 com x, y, território; enemy_types (códigos)
+    - powerups: (n, 2) int32 com x, y; powerup_types (códigos)
+    - coins: (n, 2) int32 com x, y
+    - end_x: posição X que termina o nível
+    - grid_*: índice espacial das plataformas (ver build_platform_index)
+    - *_offsets, *_order: entidades de cada pedaço (ver build_chunk_index)
+    """
+
+    # Arrays gravados no cache binário: dados do nível e índices montados
+    DATA_ARRAYS = ("platforms", "enemies", "enemy_types", "powerups", "powerup_types", "coins")
+    INDEX_ARRAYS = ("grid_cols", "grid_rows", "grid_offsets", "grid_items",
+                    "enemy_offsets", "enemy_order", "powerup_offsets", "powerup_order",
+                    "coin_offsets", "coin_order")
+
+    # Tipos de entidade divididos em pedaços -> prefixo dos arrays
+    CHUNK_KINDS = {"enemies": "enemy", "powerups": "powerup", "coins": "coin"}
+
+    def __init__(self, name, end_x, platforms, enemies, enemy_types, powerups, powerup_types,
+                 coins, cell_size=SPATIAL_CELL_SIZE, chunk_width=STREAM_CHUNK_WIDTH):
+        """
+        Inicializar nível compilado (os índices são montados depois)
+
+        Args:
+            name: Nome do nível
+            end_x: Posição X que termina o nível
+            platforms, enemies, enemy_types, powerups, powerup_types, coins: Arrays
+            cell_size: Tamanho das células do índice espacial
+            chunk_width: Largura dos pedaços do streaming
+        """
+        self.name = name
+        self.end_x = end_x
+        self.platforms = platforms
+        self.enemies = enemies
+        self.enemy_types = enemy_types
+        self.powerups = powerups
+        self.powerup_types = powerup_types
+        self.coins = coins
+        self.cell_size = cell_size
+        self.chunk_width = chunk_width
+        self.grid_cols = self.grid_rows = self.grid_offsets = self.grid_items = None
+        self.enemy_offsets = self.enemy_order = None
+        self.powerup_offsets = self.powerup_order = None
+        self.coin_offsets = self.coin_order = None
+        self.update_bounds()
+
+    def update_bounds(self):
+        """
+        Calcular medidas do nível a partir dos arrays
+
+        - chunk_count: pedaços até o fim do nível ou da última entidade
+        - top, bottom: faixa vertical ocupada pelas plataformas
+        - enemy_reach: maior território de alien (o quanto um alien pode
+          se afastar do pedaço onde começa)
+        """
+        right = self.end_x
+        if len(self.platforms):
+            right = max(right, int((self.platforms[:, 0] + self.platforms[:, 2]).max()))
+            self.top = int(self.platforms[:, 1].min())
+            self.bottom = int((self.platforms[:, 1] + self.platforms[:, 3]).max())
+        else:
+            self.top = self.bottom = 0
+        for points in (self.enemies, self.powerups, self.coins):
+            if len(points):
+                right = max(right, int(points[:, 0].max()))
+        self.chunk_count = right // self.chunk_width + 1
+        self.enemy_reach = int(self.enemies[:, 2].max()) if len(self.enemies) else 0
+
+    def entity_count(self):
+        """Número total de entidades do nível"""
+        return len(self.platforms) + len(self.enemies) + len(self.powerups) + len(self.coins)
+
+    def build_platform_index(self):
+        """
+        Montar o índice espacial das plataformas em formato compacto
+
+        Cada célula ocupada da grade vira uma entrada: coluna (grid_cols),
+        linha (grid_rows) e o trecho grid_items[grid_offsets[i]:grid_offsets[i + 1]]
+        com os índices das plataformas naquela célula, em ordem.
+        As células são as mesmas de SpaceKSpatialHash.insert.
+        """
+        grid = SpaceKSpatialHash(self.cell_size)
+        for index, (x, y, width, height) in enumerate(self.platforms.tolist()):
+            grid.insert(index, x, y, width, height)
+        keys = sorted(grid.cells)
+        self.grid_cols = np.array([col for col, _ in keys], dtype=np.int32)
+        self.grid_rows = np.array([row for _, row in keys], dtype=np.int32)
+        sizes = [len(grid.cells[key]) for key in keys]
+        self.grid_offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=self.grid_offsets[1:])
+        self.grid_items = np.array([index for key in keys for _, index in grid.cells[key]],
+                                   dtype=np.int32)
+
+    def build_chunk_index(self):
+        """Montar a lista de aliens, power-ups e moedas de cada pedaço"""
+        for kind, prefix in self.CHUNK_KINDS.items():
+            offsets, order = chunk_index(getattr(self, kind)[:, 0], self.chunk_width,
+                                         self.chunk_count)
+            setattr(self, f"{prefix}_offsets", offsets)
+            setattr(self, f"{prefix}_order", order)
+
+    def chunk_items(self, kind, chunk):
+        """
+        Índices das entidades que começam em um pedaço
+
+        Args:
+            kind: "enemies", "powerups" ou "coins"
+            chunk: Índice do pedaço
+
+        Returns:
+            list: Índices (nos arrays do tipo), em ordem crescente
+        """
+        prefix = self.CHUNK_KINDS[kind]
+        offsets = getattr(self, f"{prefix}_offsets")
+        return getattr(self, f"{prefix}_order")[offsets[chunk]:offsets[chunk + 1]].tolist()
+
+    def cell_span(self, left, right):
+        """
+        Trecho do índice espacial com as colunas entre left e right
+
+        Args:
+            left, right: Faixa X em coordenadas do mundo (None = nível todo)
+
+        Returns:
+            tuple: (primeira célula, célula depois da última) - as células
+                   ficam ordenadas por coluna, então a faixa é contínua
+        """
+        if left is None:
+            return 0, len(self.grid_cols)
+        return (int(np.searchsorted(self.grid_cols, left // self.cell_size, "left")),
+                int(np.searchsorted(self.grid_cols, right // self.cell_size, "right")))
+
+    def platform_indices(self, left=None, right=None):
+        """
+        Plataformas que tocam uma faixa X do nível
+
+        Args:
+            left, right: Faixa X em coordenadas do mundo (None = nível todo)
+
+        Returns:
+            list: Índices das plataformas, em ordem crescente
+        """
+        first, last = self.cell_span(left, right)
+        offsets = self.grid_offsets
+        return np.unique(self.grid_items[offsets[first]:offsets[last]]).tolist()
+
+    def fill_platform_grid(self, grid, platforms, left=None, right=None):
+        """
+        Preencher uma SpaceKSpatialHash com o índice já montado
+
+        Args:
+            grid: SpaceKSpatialHash de destino (é limpa antes)
+            platforms: Rect de cada plataforma, indexado pelo índice no nível
+                       (lista ou dicionário com pelo menos as da faixa)
+            left, right: Só as colunas desta faixa X (None = nível todo)
+        """
+        grid.clear()
+        grid.cell_size = self.cell_size
+        first, last = self.cell_span(left, right)
+        offsets = self.grid_offsets[first:last + 1].tolist()
+        base = offsets[0]
+        items = self.grid_items[base:offsets[-1]].tolist()
+        entries = [(index, platforms[index]) for index in items]
+        grid.cells = {(col, row): entries[offsets[i] - base:offsets[i + 1] - base]
+                      for i, (col, row) in enumerate(zip(self.grid_cols[first:last].tolist(),
+                                                         self.grid_rows[first:last].tolist()))}
+        grid.count = len(self.platforms)
+
+    def save(self, path):
+        """
+        Gravar nível compilado (arquivo .npz sem compressão)
+
+        Args:
+            path: Caminho do arquivo
+
+        A gravação é feita em arquivo temporário e depois renomeada,
+        para outro processo nunca ler um cache pela metade.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as cache_file:
+            np.savez(cache_file, version=np.array(LEVEL_CACHE_VERSION),
+                     name=np.array(self.name), end_x=np.array(self.end_x),
+                     cell_size=np.array(self.cell_size), chunk_width=np.array(self.chunk_width),
+                     **{key: getattr(self, key) for key in self.DATA_ARRAYS + self.INDEX_ARRAYS})
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Ler nível compilado gravado com save()
+
+        Args:
+            path: Caminho do arquivo
+
+        Returns:
+            SpaceKLevelData: Nível com o índice espacial pronto
+
+        Raises:
+            ValueError: Se a versão do arquivo não é a atual
+        """
+        with np.load(path) as data:
+            if int(data["version"]) != LEVEL_CACHE_VERSION:
+                raise ValueError(f"Versão de nível compilado não suportada: {int(data['version'])}")
+            level = cls(str(data["name"]), int(data["end_x"]),
+                        *(data[key] for key in cls.DATA_ARRAYS),
+                        int(data["cell_size"]), int(data["chunk_width"]))
+            for key in cls.INDEX_ARRAYS:
+                setattr(level, key, data[key])
+        return level
+
+def compile_level(source, cell_size=SPATIAL_CELL_SIZE, chunk_width=STREAM_CHUNK_WIDTH):
+    """
+    Compilar a descrição de um nível (JSON já lido) em SpaceKLevelData
+
+    Args:
+        source: Dicionário no formato de levels/levelN.json
+        cell_size: Tamanho das células do índice espacial
+        chunk_width: Largura dos pedaços do streaming
+
+    Returns:
+        SpaceKLevelData: Nível compilado com índice espacial e pedaços
+
+    Raises:
+        ValueError: Se a versão ou algum campo do nível é inválido
+    """
+    if source.get("version") != LEVEL_FORMAT_VERSION:
+        raise ValueError(f"Versão de nível não suportada: {source.get('version')}")
+    if "end_x" not in source:
+        raise ValueError("Nível sem marcador de fim (end_x)")
+
+    enemies = source.get("enemies", [])
+    powerups = source.get("powerups", [])
+    level = SpaceKLevelData(
+        source.get("name", ""), int(source["end_x"]),
+        int_columns(source.get("platforms", []), 4, "plataforma"),
+        int_columns([[x, y, territory] for x, y, _, territory in enemies], 3, "inimigo"),
+        type_codes([row[2] for row in enemies], ENEMY_TYPES, "inimigo"),
+        int_columns(powerups, 2, "power-up"),
+        type_codes([row[2] for row in powerups], POWERUP_TYPES, "power-up"),
+        int_columns(source.get("coins", []), 2, "moeda"),
+        cell_size, chunk_width)
+    level.build_platform_index()
+    level.build_chunk_index()
+    return level
+
+class SpaceKLevelLoader:
+    """
+    Carregador de níveis com cache binário em disco e em memória
+
+    get(nível) devolve o SpaceKLevelData do nível: da memória, do cache
+    compilado em disco (se o JSON não mudou) ou compilando o JSON.
+    """
+
+    def __init__(self, level_dir=LEVEL_DIR, cache_dir=LEVEL_CACHE_DIR):
+        """
+        Inicializar carregador
+
+        Args:
+            level_dir: Pasta com os arquivos levelN.json
+            cache_dir: Pasta do cache compilado (None = sem cache em disco)
+        """
+        self.level_dir = level_dir
+        self.cache_dir = cache_dir
+        self.levels = {}       # nível -> SpaceKLevelData já carregado
+        self.compiled = 0      # Níveis compilados a partir do JSON
+        self.cache_hits = 0    # Níveis lidos do cache binário
+        self.total = None      # Número de níveis (calculado na primeira consulta)
+
+    def has_level(self, level):
+        """Verificar se existe arquivo para o nível"""
+        return level in self.levels or os.path.exists(level_path(level, self.level_dir))
+
+    def level_count(self):
+        """
+        Contar os níveis do jogo (level1.json, level2.json, ... sem falhas)
+
+        Returns:
+            int: Número do último nível alcançável em sequência
+
+        A pasta é consultada só na primeira chamada (o HUD pergunta a
+        cada quadro).
+        """
+        if self.total is None:
+            total = 0
+            while self.has_level(total + 1):
+                total += 1
+            self.total = total
+        return self.total
+
+    def cache_path(self, source_bytes):
+        """
+        Caminho do cache compilado de um arquivo de nível
+
+        Args:
+            source_bytes: Conteúdo do JSON
+
+        Returns:
+            str: Caminho do .npz (nome = hash do conteúdo + versão do cache)
+        """
+        digest = hashlib.sha1(source_bytes).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}_v{LEVEL_CACHE_VERSION}.npz")
+
+    def get(self, level):
+        """
+        Obter um nível compilado
+
+        Args:
+            level: Número do nível
+
+        Returns:
+            SpaceKLevelData: Nível pronto para SpaceKWorld.load_level
+
+        Raises:
+            OSError: Se o arquivo do nível não existe
+            ValueError: Se o arquivo do nível é inválido
+        """
+        data = self.levels.get(level)
+        if data is not None:
+            return data
+
+        with open(level_path(level, self.level_dir), "rb") as level_file:
+            source_bytes = level_file.read()
+
+        cache_path = self.cache_path(source_bytes) if self.cache_dir else None
+        if cache_path is not None and os.path.exists(cache_path):
+            try:
+                data = SpaceKLevelData.load(cache_path)
+                self.cache_hits += 1
+            except (OSError, ValueError, KeyError):
+                data = None  # Cache corrompido ou antigo: compilar de novo
+
+        if data is None:
+            data = compile_level(json.loads(source_bytes.decode("utf-8")))
+            self.compiled += 1
+            if cache_path is not None:
+                try:
+                    data.save(cache_path)
+                except OSError:
+                    pass  # Sem cache em disco o nível ainda funciona
+
+        self.levels[level] = data
+        return data
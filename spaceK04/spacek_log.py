@@ -0,0 +1,168 @@
+# ===================================================================
+# SPACEK - SISTEMA DE LOG
+# ===================================================================
+# Mensagens de diagnóstico com níveis (debug, info, warning, error).
+#
+# Mensagens de um nível desligado são descartadas ANTES de montar o
+# texto: os argumentos só são formatados (estilo "%s") se a mensagem
+# for realmente escrita. Assim chamadas no meio do jogo (ex.: a cada
+# som tocado) não custam nada quando o nível está desligado.
+#
+# Além disso cada logger guarda os últimos eventos em um buffer
+# circular (sem formatar nada), para consulta quando algo der errado.
+#
+# O nível padrão pode ser trocado pela variável de ambiente SPACEK_LOG
+# (ex.: SPACEK_LOG=debug python -m pgzero spaceK.py).
+# ===================================================================
+
+import os
+import sys
+import time
+from collections import deque
+
+# Níveis de log (maior = mais importante)
+LOG_DEBUG = 10
+LOG_INFO = 20
+LOG_WARNING = 30
+LOG_ERROR = 40
+LOG_OFF = 100
+
+LOG_LEVELS = {
+    "debug": LOG_DEBUG,
+    "info": LOG_INFO,
+    "warning": LOG_WARNING,
+    "error": LOG_ERROR,
+    "off": LOG_OFF
+}
+
+LOG_LEVEL_NAMES = {value: name.upper() for name, value in LOG_LEVELS.items()}
+
+# Quantos eventos cada logger guarda no buffer circular
+LOG_HISTORY_SIZE = 64
+
+def parse_log_level(level):
+    """
+    Converter nome ou número em nível de log
+
+    Args:
+        level: Número do nível ou nome ("debug", "info", ...)
+
+    Returns:
+        int: Nível de log (nomes desconhecidos viram LOG_INFO)
+    """
+    if isinstance(level, str):
+        return LOG_LEVELS.get(level.strip().lower(), LOG_INFO)
+    return int(level)
+
+# Nível usado por loggers criados sem nível explícito
+DEFAULT_LOG_LEVEL = parse_log_level(os.environ.get("SPACEK_LOG", "info"))
+
+class SpaceKLogger:
+    """
+    Logger simples com níveis e histórico de eventos
+
+    - debug/info/warning/error(mensagem, *args): escreve a mensagem se
+      o nível estiver ligado; os args só são formatados nesse caso
+    - record(evento, **campos): guarda um evento estruturado no buffer
+      circular (sempre, sem formatar texto)
+    - recent(): devolve os últimos eventos guardados
+    """
+
+    def __init__(self, name, level=None, stream=None, history_size=LOG_HISTORY_SIZE):
+        """
+        Inicializar logger
+
+        Args:
+            name: Nome mostrado no início de cada mensagem (ex.: "audio")
+            level: Nível mínimo escrito (None = DEFAULT_LOG_LEVEL)
+            stream: Arquivo de saída (None = sys.stdout no momento da escrita)
+            history_size: Número de eventos guardados no buffer circular
+        """
+        self.name = name
+        self.level = DEFAULT_LOG_LEVEL if level is None else parse_log_level(level)
+        self.stream = stream
+        self.history = deque(maxlen=history_size)
+
+    def set_level(self, level):
+        """
+        Trocar o nível mínimo de log
+
+        Args:
+            level: Número do nível ou nome ("debug", "info", ...)
+        """
+        self.level = parse_log_level(level)
+
+    def is_enabled(self, level):
+        """
+        Verificar se mensagens de um nível serão escritas
+
+        Args:
+            level: Nível a verificar
+
+        Returns:
+            bool: True se o nível está ligado
+        """
+        return level >= self.level
+
+    def log(self, level, message, *args):
+        """
+        Escrever mensagem se o nível estiver ligado
+
+        Args:
+            level: Nível da mensagem
+            message: Texto (pode ter "%s" para os args)
+            *args: Valores formatados na mensagem (só se for escrita)
+        """
+        if level < self.level:
+            return
+        if args:
+            message = message % args
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(f"[{self.name}] {LOG_LEVEL_NAMES.get(level, level)}: {message}\n")
+
+    def debug(self, message, *args):
+        """Mensagem de depuração (detalhes do dia a dia)"""
+        if LOG_DEBUG >= self.level:
+            self.log(LOG_DEBUG, message, *args)
+
+    def info(self, message, *args):
+        """Mensagem informativa"""
+        if LOG_INFO >= self.level:
+            self.log(LOG_INFO, message, *args)
+
+    def warning(self, message, *args):
+        """Aviso (algo não saiu como esperado, mas o jogo continua)"""
+        if LOG_WARNING >= self.level:
+            self.log(LOG_WARNING, message, *args)
+
+    def error(self, message, *args):
+        """Erro"""
+        if LOG_ERROR >= self.level:
+            self.log(LOG_ERROR, message, *args)
+
+    def record(self, event, **fields):
+        """
+        Guardar evento estruturado no buffer circular
+
+        Args:
+            event: Nome do evento (ex.: "play", "missing")
+            **fields: Dados do evento (ex.: sound="jump")
+
+        O evento mais antigo é descartado quando o buffer está cheio.
+        """
+        self.history.append((time.perf_counter(), event, fields))
+
+    def recent(self, count=None):
+        """
+        Obter os últimos eventos guardados
+
+        Args:
+            count: Quantos eventos devolver (None = todos)
+
+        Returns:
+            list: Tuplas (tempo, evento, campos), do mais antigo ao mais novo
+        """
+        events = list(self.history)
+        if count is not None:
+            events = events[-count:] if count > 0 else []
+        return events
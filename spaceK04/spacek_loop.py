@@ -0,0 +1,197 @@
+# ===================================================================
+# SPACEK - LAÇO DE PASSO FIXO
+# ===================================================================
+# Se cada quadro desenhado fosse um passo da simulação, um computador
+# lento (ex.: 40 fps) deixaria o jogo todo em câmera lenta.
+#
+# Com o passo fixo a simulação anda sempre tick_rate passos por
+# segundo: o tempo real de cada quadro vai para um acumulador e são
+# executados quantos passos couberem nele (zero, um ou vários). O
+# que sobra vira a fração `alpha`, usada pela tela para interpolar as
+# posições entre o passo anterior e o atual.
+#
+# A taxa de passos é independente dos fps da tela e pode ser trocada:
+# as constantes do SpaceKWorld são por segundo (px/s, px/s², % por
+# segundo, durações em segundos) e são convertidas para a duração de um
+# passo (tick_dt) quando o mundo é criado. Frações aplicadas a cada
+# passo (atrito, suavização da câmera) e os timers das animações contam
+# quadros de 1/REFERENCE_FRAME_RATE s. A 60 passos por segundo as
+# conversões dão exatamente os valores por passo de antes, então os
+# hashes do spacek_runner.py não mudam.
+#
+# Uso: SPACEK_TICK_RATE=<passos por segundo> python spaceK.py
+# ===================================================================
+
+import os
+
+# Passos da simulação por segundo (padrão)
+TICK_RATE_DEFAULT = 60
+
+# Quadros por segundo em que as frações por passo e os timers de
+# animação foram medidos
+REFERENCE_FRAME_RATE = 60
+
+# Máximo de passos por quadro: se o computador ficar muito para trás,
+# o tempo excedente é descartado em vez de travar o jogo tentando
+# alcançar ("espiral da morte")
+MAX_TICKS_PER_FRAME = 5
+
+def parse_tick_rate(value):
+    """
+    Converter o valor de SPACEK_TICK_RATE em passos por segundo
+
+    Args:
+        value: Texto da variável de ambiente (None = padrão)
+
+    Returns:
+        int: Passos da simulação por segundo
+    """
+    if value is None or not value.strip():
+        return TICK_RATE_DEFAULT
+    try:
+        rate = int(value)
+    except ValueError:
+        return TICK_RATE_DEFAULT
+    return rate if rate > 0 else TICK_RATE_DEFAULT
+
+TICK_RATE = parse_tick_rate(os.environ.get("SPACEK_TICK_RATE"))
+
+# ===================================================================
+# CONVERSÃO DAS CONSTANTES PARA UM PASSO
+# ===================================================================
+
+def frames_per_tick(tick_dt):
+    """
+    Quadros de 1/REFERENCE_FRAME_RATE s que cabem em um passo
+
+    Args:
+        tick_dt: Duração de um passo em segundos
+
+    Returns:
+        float: 1.0 a 60 passos por segundo, 2.0 a 30...
+    """
+    return REFERENCE_FRAME_RATE * tick_dt
+
+def ticks_for(seconds, tick_rate):
+    """
+    Número de passos de uma duração
+
+    Args:
+        seconds: Duração em segundos
+        tick_rate: Passos da simulação por segundo
+
+    Returns:
+        int: Passos (pelo menos 1)
+    """
+    return max(1, round(seconds * tick_rate))
+
+def keep_per_tick(keep, tick_dt):
+    """
+    Fator aplicado a cada passo para um fator por quadro (atrito)
+
+    Args:
+        keep: Fração mantida a cada quadro de 1/REFERENCE_FRAME_RATE s
+        tick_dt: Duração de um passo em segundos
+
+    Returns:
+        float: Fração mantida a cada passo
+    """
+    return keep ** frames_per_tick(tick_dt)
+
+def blend_per_tick(fraction, tick_dt):
+    """
+    Fração do caminho percorrida a cada passo (suavização da câmera)
+
+    Args:
+        fraction: Fração percorrida a cada quadro de 1/REFERENCE_FRAME_RATE s
+        tick_dt: Duração de um passo em segundos
+
+    Returns:
+        float: 1 - (1 - fraction) ** quadros por passo (a própria
+               fraction quando o passo dura um quadro)
+    """
+    frames = frames_per_tick(tick_dt)
+    if frames == 1:
+        return fraction
+    return 1 - (1 - fraction) ** frames
+
+class SpaceKFixedStep:
+    """
+    Acumulador de tempo para simulação em passo fixo
+
+    A cada quadro chame advance(dt) e execute o número de passos
+    devolvido; depois use `alpha` (0 a 1) para interpolar o desenho.
+    """
+
+    def __init__(self, tick_rate=TICK_RATE, max_ticks=MAX_TICKS_PER_FRAME):
+        """
+        Inicializar acumulador
+
+        Args:
+            tick_rate: Passos da simulação por segundo
+            max_ticks: Máximo de passos executados em um quadro
+        """
+        self.set_tick_rate(tick_rate)
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0           # Tempo ainda não simulado
+        self.alpha = 0.0                 # Fração de passo para interpolação
+        self.ticks = 0                   # Total de passos executados
+        self.frames = 0                  # Total de quadros
+        self.dropped_time = 0.0          # Tempo descartado por atraso
+
+    def set_tick_rate(self, tick_rate):
+        """
+        Trocar a taxa de passos (ex.: reproduzir uma gravação feita em outra taxa)
+
+        Args:
+            tick_rate: Passos da simulação por segundo
+        """
+        self.tick_rate = tick_rate
+        self.tick_dt = 1.0 / tick_rate   # Duração de um passo em segundos
+
+    def reset(self):
+        """Zerar o acumulador (ex.: ao começar uma partida)"""
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def advance(self, dt):
+        """
+        Somar o tempo do quadro e calcular quantos passos executar
+
+        Args:
+            dt: Tempo real do quadro em segundos
+
+        Returns:
+            int: Número de passos da simulação a executar neste quadro
+        """
+        self.frames += 1
+        self.accumulator += max(0.0, dt)
+        ticks = int(self.accumulator / self.tick_dt)
+        if ticks > self.max_ticks:
+            # Muito atrasado: executar o máximo e descartar o resto
+            ticks = self.max_ticks
+            leftover = self.accumulator - ticks * self.tick_dt
+            kept = leftover % self.tick_dt
+            self.dropped_time += leftover - kept
+            self.accumulator = kept
+        else:
+            self.accumulator -= ticks * self.tick_dt
+        self.ticks += ticks
+        self.alpha = self.accumulator / self.tick_dt
+        return ticks
+
+    def stats(self):
+        """
+        Estatísticas do laço
+
+        Returns:
+            dict: Taxa de passos, passos, quadros, passos por quadro e
+                  tempo descartado
+        """
+        return {
+            "tick_rate": self.tick_rate,
+            "ticks": self.ticks,
+            "frames": self.frames,
+            "ticks_per_frame": self.ticks / self.frames if self.frames else 0.0,
+            "dropped_time": self.dropped_time
+        }
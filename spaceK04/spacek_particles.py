@@ -0,0 +1,278 @@
+# ===================================================================
+# SPACEK - SISTEMA DE PARTÍCULAS VETORIZADO (NUMPY)
+# ===================================================================
+# As partículas (explosões, faíscas, fumaça) ficam guardadas em arrays
+# do NumPy, um array por atributo ("structure of arrays"), em vez de
+# um objeto Python por partícula.
+#
+# Assim a física de todas as partículas é calculada de uma vez só, e
+# remover as partículas mortas não exige percorrer nem realocar listas.
+#
+# Velocidades e forças são por segundo e a vida em segundos; o sistema
+# guarda os valores já convertidos para um passo da simulação (ver
+# set_tick_rate e spacek_loop.py).
+# ===================================================================
+
+import numpy as np
+
+from spacek_loop import TICK_RATE, keep_per_tick, ticks_for
+
+# Capacidade máxima padrão (partículas vivas ao mesmo tempo)
+PARTICLE_CAPACITY = 16384
+
+# Tipos de partícula (guardados como números no array "kind")
+PARTICLE_NORMAL = 0
+PARTICLE_SPARK = 1
+PARTICLE_SMOKE = 2
+
+PARTICLE_TYPES = {
+    "normal": PARTICLE_NORMAL,
+    "spark": PARTICLE_SPARK,
+    "smoke": PARTICLE_SMOKE
+}
+
+# Faixas de velocidade inicial de cada tipo em px/s: (vx mín, vx máx, vy mín, vy máx)
+PARTICLE_VELOCITY_RANGES = {
+    PARTICLE_SPARK: (-600, 600, -720, -240),   # Faíscas têm velocidade alta e variada
+    PARTICLE_SMOKE: (-180, 180, -480, -300),   # Fumaça tem velocidade baixa
+    PARTICLE_NORMAL: (-360, 360, -480, -180)   # Partículas normais
+}
+
+# Física por tipo
+PARTICLE_GRAVITY = 720         # px/s² (partículas normais caem)
+PARTICLE_SMOKE_LIFT = 360      # px/s² (fumaça sobe)
+PARTICLE_SPARK_DRAG = 0.92     # Velocidade mantida a cada 1/60 s (faíscas)
+PARTICLE_SMOKE_DRAG = 0.9      # Velocidade horizontal mantida a cada 1/60 s (fumaça)
+PARTICLE_SPIN = 600            # Rotação em graus/s
+
+# Vida das partículas de uma explosão em segundos (50 a 100 quadros de 1/60 s)
+PARTICLE_LIFETIME = (50 / 60, 100 / 60)
+
+class SpaceKParticleSystem:
+    """
+    Sistema de partículas para efeitos visuais do SpaceK
+
+    Cada atributo é um array do NumPy com espaço para `capacity`
+    partículas; só as `count` primeiras posições estão vivas.
+
+    - Física vetorizada por tipo ("normal", "spark", "smoke")
+    - Partículas mortas são removidas trocando de lugar com as vivas do
+      final do array (swap-remove), sem mover o resto
+    - Capacidade fixa: partículas além do limite são descartadas e
+      contadas em `dropped`
+    """
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, rng=None, tick_rate=TICK_RATE):
+        """
+        Inicializar sistema de partículas
+
+        Args:
+            capacity: Número máximo de partículas vivas
+            rng: Gerador numpy.random.Generator (None = gerador novo)
+            tick_rate: Passos da simulação por segundo
+        """
+        self.capacity = capacity
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.set_tick_rate(tick_rate)
+        self.count = 0      # Partículas vivas (ocupam os índices 0..count-1)
+        self.dropped = 0    # Partículas descartadas por falta de espaço
+        self.emitted = 0    # Partículas adicionadas desde o início
+        self.peak = 0       # Maior número de partículas vivas ao mesmo tempo
+
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.vx = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.max_lifetime = np.ones(capacity, dtype=np.int32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.rotation = np.zeros(capacity, dtype=np.float64)
+        self.kind = np.zeros(capacity, dtype=np.uint8)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+
+        # Arrays que se movem juntos na compactação
+        self.arrays = (self.x, self.y, self.vx, self.vy, self.lifetime,
+                       self.max_lifetime, self.size, self.rotation,
+                       self.kind, self.color)
+
+    def set_tick_rate(self, tick_rate):
+        """
+        Converter a física das partículas para a duração de um passo
+
+        Args:
+            tick_rate: Passos da simulação por segundo
+        """
+        tick_dt = 1.0 / tick_rate
+        self.tick_dt = tick_dt
+        self.gravity = PARTICLE_GRAVITY * tick_dt * tick_dt      # px/passo a cada passo
+        self.smoke_lift = PARTICLE_SMOKE_LIFT * tick_dt * tick_dt
+        self.spark_drag = keep_per_tick(PARTICLE_SPARK_DRAG, tick_dt)
+        self.smoke_drag = keep_per_tick(PARTICLE_SMOKE_DRAG, tick_dt)
+        self.spin = PARTICLE_SPIN * tick_dt                      # Graus por passo
+        self.lifetime_range = (ticks_for(PARTICLE_LIFETIME[0], tick_rate),
+                               ticks_for(PARTICLE_LIFETIME[1], tick_rate) + 1)
+
+    def reseed(self, seed):
+        """
+        Reiniciar o gerador aleatório com uma semente
+
+        Args:
+            seed: Semente (mesma semente = mesmas partículas)
+        """
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        """Número de partículas vivas"""
+        return self.count
+
+    def clear(self):
+        """Remover todas as partículas"""
+        self.count = 0
+
+    def emit(self, x, y, color, vx, vy, lifetime, particle_type="normal"):
+        """
+        Adicionar partículas ao sistema
+
+        Args:
+            x, y: Posição inicial (número ou array)
+            color: Cor RGB das partículas
+            vx, vy: Velocidade inicial em px por passo (número ou array)
+            lifetime: Tempo de vida em passos (número ou array)
+            particle_type: Tipo das partículas (normal, spark, smoke)
+
+        Returns:
+            int: Número de partículas realmente adicionadas
+
+        O número de partículas é o tamanho do maior array recebido.
+        """
+        amount = max(np.size(x), np.size(y), np.size(vx), np.size(vy), np.size(lifetime))
+        start = self.count
+        free = self.capacity - start
+        if amount > free:
+            self.dropped += amount - free
+            amount = free
+        if amount <= 0:
+            return 0
+        end = start + amount
+
+        for array, values in ((self.x, x), (self.y, y), (self.vx, vx),
+                              (self.vy, vy), (self.lifetime, lifetime)):
+            array[start:end] = values if np.ndim(values) == 0 else np.asarray(values)[:amount]
+        self.max_lifetime[start:end] = self.lifetime[start:end]
+        self.size[start:end] = self.rng.integers(2, 8, amount)          # Tamanho 2..7
+        self.rotation[start:end] = self.rng.uniform(0, 360, amount)
+        self.kind[start:end] = PARTICLE_TYPES.get(particle_type, PARTICLE_NORMAL)
+        self.color[start:end] = np.clip(np.asarray(color, dtype=np.int64), 0, 255)
+        self.count = end
+        self.emitted += amount
+        if end > self.peak:
+            self.peak = end
+        return amount
+
+    def spawn_burst(self, x, y, color, count=8, particle_type="normal"):
+        """
+        Criar explosão de partículas para efeitos visuais
+
+        Args:
+            x, y: Posição da explosão
+            color: Cor das partículas
+            count: Número de partículas
+            particle_type: Tipo das partículas
+
+        Returns:
+            int: Número de partículas realmente adicionadas
+        """
+        kind = PARTICLE_TYPES.get(particle_type, PARTICLE_NORMAL)
+        vx_min, vx_max, vy_min, vy_max = PARTICLE_VELOCITY_RANGES[kind]
+        tick_dt = self.tick_dt
+        rng = self.rng
+        return self.emit(x, y, color,
+                         rng.uniform(vx_min * tick_dt, vx_max * tick_dt, count),
+                         rng.uniform(vy_min * tick_dt, vy_max * tick_dt, count),
+                         rng.integers(*self.lifetime_range, count),  # Vida em passos
+                         particle_type)
+
+    def update(self):
+        """
+        Atualizar física de todas as partículas vivas
+
+        Returns:
+            int: Número de partículas que morreram neste passo
+        """
+        n = self.count
+        if n == 0:
+            return 0
+
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        kind = self.kind[:n]
+
+        # Movimento
+        x += vx
+        y += vy
+
+        # Comportamento específico por tipo
+        normal = kind == PARTICLE_NORMAL
+        spark = kind == PARTICLE_SPARK
+        smoke = kind == PARTICLE_SMOKE
+        vy[normal] += self.gravity         # Gravidade normal
+        vx[spark] *= self.spark_drag       # Faíscas desaceleram gradualmente
+        vy[spark] *= self.spark_drag
+        vy[smoke] -= self.smoke_lift       # Fumaça sobe e desacelera
+        vx[smoke] *= self.smoke_drag
+
+        # Envelhecer partículas
+        lifetime = self.lifetime[:n]
+        lifetime -= 1
+        self.rotation[:n] += self.spin
+
+        # Diminuir tamanho com o tempo (fade out)
+        alpha = np.maximum(lifetime, 0) / self.max_lifetime[:n]
+        np.maximum((7 * alpha).astype(np.int32), 1, out=self.size[:n])
+
+        return self.compact()
+
+    def compact(self):
+        """
+        Remover partículas mortas com swap-remove
+
+        Cada partícula morta dentro da parte que continua viva recebe uma
+        partícula viva do final do array. Só os buracos são movidos, então
+        o custo depende de quantas partículas morreram, não do total.
+
+        Returns:
+            int: Número de partículas removidas
+        """
+        n = self.count
+        alive = self.lifetime[:n] > 0
+        new_count = int(np.count_nonzero(alive))
+        removed = n - new_count
+        if removed == 0:
+            return 0
+
+        # Buracos (mortas) que ficam antes do novo final e
+        # partículas vivas que estão depois dele
+        holes = np.flatnonzero(~alive[:new_count])
+        movers = new_count + np.flatnonzero(alive[new_count:])
+        if holes.size:
+            for array in self.arrays:
+                array[holes] = array[movers]
+        self.count = new_count
+        return removed
+
+    def stats(self):
+        """
+        Estatísticas de uso do sistema
+
+        Returns:
+            dict: Partículas vivas, capacidade, ocupação, pico, adicionadas
+                  e descartadas por falta de espaço
+        """
+        return {
+            "count": self.count,
+            "capacity": self.capacity,
+            "occupancy": self.count / self.capacity,
+            "peak": self.peak,
+            "emitted": self.emitted,
+            "dropped": self.dropped
+        }
@@ -0,0 +1,96 @@
+# ===================================================================
+# SPACEK - POOL DE OBJETOS
+# ===================================================================
+# Objetos de vida curta (como os lasers) são criados uma vez só e
+# reaproveitados: quando um deles sai do jogo ele volta para uma lista
+# de livres (free list) e o próximo disparo usa o mesmo objeto, em vez
+# de criar um novo e deixar o antigo para o coletor de lixo.
+#
+# O pool começa com `capacity` objetos prontos. Se todos estiverem em
+# uso, um objeto extra é criado e contado em `overflow` (o jogo não
+# perde o disparo; a estatística mostra que a capacidade ficou pequena).
+# ===================================================================
+
+class SpaceKPool:
+    """
+    Pool de objetos reaproveitáveis com lista de livres
+
+    Os objetos precisam ter um método reset(*args) que deixa o objeto
+    como se tivesse acabado de ser criado com esses argumentos.
+    """
+
+    def __init__(self, factory, capacity):
+        """
+        Inicializar pool com os objetos já criados
+
+        Args:
+            factory: Função sem argumentos que cria um objeto novo
+            capacity: Número de objetos criados de início
+        """
+        self.factory = factory
+        self.capacity = capacity
+        self.free = [factory() for _ in range(capacity)]  # Objetos livres (pilha)
+
+        # Estatísticas
+        self.in_use = 0       # Objetos emprestados agora
+        self.peak = 0         # Maior número de objetos em uso ao mesmo tempo
+        self.acquired = 0     # Total de objetos emprestados
+        self.overflow = 0     # Objetos criados além da capacidade
+
+    def acquire(self, *args):
+        """
+        Pegar um objeto livre (ou criar um, se não houver)
+
+        Args:
+            *args: Argumentos repassados para reset() do objeto
+
+        Returns:
+            object: Objeto pronto para uso
+        """
+        if self.free:
+            item = self.free.pop()
+        else:
+            item = self.factory()
+            self.overflow += 1
+        item.reset(*args)
+        self.in_use += 1
+        self.acquired += 1
+        if self.in_use > self.peak:
+            self.peak = self.in_use
+        return item
+
+    def release(self, item):
+        """
+        Devolver um objeto ao pool
+
+        Args:
+            item: Objeto obtido com acquire()
+        """
+        self.free.append(item)
+        self.in_use -= 1
+
+    def release_all(self, items):
+        """
+        Devolver vários objetos ao pool
+
+        Args:
+            items: Objetos obtidos com acquire()
+        """
+        self.free.extend(items)
+        self.in_use -= len(items)
+
+    def stats(self):
+        """
+        Estatísticas de uso do pool
+
+        Returns:
+            dict: Capacidade, objetos em uso, pico, empréstimos e excedentes
+        """
+        return {
+            "capacity": self.capacity,
+            "in_use": self.in_use,
+            "peak": self.peak,
+            "occupancy": self.in_use / self.capacity if self.capacity else 0.0,
+            "acquired": self.acquired,
+            "overflow": self.overflow
+        }
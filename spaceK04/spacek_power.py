@@ -0,0 +1,242 @@
+# ===================================================================
+# SPACEK - MODO OCIOSO DO MENU E CONSUMO POR TELA
+# ===================================================================
+# Em um quiosque o jogo passa a maior parte do tempo parado no menu,
+# que continua animando as estrelas e redesenhando a tela a 60 fps.
+#
+# Depois de IDLE_TIMEOUT segundos sem nenhuma tecla ou movimento do
+# mouse o menu entra no modo ocioso:
+#
+#   - o laço passa a rodar IDLE_FRAME_RATE quadros por segundo: no
+#     início de cada quadro o jogo dorme esperando um evento (e não
+#     em um laço ocupado), então a CPU fica livre
+#   - as estrelas andam um passo só por quadro, do tamanho do tempo
+#     que passou (mesma velocidade na tela, menos passos)
+#   - qualquer evento (tecla, mouse) acorda a espera na hora; ele é
+#     devolvido à fila e tratado normalmente pelo pgzero no quadro
+#     seguinte, que já volta a 60 fps
+#
+# O pgzero chama clock.tick(60) a cada volta do laço e não deixa
+# trocar essa taxa; a espera dentro do update() é o que a reduz.
+#
+# SpaceKPowerMeter mede, por tela, o tempo real, o tempo de CPU do
+# processo (time.process_time) e os quadros desenhados: quadros por
+# segundo e porcentagem de CPU médios de cada estado, para conferir a
+# economia do modo ocioso ("menu_idle") contra o menu normal ("menu").
+#
+# Uso: SPACEK_IDLE=<segundos> python spaceK.py (0 = modo ocioso desligado)
+# ===================================================================
+
+import os
+from time import perf_counter, process_time
+
+import pygame
+
+# Segundos sem controles até o menu entrar no modo ocioso
+IDLE_TIMEOUT_DEFAULT = 30.0
+
+# Quadros por segundo no modo ocioso
+IDLE_FRAME_RATE = 10
+
+# Maior tempo (s) simulado de uma vez no modo ocioso (ex.: janela
+# arrastada, computador suspenso)
+IDLE_MAX_STEP = 0.25
+
+def parse_idle_timeout(value):
+    """
+    Converter o valor de SPACEK_IDLE em segundos
+
+    Args:
+        value: Texto da variável de ambiente (None = padrão)
+
+    Returns:
+        float: Segundos até o modo ocioso (0 = desligado)
+    """
+    if value is None or not value.strip():
+        return IDLE_TIMEOUT_DEFAULT
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return IDLE_TIMEOUT_DEFAULT
+
+IDLE_TIMEOUT = parse_idle_timeout(os.environ.get("SPACEK_IDLE"))
+
+class SpaceKIdleThrottle:
+    """
+    Contador de inatividade e espera dos quadros do modo ocioso
+
+    - advance(dt, allowed) a cada quadro: conta o tempo sem controles
+    - touch() a cada tecla ou movimento do mouse: sai do modo ocioso
+    - wait() no início do quadro ocioso: dorme até o próximo quadro ou
+      até chegar um evento
+    """
+
+    def __init__(self, timeout=IDLE_TIMEOUT, frame_rate=IDLE_FRAME_RATE):
+        """
+        Inicializar contador (ativo, sem tempo parado)
+
+        Args:
+            timeout: Segundos sem controles até o modo ocioso
+            frame_rate: Quadros por segundo no modo ocioso
+        """
+        self.timeout = timeout
+        self.frame_period = 1.0 / frame_rate
+        self.idle = False          # Modo ocioso ligado
+        self.idle_time = 0.0       # Segundos desde o último controle
+        self.idle_since = None     # perf_counter() da entrada no modo ocioso
+        self.last_wait = None      # perf_counter() do fim da última espera
+
+        # Estatísticas
+        self.entered = 0           # Vezes que o modo ocioso foi ligado
+        self.woken = 0             # Esperas interrompidas por um evento
+        self.idle_seconds = 0.0    # Tempo total no modo ocioso
+
+    def touch(self):
+        """
+        Registrar um controle (tecla ou mouse) e sair do modo ocioso
+
+        Returns:
+            float: Segundos que o jogo ficou ocioso (0 se estava ativo)
+        """
+        self.idle_time = 0.0
+        if not self.idle:
+            return 0.0
+        elapsed = perf_counter() - self.idle_since
+        self.idle_seconds += elapsed
+        self.idle = False
+        self.idle_since = None
+        self.last_wait = None
+        return elapsed
+
+    def advance(self, dt, allowed):
+        """
+        Somar o tempo do quadro sem controles
+
+        Args:
+            dt: Tempo real do quadro em segundos
+            allowed: A tela atual aceita o modo ocioso (menu)
+
+        Returns:
+            bool: True se o modo ocioso acabou de ser ligado
+        """
+        if not allowed or self.timeout <= 0:
+            self.touch()
+            return False
+        self.idle_time += dt
+        if self.idle or self.idle_time < self.timeout:
+            return False
+        self.idle = True
+        self.idle_since = perf_counter()
+        self.entered += 1
+        return True
+
+    def wait(self):
+        """
+        Dormir até o próximo quadro ocioso ou até chegar um evento
+
+        O evento que acordar a espera volta para a fila do pygame (o
+        pgzero o entrega no próximo quadro, como qualquer outro).
+
+        Returns:
+            bool: True se a espera foi interrompida por um evento
+        """
+        now = perf_counter()
+        delay = self.frame_period if self.last_wait is None else self.frame_period - (now - self.last_wait)
+        woken = False
+        if delay > 0:
+            event = pygame.event.wait(max(1, int(delay * 1000)))
+            if event.type != pygame.NOEVENT:
+                pygame.event.post(event)
+                self.woken += 1
+                woken = True
+        self.last_wait = perf_counter()
+        return woken
+
+    def stats(self):
+        """
+        Estatísticas do modo ocioso
+
+        Returns:
+            dict: Ligado agora, tempo sem controles, entradas, esperas
+                  acordadas por evento e tempo total ocioso
+        """
+        idle_seconds = self.idle_seconds
+        if self.idle:
+            idle_seconds += perf_counter() - self.idle_since
+        return {
+            "timeout": self.timeout,
+            "idle": self.idle,
+            "idle_time": self.idle_time,
+            "entered": self.entered,
+            "woken": self.woken,
+            "idle_seconds": idle_seconds
+        }
+
+class SpaceKPowerMeter:
+    """
+    Quadros por segundo e uso de CPU médios de cada tela
+
+    Chame frame(estado) uma vez por quadro desenhado: o tempo real e o
+    tempo de CPU desde a chamada anterior vão para esse estado.
+    """
+
+    def __init__(self):
+        """Inicializar medidor (sem quadros medidos)"""
+        self.states = {}        # Estado -> [quadros, tempo real (s), CPU (s)]
+        self.last_wall = None
+        self.last_cpu = None
+
+    def frame(self, state):
+        """
+        Fechar um quadro desenhado no estado informado
+
+        Args:
+            state: Nome da tela (ex.: "menu", "menu_idle", "playing")
+        """
+        wall = perf_counter()
+        cpu = process_time()
+        if self.last_wall is not None:
+            totals = self.states.get(state)
+            if totals is None:
+                totals = self.states[state] = [0, 0.0, 0.0]
+            totals[0] += 1
+            totals[1] += wall - self.last_wall
+            totals[2] += cpu - self.last_cpu
+        self.last_wall = wall
+        self.last_cpu = cpu
+
+    def state_stats(self, state):
+        """
+        Médias de uma tela
+
+        Args:
+            state: Nome da tela
+
+        Returns:
+            dict: Quadros, segundos, fps e CPU (% de um núcleo), ou None
+                  se a tela ainda não foi medida
+        """
+        totals = self.states.get(state)
+        if totals is None or totals[1] <= 0:
+            return None
+        frames, wall, cpu = totals
+        return {
+            "frames": frames,
+            "seconds": wall,
+            "fps": frames / wall,
+            "cpu_percent": cpu / wall * 100
+        }
+
+    def stats(self):
+        """
+        Médias de todas as telas medidas
+
+        Returns:
+            dict: Estado -> resultado de state_stats()
+        """
+        result = {}
+        for state in self.states:
+            stats = self.state_stats(state)
+            if stats is not None:
+                result[state] = stats
+        return result
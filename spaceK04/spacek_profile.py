@@ -0,0 +1,146 @@
+# ===================================================================
+# SPACEK - MEDIÇÃO DE TEMPO POR SEÇÃO
+# ===================================================================
+# Ganchos leves para medir quanto tempo cada parte do quadro consome
+# (inimigos, colisões, partículas, plataformas, HUD...).
+#
+# Quem mede guarda o profiler em uma variável que vale None quando a
+# medição está desligada; o custo desligado é só um "if" por seção:
+#
+#     prof = self.profiler
+#     if prof is not None:
+#         mark = perf_counter()
+#     ... trabalho ...
+#     if prof is not None:
+#         mark = prof.lap("sim.enemies", mark)
+#
+# Os tempos de cada quadro vão para um histórico, usado pelos
+# benchmarks (benchmarks/) e pelo gráfico de tempo do jogo.
+# ===================================================================
+
+import math
+from collections import deque
+from time import perf_counter
+
+# Número de quadros guardados no histórico (None = todos)
+PROFILE_HISTORY = 240
+
+def percentile(sorted_values, fraction):
+    """
+    Calcular percentil de uma lista já ordenada (método do valor mais próximo)
+
+    Args:
+        sorted_values: Lista ordenada e não vazia
+        fraction: Percentil entre 0 e 1 (ex.: 0.99)
+
+    Returns:
+        float: Valor do percentil
+    """
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+class SpaceKProfiler:
+    """
+    Acumulador de tempos por seção, quadro a quadro
+
+    - lap(seção, início): soma o tempo desde `início` na seção e devolve
+      o momento atual (para encadear a próxima seção)
+    - end_frame(): fecha o quadro e guarda os tempos no histórico
+    - summary(): mínimo, mediana, p99 e média de cada seção em ms
+    """
+
+    def __init__(self, history_size=PROFILE_HISTORY):
+        """
+        Inicializar profiler
+
+        Args:
+            history_size: Quadros guardados no histórico (None = todos)
+        """
+        self.current = {}                          # seção -> segundos no quadro atual
+        self.history = deque(maxlen=history_size)  # um dicionário por quadro
+        self.frame_times = deque(maxlen=history_size)  # duração de cada quadro
+        self.frame_start = None
+        self.frame_count = 0                       # Quadros fechados com end_frame
+        self.sections = []                         # Seções na ordem em que apareceram
+
+    def lap(self, name, start):
+        """
+        Somar o tempo desde `start` em uma seção
+
+        Args:
+            name: Nome da seção (ex.: "sim.enemies", "draw.hud")
+            start: Momento inicial (perf_counter)
+
+        Returns:
+            float: Momento atual, para medir a próxima seção
+        """
+        now = perf_counter()
+        current = self.current
+        if name in current:
+            current[name] += now - start
+        else:
+            current[name] = now - start
+            if name not in self.sections:
+                self.sections.append(name)
+        return now
+
+    def end_frame(self):
+        """Fechar o quadro atual e guardar seus tempos no histórico"""
+        now = perf_counter()
+        if self.frame_start is not None:
+            self.frame_times.append(now - self.frame_start)
+        self.frame_start = now
+        self.history.append(self.current)
+        self.current = {}
+        self.frame_count += 1
+
+    def clear(self):
+        """Apagar histórico e tempos do quadro atual"""
+        self.current = {}
+        self.history.clear()
+        self.frame_times.clear()
+        self.frame_start = None
+
+    def recent_means(self, count):
+        """
+        Tempo médio de cada seção nos últimos quadros
+
+        Args:
+            count: Número de quadros considerados
+
+        Returns:
+            list: Tuplas (seção, ms), na ordem em que as seções apareceram
+
+        Seções que não rodaram nesses quadros (ex.: simulação no menu)
+        ficam de fora.
+        """
+        frames = list(self.history)[-count:]
+        means = []
+        for name in self.sections:
+            values = [frame[name] for frame in frames if name in frame]
+            if values:
+                means.append((name, sum(values) * 1000 / len(frames)))
+        return means
+
+    def summary(self):
+        """
+        Estatísticas de cada seção no histórico
+
+        Returns:
+            dict: seção -> {"min", "median", "p99", "mean"} em milissegundos
+
+        Quadros em que a seção não rodou contam como 0 ms.
+        """
+        result = {}
+        frames = len(self.history)
+        if frames == 0:
+            return result
+        for name in self.sections:
+            values = sorted(frame.get(name, 0.0) * 1000 for frame in self.history)
+            result[name] = {
+                "min": values[0],
+                "median": percentile(values, 0.5),
+                "p99": percentile(values, 0.99),
+                "mean": sum(values) / frames
+            }
+        return result
@@ -0,0 +1,212 @@
+# ===================================================================
+# SPACEK - GRAVAÇÃO E REPRODUÇÃO DE PARTIDAS
+# ===================================================================
+# Como o SpaceKWorld usa um gerador aleatório com semente, uma partida
+# fica totalmente definida por:
+#
+#   - a semente usada no reset
+#   - os controles (SpaceKInput) entregues a cada passo
+#
+# O gravador guarda só as MUDANÇAS dos controles, cada uma com o número
+# do passo em que aconteceu: (passo, controle, valor). Uma partida de
+# vários minutos ocupa poucos kilobytes e pode ser reproduzida passo a
+# passo para investigar bugs ou medir desempenho.
+#
+# Formato do arquivo (JSON):
+#   {"version": 1, "seed": 123, "tick_rate": 60, "ticks": 5400,
+#    "events": [[0, "R", 1], [31, "J", 1], [32, "J", 0], ...]}
+#
+# tick_rate é a taxa de passos da partida (gravações sem ela são de 60).
+# ===================================================================
+
+import json
+
+from spacek_loop import TICK_RATE_DEFAULT
+from spacek_world import SpaceKInput
+
+# Versão do formato do arquivo de gravação
+INPUT_LOG_VERSION = 1
+
+# Controles gravados: (atributo do SpaceKInput, código curto no arquivo)
+INPUT_FIELDS = (
+    ("move_left", "L"),
+    ("move_right", "R"),
+    ("jump", "J"),
+    ("shoot", "S")
+)
+
+INPUT_CODES = {code: field for field, code in INPUT_FIELDS}
+
+# Teclas do jogo -> controle do SpaceKInput (mesmos controles da tela de jogo)
+KEY_BINDINGS = {
+    "a": "move_left", "left": "move_left",      # Movimento para esquerda
+    "d": "move_right", "right": "move_right",   # Movimento para direita
+    "space": "jump", "w": "jump", "up": "jump", # Pulo no chão ou jetpack no ar
+    "x": "shoot"                                # Disparar laser
+}
+
+# Controles que valem só por um passo (soltar a tecla não muda nada)
+PULSE_FIELDS = ("jump", "shoot")
+
+def apply_key_event(inputs, key_name, pressed):
+    """
+    Aplicar uma tecla pressionada ou solta nos controles
+
+    Args:
+        inputs: SpaceKInput a atualizar
+        key_name: Nome da tecla (ex.: "d", "LEFT", "space")
+        pressed: True se a tecla foi pressionada, False se foi solta
+
+    Returns:
+        bool: True se a tecla é um controle do jogo
+
+    Pulo e laser são ligados ao pressionar e desligados pelo adaptador
+    depois de um passo; soltar essas teclas não tem efeito.
+    """
+    field = KEY_BINDINGS.get(key_name.lower())
+    if field is None:
+        return False
+    if pressed:
+        setattr(inputs, field, True)
+    elif field not in PULSE_FIELDS:
+        setattr(inputs, field, False)
+    return True
+
+def input_state(inputs):
+    """
+    Converter controles em tupla (para comparar com o passo anterior)
+
+    Args:
+        inputs: SpaceKInput
+
+    Returns:
+        tuple: Valor de cada controle, na ordem de INPUT_FIELDS
+    """
+    return tuple(bool(getattr(inputs, field)) for field, _ in INPUT_FIELDS)
+
+class SpaceKInputRecorder:
+    """
+    Gravador compacto dos controles de uma partida
+
+    Chame record(passo, controles) antes de cada SpaceKWorld.step();
+    só as mudanças em relação ao passo anterior são guardadas.
+    """
+
+    def __init__(self, seed, tick_rate=TICK_RATE_DEFAULT):
+        """
+        Inicializar gravador
+
+        Args:
+            seed: Semente usada no reset do mundo
+            tick_rate: Passos da simulação por segundo da partida
+        """
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.events = []                                 # (passo, código, 0/1)
+        self.previous = (False,) * len(INPUT_FIELDS)     # Controles do último passo
+        self.ticks = 0                                   # Passos gravados
+
+    def record(self, tick, inputs):
+        """
+        Registrar os controles usados em um passo
+
+        Args:
+            tick: Número do passo (SpaceKWorld.tick antes do step)
+            inputs: SpaceKInput entregue ao mundo
+        """
+        state = input_state(inputs)
+        if state != self.previous:
+            for (field, code), old, new in zip(INPUT_FIELDS, self.previous, state):
+                if old != new:
+                    self.events.append((tick, code, int(new)))
+            self.previous = state
+        self.ticks = tick + 1
+
+    def to_dict(self):
+        """
+        Converter gravação em dicionário (formato do arquivo)
+
+        Returns:
+            dict: Versão, semente, taxa de passos, passos e eventos
+        """
+        return {
+            "version": INPUT_LOG_VERSION,
+            "seed": self.seed,
+            "tick_rate": self.tick_rate,
+            "ticks": self.ticks,
+            "events": [list(event) for event in self.events]
+        }
+
+    def save(self, path):
+        """
+        Salvar gravação em arquivo JSON
+
+        Args:
+            path: Caminho do arquivo
+        """
+        with open(path, "w", encoding="utf-8") as log_file:
+            json.dump(self.to_dict(), log_file, separators=(",", ":"))
+
+def load_input_log(path):
+    """
+    Ler gravação de um arquivo JSON
+
+    Args:
+        path: Caminho do arquivo
+
+    Returns:
+        dict: Gravação (mesmo formato de SpaceKInputRecorder.to_dict)
+
+    Raises:
+        ValueError: Se a versão do arquivo não é suportada
+    """
+    with open(path, encoding="utf-8") as log_file:
+        log = json.load(log_file)
+    if log.get("version") != INPUT_LOG_VERSION:
+        raise ValueError(f"Versão de gravação não suportada: {log.get('version')}")
+    return log
+
+class SpaceKInputPlayer:
+    """
+    Reprodutor de uma gravação de controles
+
+    A cada passo, apply(passo, controles) aplica nos controles todas as
+    mudanças gravadas até aquele passo.
+    """
+
+    def __init__(self, log):
+        """
+        Inicializar reprodutor
+
+        Args:
+            log: Gravação (dicionário de SpaceKInputRecorder.to_dict)
+        """
+        self.seed = log["seed"]
+        self.tick_rate = log.get("tick_rate", TICK_RATE_DEFAULT)
+        self.ticks = log["ticks"]
+        self.events = sorted((int(tick), code, int(value)) for tick, code, value in log["events"])
+        self.index = 0  # Próximo evento a aplicar
+
+    def apply(self, tick, inputs=None):
+        """
+        Aplicar as mudanças de controle até o passo informado
+
+        Args:
+            tick: Número do passo (SpaceKWorld.tick antes do step)
+            inputs: SpaceKInput a atualizar (None = novo)
+
+        Returns:
+            SpaceKInput: Controles para este passo
+        """
+        if inputs is None:
+            inputs = SpaceKInput()
+        events = self.events
+        while self.index < len(events) and events[self.index][0] <= tick:
+            _, code, value = events[self.index]
+            setattr(inputs, INPUT_CODES[code], bool(value))
+            self.index += 1
+        return inputs
+
+    def finished(self, tick):
+        """Verificar se a gravação já terminou no passo informado"""
+        return tick >= self.ticks
@@ -0,0 +1,238 @@
+# ===================================================================
+# SPACEK - EXECUTOR DE REPLAY SEM TELA (REGRESSÃO E DESEMPENHO)
+# ===================================================================
+# Roda uma partida roteirizada o mais rápido possível, sem pgzero, sem
+# tela e sem áudio, e mostra:
+#
+#   - um hash do estado do mundo a cada passo (detecta mudanças de
+#     jogabilidade: o mesmo roteiro deve gerar sempre os mesmos hashes)
+#   - tempo total e passos por segundo (detecta perda de desempenho)
+#
+# Uso:
+#   python spacek_runner.py roteiro.json
+#   python spacek_runner.py roteiro.json --hashes hashes.txt
+#   python spacek_runner.py roteiro.json --expect hashes.txt
+#   python spacek_runner.py roteiro.json --tick-rate 30
+#
+# Formato do roteiro (JSON), com as mesmas teclas da tela de jogo:
+#   {"seed": 42, "frames": 3600,
+#    "events": [[0, "down", "d"], [30, "down", "space"], [90, "up", "d"]]}
+#
+# Também aceita as gravações feitas com F5 no jogo (spacek_replay.py).
+#
+# Os frames do roteiro são passos a "tick_rate" passos por segundo
+# (padrão 60, o mesmo das gravações). Com --tick-rate o mundo roda em
+# outra taxa e os frames do roteiro são convertidos pelo tempo: a mesma
+# tecla cai no mesmo segundo da partida.
+# ===================================================================
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+
+# Sem a mensagem de boas-vindas do pygame (a saída é JSON)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from spacek_loop import TICK_RATE_DEFAULT
+from spacek_replay import (INPUT_LOG_VERSION, SpaceKInputPlayer, apply_key_event,
+                           PULSE_FIELDS)
+from spacek_world import SpaceKWorld, SpaceKInput
+
+# Semente usada quando o roteiro não informa uma
+DEFAULT_SEED = 1
+
+def world_state_hash(world):
+    """
+    Calcular hash do estado do mundo
+
+    Args:
+        world: SpaceKWorld
+
+    Returns:
+        str: Hash de 16 dígitos hexadecimais
+
+    Inclui jogador, câmera, pontuação, aliens, lasers, itens coletados
+    e todas as partículas vivas.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(world.state.encode())
+    digest.update(struct.pack(
+        "<q9d5q", world.tick,
+        world.player_x, world.player_y, world.player_vx, world.player_vy,
+        world.player_energy, world.player_jetpack_fuel, world.oxygen,
+        world.camera_x, world.player_shield_timer,
+        world.player_lives, world.score, world.coins_collected,
+        world.enemies_defeated, world.current_level))
+    for enemy in world.enemies:
+        digest.update(struct.pack("<4d2q", enemy.x, enemy.y, enemy.vx, enemy.vy,
+                                  enemy.health, enemy.alive))
+    for laser in world.lasers:
+        digest.update(struct.pack("<2d", laser.x, laser.y))
+    digest.update(bytes(item.collected for item in world.powerups))
+    digest.update(bytes(coin.collected for coin in world.coins))
+    particles = world.particles
+    count = particles.count
+    digest.update(struct.pack("<q", count))
+    digest.update(particles.x[:count].tobytes())
+    digest.update(particles.y[:count].tobytes())
+    digest.update(particles.lifetime[:count].tobytes())
+    return digest.hexdigest()
+
+def load_timeline(path):
+    """
+    Ler roteiro (ou gravação do jogo) de um arquivo JSON
+
+    Args:
+        path: Caminho do arquivo
+
+    Returns:
+        dict: Roteiro com "seed", "frames" e "events"
+    """
+    with open(path, encoding="utf-8") as timeline_file:
+        return json.load(timeline_file)
+
+def run_timeline(timeline, frames=None, seed=None, on_frame=None, tick_rate=None):
+    """
+    Executar um roteiro no SpaceKWorld sem tela
+
+    Args:
+        timeline: Roteiro (teclas por frame) ou gravação do jogo
+        frames: Número de passos (None = a duração do roteiro)
+        seed: Semente (None = a do roteiro)
+        on_frame: Função on_frame(frame, world) chamada após cada passo
+        tick_rate: Passos da simulação por segundo (None = a do roteiro)
+
+    Returns:
+        dict: Passos executados, estado final e tempos
+
+    Segue as mesmas regras do update() do jogo: teclas de cada frame
+    são aplicadas antes do passo, pulo e laser valem um passo só e a
+    simulação para no game over.
+    """
+    recorded = timeline.get("version") == INPUT_LOG_VERSION
+    player = SpaceKInputPlayer(timeline) if recorded else None
+    if seed is None:
+        seed = timeline.get("seed", DEFAULT_SEED)
+    timeline_rate = timeline.get("tick_rate", TICK_RATE_DEFAULT)
+    if tick_rate is None:
+        tick_rate = timeline_rate
+    if frames is None:
+        frames = round(timeline.get("ticks" if recorded else "frames", 0) * tick_rate / timeline_rate)
+
+    # Agrupar teclas por passo (convertendo os frames do roteiro pelo tempo)
+    key_events = {}
+    if not recorded:
+        for frame, action, key_name in timeline.get("events", []):
+            tick = round(int(frame) * tick_rate / timeline_rate)
+            key_events.setdefault(tick, []).append((key_name, action == "down"))
+
+    world = SpaceKWorld(seed=seed, tick_rate=tick_rate)
+    inputs = SpaceKInput()
+    sim_time = 0.0
+    start = time.perf_counter()
+    frame = 0
+    while frame < frames and world.state != "gameover":
+        if player is not None:
+            player.apply(world.tick * timeline_rate // tick_rate, inputs)
+        else:
+            for key_name, pressed in key_events.get(frame, ()):
+                apply_key_event(inputs, key_name, pressed)
+
+        step_start = time.perf_counter()
+        world.step(inputs)
+        sim_time += time.perf_counter() - step_start
+
+        for field in PULSE_FIELDS:
+            setattr(inputs, field, False)
+        frame += 1
+        if on_frame is not None:
+            on_frame(frame, world)
+    wall_time = time.perf_counter() - start
+
+    return {
+        "seed": seed,
+        "tick_rate": tick_rate,
+        "ticks": frame,
+        "state": world.state,
+        "level": world.current_level,
+        "score": world.score,
+        "enemies_active": world.enemies_active,
+        "enemies_sleeping": world.enemies_sleeping,
+        "pools": world.pool_stats(),
+        "final_hash": world_state_hash(world),
+        "wall_time": wall_time,
+        "sim_time": sim_time,
+        "ticks_per_second": frame / sim_time if sim_time > 0 else 0.0
+    }
+
+def read_hashes(path):
+    """
+    Ler arquivo de hashes gerado com --hashes
+
+    Args:
+        path: Caminho do arquivo
+
+    Returns:
+        list: Hash de cada frame, em ordem
+    """
+    with open(path, encoding="utf-8") as hash_file:
+        return [line.split()[1] for line in hash_file if line.strip()]
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando
+
+    Args:
+        argv: Argumentos (None = sys.argv)
+
+    Returns:
+        int: Código de saída (1 se --expect encontrou diferença)
+    """
+    parser = argparse.ArgumentParser(description="Executa um roteiro do SpaceK sem tela.")
+    parser.add_argument("timeline", help="roteiro JSON ou gravação feita com F5")
+    parser.add_argument("--frames", type=int, help="número de passos (padrão: o do roteiro)")
+    parser.add_argument("--seed", type=int, help="semente do mundo (padrão: a do roteiro)")
+    parser.add_argument("--tick-rate", type=int,
+                        help="passos da simulação por segundo (padrão: a do roteiro, 60)")
+    parser.add_argument("--hashes", help="gravar o hash de cada passo neste arquivo ('-' = tela)")
+    parser.add_argument("--expect", help="comparar com um arquivo de hashes gravado antes")
+    args = parser.parse_args(argv)
+
+    timeline = load_timeline(args.timeline)
+    expected = read_hashes(args.expect) if args.expect else None
+    hashes = [] if (args.hashes or expected is not None) else None
+    on_frame = None
+    if hashes is not None:
+        on_frame = lambda frame, world: hashes.append(world_state_hash(world))
+
+    if args.tick_rate is not None and args.tick_rate <= 0:
+        parser.error("--tick-rate precisa ser maior que zero")
+    result = run_timeline(timeline, args.frames, args.seed, on_frame, args.tick_rate)
+
+    if args.hashes:
+        lines = "".join(f"{frame} {value}\n" for frame, value in enumerate(hashes, 1))
+        if args.hashes == "-":
+            sys.stdout.write(lines)
+        else:
+            with open(args.hashes, "w", encoding="utf-8") as hash_file:
+                hash_file.write(lines)
+
+    exit_code = 0
+    if expected is not None:
+        mismatch = next((frame for frame, (got, want) in enumerate(zip(hashes, expected), 1)
+                         if got != want), None)
+        if mismatch is None and len(hashes) != len(expected):
+            mismatch = min(len(hashes), len(expected)) + 1
+        result["first_mismatch"] = mismatch
+        if mismatch is not None:
+            exit_code = 1
+
+    print(json.dumps(result, indent=2))
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+# ===================================================================
+# SPACEK - CAMPO DE ESTRELAS VETORIZADO (NUMPY)
+# ===================================================================
+# As estrelas do fundo ficam em arrays do NumPy (um array por
+# atributo), como as partículas: o movimento, o reposicionamento das
+# estrelas que saem da tela e o brilho (twinkle) de todas elas são
+# calculados de uma vez só, sem laço em Python.
+#
+# O brilho vem de uma tabela pré-calculada (TWINKLE_LUT) em vez de
+# chamar math.sin para cada estrela em cada quadro.
+#
+# Este módulo não desenha nada (ver SpaceKStarSprites em spacek_render.py).
+# ===================================================================
+
+import math
+
+import numpy as np
+
+# Número de estrelas do fundo
+STAR_COUNT = 120
+
+# Cores possíveis das estrelas (o array "color" guarda o índice)
+STAR_COLORS = (
+    (255, 255, 255), (255, 255, 200),
+    (200, 255, 255), (255, 200, 255)
+)
+
+# Brilho = |sen(twinkle * escala)| * 180 + 75. Como |sen| se repete a
+# cada pi, a tabela cobre uma volta de 0 a pi em TWINKLE_LUT_SIZE passos
+TWINKLE_LUT_SIZE = 1024
+TWINKLE_MIN = 75
+TWINKLE_RANGE = 180
+TWINKLE_LUT = (np.abs(np.sin(np.arange(TWINKLE_LUT_SIZE) * (math.pi / TWINKLE_LUT_SIZE)))
+               * TWINKLE_RANGE).astype(np.int32) + TWINKLE_MIN
+
+# Escala do twinkle no jogo e no menu (o menu pisca mais rápido)
+TWINKLE_SCALE_GAME = 0.01
+TWINKLE_SCALE_MENU = 0.04
+
+class SpaceKStarField:
+    """
+    Campo de estrelas em arrays do NumPy
+
+    Arrays (um valor por estrela): x, y, size, speed, twinkle e color
+    (índice em STAR_COLORS). parallax guarda quanto cada estrela se
+    move com a câmera no jogo (estrelas maiores parecem mais próximas).
+    """
+
+    def __init__(self):
+        """Inicializar campo vazio (as estrelas são criadas em reset)"""
+        self.reset_arrays(0)
+
+    def reset_arrays(self, count):
+        """
+        Criar arrays vazios para `count` estrelas
+
+        Args:
+            count: Número de estrelas
+        """
+        self.x = np.zeros(count, dtype=np.float64)
+        self.y = np.zeros(count, dtype=np.int32)
+        self.size = np.zeros(count, dtype=np.int32)
+        self.speed = np.zeros(count, dtype=np.float64)
+        self.twinkle = np.zeros(count, dtype=np.float64)
+        self.color = np.zeros(count, dtype=np.uint8)
+        self.parallax = np.zeros(count, dtype=np.float64)
+
+    def __len__(self):
+        """Número de estrelas"""
+        return len(self.x)
+
+    def reset(self, rng, width, height, count=STAR_COUNT):
+        """
+        Sortear um novo campo de estrelas
+
+        Args:
+            rng: random.Random do mundo (mesma semente = mesmas estrelas)
+            width, height: Tamanho da tela (as estrelas cobrem 6 telas)
+            count: Número de estrelas
+
+        Os valores são sorteados estrela por estrela, na mesma ordem de
+        antes, para não mudar o resto da sequência do gerador do mundo.
+        """
+        self.reset_arrays(count)
+        for i in range(count):
+            self.x[i] = rng.randint(0, width * 6)         # Posição X aleatória
+            self.y[i] = rng.randint(0, height)            # Posição Y aleatória
+            self.size[i] = rng.randint(1, 4)              # Tamanho aleatório
+            self.speed[i] = rng.uniform(0.02, 0.3)        # Velocidade aleatória
+            self.twinkle[i] = rng.randint(0, 100)         # Timer de brilho
+            self.color[i] = rng.randrange(len(STAR_COLORS))  # Cor aleatória
+        self.parallax[:] = 0.05 + self.size * 0.02       # Estrelas maiores movem mais
+
+    def update(self, speed_scale, twinkle_step, left_limit, wrap_x):
+        """
+        Mover todas as estrelas e avançar o brilho
+
+        Args:
+            speed_scale: Fração da velocidade de cada estrela usada no passo
+            twinkle_step: Quanto o timer de brilho avança
+            left_limit: Estrelas à esquerda deste X voltam pela direita
+            wrap_x: Posição X onde elas reaparecem
+        """
+        x = self.x
+        if speed_scale == 1:
+            x -= self.speed
+        else:
+            x -= self.speed * speed_scale
+        x[x < left_limit] = wrap_x
+        self.twinkle += twinkle_step
+
+    def brightness(self, twinkle_scale, indices=None):
+        """
+        Brilho atual das estrelas (de TWINKLE_MIN a 255)
+
+        Args:
+            twinkle_scale: Escala do timer (TWINKLE_SCALE_GAME ou _MENU)
+            indices: Estrelas consultadas (None = todas)
+
+        Returns:
+            numpy.ndarray: Brilho de cada estrela (int32)
+        """
+        twinkle = self.twinkle if indices is None else self.twinkle[indices]
+        phase = (twinkle * (twinkle_scale * TWINKLE_LUT_SIZE / math.pi)).astype(np.int64)
+        return TWINKLE_LUT[phase % TWINKLE_LUT_SIZE]
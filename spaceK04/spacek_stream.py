@@ -0,0 +1,225 @@
+# ===================================================================
+# SPACEK - STREAMING DO NÍVEL EM PEDAÇOS
+# ===================================================================
+# O nível compilado (spacek_levels.py) é dividido em pedaços (chunks)
+# horizontais. Só os pedaços perto da câmera ficam "vivos": os aliens,
+# power-ups, moedas e plataformas deles viram objetos do jogo. Os
+# pedaços que ficam para trás são descartados.
+#
+#   |  descartado  | atrás |  tela  |   look-ahead   |  ainda não  |
+#                  <------------- janela ativa ------>
+#
+# Assim o custo por quadro e os objetos vivos dependem só do tamanho
+# da janela, e não do comprimento do nível.
+#
+# O que o jogador já fez continua valendo: aliens derrotados e itens
+# coletados não voltam quando o pedaço é carregado de novo, e os aliens
+# que saíram vivos (feridos ou não) voltam como estavam. O estado
+# deles não fica aqui: quem usa o streaming guarda (ver `keep`; o
+# mundo usa um array de tamanho fixo, um registro por alien do nível,
+# reservado ao carregar o nível e que não cresce durante o jogo).
+# ===================================================================
+
+# Distância (px) além da borda direita da tela que já fica carregada
+STREAM_AHEAD = 1600
+
+# Distância (px) atrás da borda esquerda da tela que continua carregada
+STREAM_BEHIND = 800
+
+class SpaceKLevelStream:
+    """
+    Controle dos pedaços ativos de um nível
+
+    Quem usa passa funções que criam os objetos a partir do índice da
+    entidade no nível (uma por tipo, em `factories`) e chama update(esquerda, direita) a cada passo com a faixa que
+    precisa estar viva (tela e jogador). Quando a janela muda, as listas
+    de objetos ativos (enemies, powerups, coins, platforms) são refeitas.
+    """
+
+    def __init__(self, data, factories, ahead=STREAM_AHEAD, behind=STREAM_BEHIND, keep=None):
+        """
+        Inicializar streaming de um nível
+
+        Args:
+            data: SpaceKLevelData do nível
+            factories: Dicionário tipo -> função(índice) que cria o objeto
+                       ("enemies", "powerups", "coins" e "platforms")
+            ahead: Distância carregada à frente da tela (look-ahead)
+            behind: Distância mantida atrás da tela
+            keep: Dicionário tipo -> (guardar(índice, objeto), recolocar(índice))
+                  para objetos que saem da janela ainda no jogo e precisam
+                  voltar iguais; recolocar devolve None quando não há nada
+                  guardado (o objeto é criado pela fábrica)
+        """
+        self.data = data
+        self.factories = factories
+        self.keep = keep or {}
+        self.ahead = ahead
+        self.behind = behind
+        self.first = None               # Primeiro pedaço da janela ativa
+        self.last = None                # Último pedaço da janela ativa
+        self.chunks = {}                # pedaço -> {tipo: [(índice, objeto), ...]}
+        self.platform_objects = {}      # índice -> Rect das plataformas ativas
+        self.removed = {kind: set() for kind in data.CHUNK_KINDS}  # derrotados/coletados
+
+        # Listas de objetos ativos (refeitas quando a janela muda)
+        self.enemies = []
+        self.powerups = []
+        self.coins = []
+        self.platforms = []
+
+        # Estatísticas
+        self.chunks_loaded = 0
+        self.chunks_evicted = 0
+        self.peak_entities = 0
+
+    def window(self, left, right):
+        """
+        Calcular os pedaços que devem estar ativos
+
+        Args:
+            left, right: Faixa X que precisa estar viva (tela e jogador)
+
+        Returns:
+            tuple: (primeiro pedaço, último pedaço)
+        """
+        width = self.data.chunk_width
+        last_chunk = self.data.chunk_count - 1
+        first = min(last_chunk, max(0, int((left - self.behind) // width)))
+        last = min(last_chunk, int((right + self.ahead) // width))
+        return first, max(first, last)
+
+    def platform_span(self):
+        """
+        Faixa X onde as plataformas precisam existir
+
+        Returns:
+            tuple: (esquerda, direita) - a janela ativa mais o maior
+                   território de alien, para quem patrulha na borda
+                   continuar pisando em chão
+        """
+        width = self.data.chunk_width
+        margin = self.data.enemy_reach + width // 4
+        return self.first * width - margin, (self.last + 1) * width + margin
+
+    def update(self, left, right):
+        """
+        Carregar e descartar pedaços conforme a câmera
+
+        Args:
+            left, right: Faixa X que precisa estar viva (tela e jogador)
+
+        Returns:
+            bool: True se a janela mudou (listas e plataformas refeitas)
+        """
+        first, last = self.window(left, right)
+        if first == self.first and last == self.last:
+            return False
+
+        # Descartar pedaços que saíram da janela (guardando o que foi
+        # derrotado ou coletado)
+        for chunk in [chunk for chunk in self.chunks if chunk < first or chunk > last]:
+            self.evict(chunk)
+
+        # Carregar pedaços que entraram na janela
+        for chunk in range(first, last + 1):
+            if chunk not in self.chunks:
+                self.load(chunk)
+
+        self.first = first
+        self.last = last
+        self.refresh()
+        return True
+
+    def load(self, chunk):
+        """
+        Criar os objetos de um pedaço
+
+        Args:
+            chunk: Índice do pedaço
+        """
+        entities = {}
+        for kind in self.data.CHUNK_KINDS:
+            removed = self.removed[kind]
+            factory = self.factories[kind]
+            restore = self.keep[kind][1] if kind in self.keep else None
+            items = []
+            for index in self.data.chunk_items(kind, chunk):
+                if index in removed:
+                    continue
+                # Objetos guardados no descarte voltam como estavam
+                item = restore(index) if restore is not None else None
+                items.append((index, item if item is not None else factory(index)))
+            entities[kind] = items
+        self.chunks[chunk] = entities
+        self.chunks_loaded += 1
+
+    def evict(self, chunk):
+        """
+        Descartar os objetos de um pedaço
+
+        Args:
+            chunk: Índice do pedaço
+        """
+        entities = self.chunks.pop(chunk)
+        removed = self.removed
+        for index, enemy in entities["enemies"]:
+            if not enemy.alive:
+                removed["enemies"].add(index)
+        for kind in ("powerups", "coins"):
+            for index, item in entities[kind]:
+                if item.collected:
+                    removed[kind].add(index)
+        for kind, (save, _) in self.keep.items():
+            for index, item in entities[kind]:
+                if index not in removed[kind]:
+                    save(index, item)
+        self.chunks_evicted += 1
+
+    def refresh(self):
+        """Refazer as listas de objetos ativos e as plataformas da janela"""
+        for kind in self.data.CHUNK_KINDS:
+            objects = getattr(self, kind)
+            objects.clear()
+            for chunk in sorted(self.chunks):
+                objects.extend(entity for _, entity in self.chunks[chunk][kind])
+
+        # Plataformas: manter os Rect que continuam na faixa, criar os novos
+        old_objects = self.platform_objects
+        make_platform = self.factories["platforms"]
+        self.platform_objects = {}
+        for index in self.data.platform_indices(*self.platform_span()):
+            plat = old_objects.get(index)
+            self.platform_objects[index] = plat if plat is not None else make_platform(index)
+        self.platforms[:] = self.platform_objects.values()
+
+        self.peak_entities = max(self.peak_entities, self.entity_count())
+
+    def fill_platform_grid(self, grid):
+        """
+        Preencher a grade de colisão com as plataformas da janela
+
+        Args:
+            grid: SpaceKSpatialHash de destino
+        """
+        self.data.fill_platform_grid(grid, self.platform_objects, *self.platform_span())
+
+    def entity_count(self):
+        """Número de objetos ativos (aliens, power-ups, moedas e plataformas)"""
+        return len(self.enemies) + len(self.powerups) + len(self.coins) + len(self.platforms)
+
+    def stats(self):
+        """
+        Estatísticas do streaming
+
+        Returns:
+            dict: Pedaços ativos, carregados, descartados e objetos ativos
+        """
+        return {
+            "chunks_active": len(self.chunks),
+            "chunks_total": self.data.chunk_count,
+            "chunks_loaded": self.chunks_loaded,
+            "chunks_evicted": self.chunks_evicted,
+            "entities": self.entity_count(),
+            "peak_entities": self.peak_entities
+        }
@@ -0,0 +1,1442 @@
+# ===================================================================
+# SPACEK - NÚCLEO DE SIMULAÇÃO (SEM TELA, SEM ÁUDIO, SEM PGZERO)
+# ===================================================================
+# Este módulo contém toda a lógica do jogo SpaceK: física do astronauta,
+# aliens, lasers, partículas, coleta e progressão de níveis.
+#
+# Ele NÃO depende de pgzero, da tela nem do mixer de áudio. Por isso
+# pode ser importado em testes automatizados e em scripts de lote para
+# simular milhares de frames por segundo.
+#
+# O arquivo spaceK.py é apenas um adaptador: ele lê o teclado, chama
+# SpaceKWorld.step() e desenha o estado do mundo na tela.
+#
+# Cada step() avança um passo de 1/tick_rate s. Velocidades, gravidade,
+# consumo e durações são constantes por segundo, convertidas para um
+# passo em set_tick_rate (ver spacek_loop.py).
+#
+# BIBLIOTECAS UTILIZADAS:
+# - math (para cálculos matemáticos e trigonometria)
+# - random (gerador próprio de cada mundo, com semente: partidas reproduzíveis)
+# - pygame.Rect (para detecção de colisões, não precisa de tela)
+# - spacek_aliens (dados e movimento dos aliens em arrays do NumPy)
+# - spacek_collision (grade espacial para as consultas de colisão)
+# - spacek_levels (níveis em arquivo, compilados com cache binário)
+# - spacek_stream (só os pedaços do nível perto da câmera ficam ativos)
+# - spacek_particles (partículas em arrays do NumPy)
+# - spacek_pool (lasers reaproveitados em vez de criados a cada disparo)
+# - spacek_stars (estrelas de fundo em arrays do NumPy)
+# - spacek_loop (taxa de passos e conversão das constantes por segundo)
+# - time.perf_counter (medição opcional de tempo por seção, ver spacek_profile.py)
+# ===================================================================
+
+import math
+import random
+from time import perf_counter
+from pygame import Rect
+
+from spacek_aliens import (ALIEN_FIELDS, ALIEN_HEIGHT, ALIEN_WIDTH, FLYER_SPEED_FACTOR,
+                           SpaceKAlienStore)
+from spacek_collision import SpaceKSpatialHash, swept_aabb, swept_bounds
+from spacek_levels import ENEMY_TYPES, POWERUP_TYPES, SpaceKLevelLoader
+from spacek_loop import (TICK_RATE, blend_per_tick, frames_per_tick, keep_per_tick,
+                         ticks_for)
+from spacek_stream import STREAM_AHEAD, STREAM_BEHIND, SpaceKLevelStream
+from spacek_particles import SpaceKParticleSystem
+from spacek_pool import SpaceKPool
+from spacek_stars import SpaceKStarField
+
+# Tamanho padrão da tela (usado para câmera e limites do mundo)
+WIDTH = 800
+HEIGHT = 600
+
+# Nível de detalhe da simulação dos aliens: o território de um alien
+# precisa chegar a ENEMY_WAKE_MARGIN px da tela para ele acordar, e só
+# volta a dormir quando fica a mais de ENEMY_SLEEP_MARGIN px (a folga
+# evita ficar acordando e dormindo na borda)
+ENEMY_WAKE_MARGIN = 400
+ENEMY_SLEEP_MARGIN = 600
+
+# Lasers: máximo de lasers simultâneos (tamanho do pool) e pontos do rastro
+MAX_LASERS = 5
+LASER_TRAIL_LENGTH = 12
+LASER_SPEED = 1080             # px/s
+LASER_DRAIN = 180              # Energia gasta por segundo (cada laser começa com 120)
+
+# Física do astronauta, por segundo (convertida para um passo em
+# SpaceKWorld.set_tick_rate)
+PLAYER_MAX_SPEED = 360         # px/s
+PLAYER_ACCELERATION = 2880     # px/s²
+PLAYER_FRICTION = 0.85         # Velocidade mantida a cada 1/60 s sem teclas
+PLAYER_STOP_SPEED = 6          # px/s: abaixo disso o astronauta para
+PLAYER_GRAVITY = 2160          # px/s²
+PLAYER_MAX_FALL_SPEED = 900    # px/s
+PLAYER_JUMP_SPEED = 960        # px/s no início do pulo
+JETPACK_BOOST = 150            # px/s a cada impulso do jetpack
+JETPACK_REFUEL = 240           # Combustível recuperado por segundo no chão
+
+# Sobrevivência e efeitos com duração
+OXYGEN_DRAIN = 1.8             # Oxigênio (%) consumido por segundo
+SHIELD_TIME = 10               # Segundos de escudo
+INVULNERABLE_TIME = 200 / 60   # Segundos de invulnerabilidade após dano (~3 s)
+
+# Câmera e fundo
+CAMERA_FOLLOW = 0.05           # Fração da distância até o alvo percorrida a cada 1/60 s
+STAR_DRIFT = 0.5               # Parallax e brilho das estrelas a cada 1/60 s
+
+# Faíscas da tela de vitória
+VICTORY_SPARK_INTERVAL = 13 / 60     # Segundos médios entre faíscas
+VICTORY_SPARK_SPEED = (240, -300, -120)   # px/s: vx até ±240, vy de -300 a -120
+VICTORY_SPARK_LIFETIME = 2.5         # s
+
+# ===================================================================
+# ENTRADA DO JOGADOR PARA UM PASSO DE SIMULAÇÃO
+# ===================================================================
+
+class SpaceKInput:
+    """
+    Estado dos controles do jogador para um único passo da simulação
+
+    - move_left / move_right: teclas de movimento mantidas pressionadas
+    - jump: tecla de pulo/jetpack pressionada neste frame
+    - shoot: tecla de laser pressionada neste frame
+    """
+
+    def __init__(self, move_left=False, move_right=False, jump=False, shoot=False):
+        """
+        Inicializar entrada do jogador
+
+        Args:
+            move_left: Se a tecla esquerda está pressionada
+            move_right: Se a tecla direita está pressionada
+            jump: Se o pulo foi acionado neste frame
+            shoot: Se o laser foi disparado neste frame
+        """
+        self.move_left = move_left
+        self.move_right = move_right
+        self.jump = jump
+        self.shoot = shoot
+
+# ===================================================================
+# CLASSE DO HERÓI ASTRONAUTA (REQUISITO: CLASSES PARA PERSONAGENS)
+# ===================================================================
+
+class SpaceKHero:
+    """
+    Classe do herói astronauta com sistema completo de animações
+
+    REQUISITOS ATENDIDOS:
+    - Usar classes para personagens e sprites
+    - Animações de sprite (andar, parado, respirando, etc.)
+    """
+
+    def __init__(self):
+        """
+        Inicializar o herói astronauta do SpaceK
+        Define todos os estados de animação do personagem
+        """
+        # Sistema de animação de sprites conforme requisito
+        # Cada estado tem múltiplos frames para animação fluida
+        self.animation_states = {
+            "idle": ["^_^", "^_^", "^_^", "o_o", "^_^", "^_^", "-_-", "^_^"],           # Estado parado
+            "walking": ["^_^", "o_o", "^_^", "-_-", "^_^", "o_o", "~_~", "^_^"],       # Estado andando
+            "jumping": ["O_O", "O_O", "@_@", "O_O", "O_O", "@_@"],                    # Estado pulando
+            "breathing": ["^_^", "^_^", "o_o", "^_^", "-_-", "^_^", "o_o", "^_^"]     # Estado respirando
+        }
+
+        self.current_state = "idle"     # Estado atual da animação
+        self.breathing_cycle = 0        # Controla quando alternar para respiração
+        self.animation_timer = 0        # Controla a velocidade da animação
+        self.animation_frame = 0        # Frame atual da animação
+
+    def update_animation(self, on_ground, vx, frames=1):
+        """
+        Atualizar sistema de animação do herói
+
+        REQUISITO ATENDIDO: "animações de sprite (andar, parado, respirando, etc.)"
+
+        Args:
+            on_ground: Se o astronauta está no chão
+            vx: Velocidade horizontal atual do astronauta (px por passo)
+            frames: Quadros de 1/60 s do passo (os timers contam quadros)
+
+        Este método determina qual animação deve ser reproduzida
+        baseado no estado atual do personagem
+        """
+        # Determinar estado da animação baseado no movimento do jogador
+        if not on_ground:
+            # Se não está no chão, usar animação de pulo
+            self.current_state = "jumping"
+        elif abs(vx) > 0.5 * frames:
+            # Se está se movendo horizontalmente, usar animação de caminhada
+            self.current_state = "walking"
+        else:
+            # Se está parado, alternar entre idle e breathing
+            self.breathing_cycle += frames
+            if self.breathing_cycle > 200:  # A cada ~3 segundos
+                # Alternar entre estado parado e respirando
+                self.current_state = "breathing" if self.current_state == "idle" else "idle"
+                self.breathing_cycle = 0
+
+        # Controlar velocidade da animação
+        self.animation_timer += frames
+        if self.animation_timer > 8:  # Velocidade da animação
+            self.animation_timer = 0
+            faces = self.animation_states[self.current_state]
+            self.animation_frame = (self.animation_frame + 1) % len(faces)
+
+    def get_current_frame(self):
+        """
+        Obter o frame atual da animação
+
+        Returns:
+            str: Emoji representando a expressão facial atual
+        """
+        frames = self.animation_states[self.current_state]
+        return frames[self.animation_frame % len(frames)]
+
+# ===================================================================
+# CLASSE DOS INIMIGOS ALIENS (REQUISITO: INIMIGOS PERIGOSOS)
+# ===================================================================
+
+class SpaceKAlien:
+    """
+    Classe para inimigos alienígenas perigosos
+
+    REQUISITOS ATENDIDOS:
+    - Vários inimigos perigosos
+    - Eles se movem em seu território
+    - Usar classes para personagens e sprites
+    - Animações de sprite (andar, parado, respirando, etc.)
+
+    Os dados do alien ficam nos arrays do grupo do seu tipo (ver
+    spacek_aliens.py), onde o movimento de todos os aliens é calculado
+    de uma vez. O objeto guarda só o grupo e a posição nos arrays:
+    alien.x, alien.health etc. leem e escrevem direto nos arrays.
+    """
+
+    __slots__ = ("group", "index", "alien_type")
+
+    # Tamanho (igual para todos os aliens)
+    width = ALIEN_WIDTH
+    height = ALIEN_HEIGHT
+
+    def __init__(self, x, y, alien_type="standard", territory_size=100, rng=None, store=None):
+        """
+        Inicializar alien inimigo
+
+        Args:
+            x, y: Posição inicial do alien
+            alien_type: Tipo do alien (standard, jumper, flyer, robot)
+            territory_size: Tamanho do território onde o alien patrulha
+            rng: random.Random do mundo (None = módulo random global)
+            store: SpaceKAlienStore onde os dados ficam (None = um só para este alien)
+        """
+        rng = rng if rng is not None else random
+        self.alien_type = alien_type
+        if store is None:
+            store = SpaceKAlienStore()  # Alien avulso, fora de um mundo
+
+        # Sistema de movimento e sorteios da animação (mesma ordem de sempre;
+        # timers em quadros de 1/60 s)
+        vx = rng.choice((-1, 1)) * store.timing.patrol_speed  # Velocidade horizontal inicial
+        blink_timer = rng.randint(60, 180)    # Timer para piscar
+        glow_timer = rng.randint(0, 100)      # Timer para efeitos visuais
+
+        # Sistema de vida baseado no tipo de alien
+        if alien_type == "robot":
+            health = 3                        # Robôs são mais resistentes
+        elif alien_type == "jumper":
+            health = 2                        # Saltadores são médios
+        else:
+            health = 1                        # Aliens padrão são frágeis
+
+        # Território de patrulhamento (REQUISITO: movem em território)
+        values = {
+            "x": x, "y": y, "prev_x": x, "prev_y": y,
+            "start_x": x, "territory_size": territory_size,
+            "blink_timer": blink_timer, "glow_timer": glow_timer,
+            "health": health, "max_health": health, "alive": True
+        }
+
+        # Comportamentos especiais por tipo de alien
+        if alien_type == "flyer":
+            # Aliens voadores têm padrão de voo
+            values["flight_offset"] = rng.uniform(0, math.pi * 2)
+            values["base_y"] = y
+            vx *= FLYER_SPEED_FACTOR  # Voadores são mais lentos horizontalmente
+        elif alien_type == "jumper":
+            # Aliens saltadores têm sistema de pulo
+            values["jump_timer"] = rng.randint(60, 120)
+
+        values["vx"] = vx
+        values["speed"] = abs(vx)
+        values["direction"] = values["facing"] = 1 if vx > 0 else -1
+
+        store.add(self, alien_type, values)
+
+    @classmethod
+    def from_values(cls, alien_type, values, store):
+        """
+        Recriar um alien a partir de dados guardados (sem sorteios)
+
+        Args:
+            alien_type: Tipo do alien
+            values: Dicionário campo -> valor (ver SpaceKAlienStore.unpark)
+            store: SpaceKAlienStore onde os dados ficam
+
+        Returns:
+            SpaceKAlien: Alien com exatamente esses dados
+        """
+        alien = cls.__new__(cls)
+        alien.alien_type = alien_type
+        store.add(alien, alien_type, values)
+        return alien
+
+    @property
+    def animation_state(self):
+        """Estado da animação: "walking" (andando) ou "idle" (parado)"""
+        return "walking" if self.group.walking[self.index] else "idle"
+
+    @animation_state.setter
+    def animation_state(self, state):
+        self.group.walking[self.index] = state == "walking"
+
+    def take_damage(self, world):
+        """
+        Sistema de dano do alien
+
+        Args:
+            world: Mundo SpaceKWorld (pontuação, partículas e sons)
+
+        Returns:
+            bool: True se o alien morreu, False se ainda está vivo
+        """
+        self.health -= 1  # Reduzir vida
+
+        if self.health <= 0:
+            # Alien morreu
+            self.alive = False
+            world.emit_sound("enemy_death", self.x)  # Som de morte (enemy_death.mp3)
+
+            # Criar efeito visual de explosão
+            world.create_particles(self.x + self.width//2, self.y + self.height//2, (255, 100, 100), 15)
+
+            # Atualizar estatísticas
+            world.enemies_defeated += 1
+            world.score += 150
+            return True
+        else:
+            # Alien ferido mas ainda vivo
+            world.emit_sound("hurt", self.x)  # Som de impacto (impact.mp3)
+
+            # Criar efeito visual de dano
+            world.create_particles(self.x + self.width//2, self.y + self.height//2, (255, 255, 0), 8)
+
+            # Knockback do alien (vira e segue a patrulha mais rápido)
+            self.vx *= -1.5
+            if self.vx != 0:
+                self.direction = 1 if self.vx > 0 else -1
+                self.speed = abs(self.vx)
+            world.score += 50
+        return False
+
+def alien_field(name):
+    """
+    Criar propriedade que lê e escreve um campo do alien no array do grupo
+
+    Args:
+        name: Nome do campo (chave de ALIEN_FIELDS)
+
+    Returns:
+        property: Leitura devolve número/bool do Python (não do NumPy)
+    """
+    def get(alien):
+        return getattr(alien.group, name)[alien.index].item()
+
+    def set(alien, value):
+        getattr(alien.group, name)[alien.index] = value
+
+    return property(get, set)
+
+# alien.x, alien.health, alien.sleeping... (o estado da animação tem
+# propriedade própria, animation_state)
+for field_name in ALIEN_FIELDS:
+    if field_name != "walking":
+        setattr(SpaceKAlien, field_name, alien_field(field_name))
+del field_name
+
+# ===================================================================
+# CLASSE DOS POWER-UPS (ELEMENTOS COLECIONÁVEIS)
+# ===================================================================
+
+class SpaceKPowerup:
+    """
+    Classe para power-ups colecionáveis do SpaceK
+
+    Tipos disponíveis:
+    - energy: Restaura energia do traje
+    - oxygen: Restaura oxigênio
+    - life: Vida extra
+    - jetpack: Recarrega jetpack
+    - shield: Escudo temporário
+    - speed: Aumento de velocidade
+    """
+
+    __slots__ = ("x", "y", "width", "height", "powerup_type", "collected",
+                 "float_timer", "original_y", "glow_timer", "pulse_timer")
+
+    def __init__(self, x, y, powerup_type="energy"):
+        """
+        Inicializar power-up
+
+        Args:
+            x, y: Posição do power-up
+            powerup_type: Tipo de power-up
+        """
+        self.x = x
+        self.y = y
+        self.width = 30
+        self.height = 30
+        self.powerup_type = powerup_type
+        self.collected = False      # Se já foi coletado
+        self.float_timer = 0        # Timer para animação flutuante
+        self.original_y = y         # Posição Y original
+        self.glow_timer = 0         # Timer para efeito de brilho
+        self.pulse_timer = 0        # Timer para efeito pulsante
+
+    def update(self, frames=1):
+        """
+        Atualizar animação do power-up
+
+        Args:
+            frames: Quadros de 1/60 s do passo
+        """
+        if not self.collected:
+            # Animação flutuante
+            self.float_timer += 0.15 * frames
+            self.y = self.original_y + math.sin(self.float_timer) * 12
+
+            # Timers para efeitos visuais
+            self.glow_timer += frames
+            self.pulse_timer += frames
+
+# ===================================================================
+# CLASSE DAS MOEDAS SPACEK
+# ===================================================================
+
+class SpaceKCoin:
+    """
+    Classe para moedas colecionáveis do SpaceK
+    Moedas fornecem pontos extras e são marcadas com "K"
+    """
+
+    __slots__ = ("x", "y", "width", "height", "collected", "rotation",
+                 "float_timer", "original_y", "sparkle_timer")
+
+    def __init__(self, x, y):
+        """Inicializar moeda SpaceK"""
+        self.x = x
+        self.y = y
+        self.width = 16
+        self.height = 16
+        self.collected = False          # Se foi coletada
+        self.rotation = 0               # Rotação para efeito 3D
+        self.float_timer = 0            # Timer para flutuação
+        self.original_y = y             # Posição Y original
+        self.sparkle_timer = 0          # Timer para efeito de brilho
+
+    def update(self, frames=1):
+        """
+        Atualizar animação da moeda
+
+        Args:
+            frames: Quadros de 1/60 s do passo
+        """
+        if not self.collected:
+            self.rotation += 8 * frames  # Rotação constante
+            self.float_timer += 0.3 * frames
+            # Movimento flutuante suave
+            self.y = self.original_y + math.sin(self.float_timer) * 6
+            self.sparkle_timer += frames
+
+# ===================================================================
+# CLASSE DOS LASERS (SISTEMA DE COMBATE)
+# ===================================================================
+
+class SpaceKLaser:
+    """
+    Classe para projéteis laser do astronauta
+    Sistema de combate contra os aliens
+    """
+
+    __slots__ = ("x", "y", "prev_x", "direction", "speed", "width", "height",
+                 "alive", "trail_x", "trail_y", "trail_head", "trail_count", "energy")
+
+    def __init__(self, x, y, direction):
+        """
+        Inicializar laser
+
+        Args:
+            x, y: Posição inicial
+            direction: Direção do disparo (1=direita, -1=esquerda)
+        """
+        self.speed = LASER_SPEED    # Velocidade do laser (px/s)
+        self.width = 14
+        self.height = 6
+
+        # Rastro visual do laser (coordenadas do mundo) em buffer circular:
+        # a posição mais nova sobrescreve a mais antiga
+        self.trail_x = [0.0] * LASER_TRAIL_LENGTH
+        self.trail_y = [0.0] * LASER_TRAIL_LENGTH
+        self.reset(x, y, direction)
+
+    def reset(self, x, y, direction):
+        """
+        Preparar o laser para um novo disparo (reaproveitado pelo SpaceKPool)
+
+        Args:
+            x, y: Posição inicial
+            direction: Direção do disparo (1=direita, -1=esquerda)
+        """
+        self.x = x
+        self.y = y
+        self.prev_x = x             # Posição no passo anterior (interpolação)
+        self.direction = direction
+        self.alive = True           # Se o laser ainda existe
+        self.trail_head = 0         # Próxima posição do rastro a ser escrita
+        self.trail_count = 0        # Pontos do rastro em uso
+        self.energy = 120           # Energia do laser (vida útil)
+
+    def trail_points(self):
+        """
+        Percorrer o rastro do ponto mais antigo para o mais novo
+
+        Yields:
+            tuple: (x, y) de cada ponto do rastro
+        """
+        start = self.trail_head - self.trail_count
+        for i in range(start, self.trail_head):
+            yield self.trail_x[i], self.trail_y[i]  # Índices negativos dão a volta
+
+    def update(self, camera_x, view_width=WIDTH, tick_dt=1.0 / TICK_RATE):
+        """
+        Atualizar movimento do laser
+
+        Args:
+            camera_x: Posição atual da câmera (para remover lasers fora da tela)
+            view_width: Largura da área visível
+            tick_dt: Duração do passo em segundos
+        """
+        # Adicionar posição atual ao rastro (limitado a LASER_TRAIL_LENGTH pontos)
+        head = self.trail_head
+        self.trail_x[head] = self.x
+        self.trail_y[head] = self.y
+        self.trail_head = (head + 1) % LASER_TRAIL_LENGTH
+        if self.trail_count < LASER_TRAIL_LENGTH:
+            self.trail_count += 1
+
+        # Mover laser
+        self.x += self.speed * tick_dt * self.direction
+        self.energy -= LASER_DRAIN * tick_dt
+
+        # Remover laser se saiu da tela ou perdeu energia
+        if self.x < camera_x - 150 or self.x > camera_x + view_width + 150 or self.energy <= 0:
+            self.alive = False
+
+# ===================================================================
+# FUNÇÕES UTILITÁRIAS
+# ===================================================================
+
+def safe_color(color):
+    """
+    Função utilitária para garantir que valores de cor estão válidos
+
+    Args:
+        color (tuple): Tupla RGB com valores de cor
+
+    Returns:
+        tuple: Tupla RGB com valores limitados entre 0-255
+
+    Esta função previne erros de cor inválida no pygame/pgzero
+    """
+    return tuple(max(0, min(255, int(c))) for c in color)
+
+# ===================================================================
+# MUNDO DO SPACEK (ESTADO COMPLETO DA SIMULAÇÃO)
+# ===================================================================
+
+class SpaceKWorld:
+    """
+    Mundo de simulação do SpaceK
+
+    Guarda todo o estado do jogo (astronauta, aliens, lasers, partículas,
+    estrelas, pontuação) e avança a simulação um passo por vez com step().
+
+    Não desenha nada e não toca sons: os sons pedidos durante um passo
+    ficam em sound_events para que o adaptador (spaceK.py) os reproduza.
+
+    Estados possíveis (state): "playing", "gameover", "victory"
+    """
+
+    def __init__(self, width=WIDTH, height=HEIGHT, seed=None, tick_rate=TICK_RATE):
+        """
+        Inicializar mundo do SpaceK
+
+        Args:
+            width, height: Tamanho da área visível (câmera e limites)
+            seed: Semente dos geradores aleatórios (None = semente nova)
+            tick_rate: Passos da simulação por segundo
+        """
+        self.width = width
+        self.height = height
+        self.high_score = 0           # Maior pontuação já alcançada (sobrevive ao reset)
+        self.hero = SpaceKHero()      # Animações do astronauta
+
+        # Listas dos elementos do jogo
+        self.platforms = []   # Plataformas onde o jogador pode andar
+        self.enemies = []     # Inimigos aliens
+        self.aliens = SpaceKAlienStore()  # Dados dos aliens em arrays (ver spacek_aliens.py)
+        self.powerups = []    # Power-ups colecionáveis
+        self.lasers = []      # Projéteis laser disparados
+        self.laser_pool = SpaceKPool(lambda: SpaceKLaser(0, 0, 1), MAX_LASERS)  # Lasers reaproveitados
+        self.particles = SpaceKParticleSystem()  # Efeitos visuais (explosões, faíscas)
+        self.stars = SpaceKStarField()  # Estrelas de fundo
+        self.coins = []       # Moedas K colecionáveis
+
+        # Grades espaciais para colisões (ver spacek_collision.py)
+        self.platform_grid = SpaceKSpatialHash()  # Plataformas (montada em load_level)
+        self.enemy_grid = SpaceKSpatialHash()     # Aliens vivos e acordados (refeita a cada passo)
+        self.powerup_grid = SpaceKSpatialHash()   # Power-ups (refeita a cada passo)
+        self.coin_grid = SpaceKSpatialHash()      # Moedas (refeita a cada passo)
+
+        self.sound_events = []  # Sons pedidos durante o último passo
+        self.level_version = 0  # Aumenta a cada load_level (caches de desenho usam)
+        self.level_loader = SpaceKLevelLoader()  # Lê levels/levelN.json (com cache binário)
+        self.level_data = None  # SpaceKLevelData do nível atual
+        self.level_name = ""
+        self.level_top = 0      # Faixa vertical ocupada pelas plataformas
+        self.level_bottom = 0
+
+        # Streaming do nível: pedaços carregados à frente e mantidos atrás
+        # da tela (em pixels, ver spacek_stream.py)
+        self.stream = None
+        self.stream_ahead = STREAM_AHEAD
+        self.stream_behind = STREAM_BEHIND
+
+        # Aliens longe da câmera dormem (margens em pixels além da tela)
+        self.enemy_wake_margin = ENEMY_WAKE_MARGIN
+        self.enemy_sleep_margin = ENEMY_SLEEP_MARGIN
+        self.enemies_active = 0     # Aliens vivos atualizados no último passo
+        self.enemies_sleeping = 0   # Aliens vivos dormindo no último passo
+        self.profiler = None    # SpaceKProfiler para medir cada seção do passo (None = desligado)
+
+        # Gerador aleatório próprio do mundo: com a mesma semente e os
+        # mesmos controles, a partida se repete exatamente igual
+        self.rng = random.Random()
+        self.seed = None
+
+        self.set_tick_rate(tick_rate)
+        self.reset(seed)
+
+    def set_tick_rate(self, tick_rate):
+        """
+        Converter as constantes por segundo para a duração de um passo
+
+        Chame antes de reset(): aliens e partículas criados depois já
+        usam a nova taxa. A 60 passos por segundo os valores por passo
+        são exatamente os de sempre (mesmos hashes no spacek_runner.py).
+
+        Args:
+            tick_rate: Passos da simulação por segundo
+        """
+        tick_dt = 1.0 / tick_rate
+        self.tick_rate = tick_rate
+        self.tick_dt = tick_dt                        # Duração de um passo em segundos
+        self.frame_step = frames_per_tick(tick_dt)    # Quadros de 1/60 s por passo (animações)
+
+        # Física do movimento do astronauta (por passo)
+        self.player_max_speed = PLAYER_MAX_SPEED * tick_dt              # Velocidade máxima do jogador
+        self.player_acceleration = PLAYER_ACCELERATION * tick_dt * tick_dt  # Aceleração do movimento
+        self.player_friction = keep_per_tick(PLAYER_FRICTION, tick_dt)  # Atrito para desaceleração suave
+        self.player_stop_speed = PLAYER_STOP_SPEED * tick_dt
+        self.player_gravity = PLAYER_GRAVITY * tick_dt * tick_dt
+        self.player_max_fall_speed = PLAYER_MAX_FALL_SPEED * tick_dt
+        self.player_jump_speed = PLAYER_JUMP_SPEED * tick_dt
+        self.jetpack_boost = JETPACK_BOOST * tick_dt
+        self.jetpack_refuel = JETPACK_REFUEL * tick_dt
+
+        # Sobrevivência, efeitos e câmera
+        self.oxygen_drain = OXYGEN_DRAIN * tick_dt
+        self.shield_ticks = ticks_for(SHIELD_TIME, tick_rate)
+        self.invulnerable_ticks = ticks_for(INVULNERABLE_TIME, tick_rate)
+        self.camera_follow = blend_per_tick(CAMERA_FOLLOW, tick_dt)
+        self.star_drift = STAR_DRIFT * self.frame_step
+        self.victory_spark_odds = ticks_for(VICTORY_SPARK_INTERVAL, tick_rate) - 1
+        self.victory_spark_lifetime = ticks_for(VICTORY_SPARK_LIFETIME, tick_rate)
+
+        self.aliens.set_tick_rate(tick_rate)
+        self.particles.set_tick_rate(tick_rate)
+
+    def reset(self, seed=None):
+        """
+        Configurar estado inicial de uma nova partida
+
+        Esta função inicializa todas as variáveis e elementos
+        necessários para começar uma nova partida
+
+        Args:
+            seed: Semente dos geradores aleatórios (None = semente nova)
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.rng.seed(seed)
+        self.particles.reseed(seed)
+        self.tick = 0                      # Passos executados desde o reset
+
+        self.state = "playing"
+
+        # Resetar estado do jogador
+        self.player_x = 100                # Posição inicial
+        self.player_y = 500
+        self.player_vx = 0                 # Parado inicialmente
+        self.player_vy = 0
+        self.player_on_ground = False      # Se o astronauta está no chão
+        self.player_lives = 3              # Vidas iniciais
+        self.player_energy = 100           # Energia cheia
+        self.player_jetpack_fuel = 100     # Combustível cheio
+        self.player_invulnerable = 0       # Timer de invulnerabilidade após dano
+        self.player_facing = 1             # Direção (1=direita, -1=esquerda)
+        self.player_has_shield = False     # Se o jogador tem escudo ativo
+        self.player_shield_timer = 0       # Tempo restante do escudo
+
+        # Resetar estado do jogo
+        self.current_level = 1             # Começar no nível 1
+        self.camera_x = 0                  # Câmera na posição inicial
+        self.oxygen = 100                  # Oxigênio cheio
+        self.score = 0                     # Pontuação zerada
+        self.coins_collected = 0           # Moedas zeradas
+        self.enemies_defeated = 0          # Inimigos derrotados zerado
+
+        self.laser_pool.release_all(self.lasers)
+        self.lasers.clear()
+        self.particles.clear()
+
+        # Criar campo de estrelas de fundo
+        self.stars.reset(self.rng, self.width, self.height)
+
+        # Carregar o primeiro nível
+        self.load_level(self.current_level)
+        self.save_previous_positions()
+
+    def load_level(self, level):
+        """
+        Carregar elementos específicos de cada nível
+
+        REQUISITO ATENDIDO: "Vários inimigos perigosos. Eles se movem em seu território"
+
+        Os níveis ficam em levels/levelN.json e chegam aqui já compilados
+        (arrays + índices prontos, ver spacek_levels.py). Os objetos só são
+        criados para os pedaços perto da câmera e do jogador (ver update_stream).
+
+        Args:
+            level: Número do nível a ser carregado
+        """
+        data = self.level_loader.get(level)
+        self.level_data = data
+        self.aliens.clear()
+        self.aliens.reserve_parking(len(data.enemies))
+
+        # Streaming do nível: as listas de aliens, power-ups, moedas e
+        # plataformas passam a ser as dos pedaços ativos
+        self.stream = SpaceKLevelStream(data, {
+            "enemies": self.create_enemy,
+            "powerups": self.create_powerup,
+            "coins": self.create_coin,
+            "platforms": self.create_platform
+        }, self.stream_ahead, self.stream_behind,
+            keep={"enemies": (self.save_enemy, self.restore_enemy)})
+        self.enemies = self.stream.enemies
+        self.powerups = self.stream.powerups
+        self.coins = self.stream.coins
+        self.platforms = self.stream.platforms
+
+        # Final do nível (posição X que o jogador precisa alcançar)
+        self.level_end_x = data.end_x
+        self.level_name = data.name
+        self.level_top = data.top
+        self.level_bottom = data.bottom
+
+        self.update_stream()
+        self.level_version += 1
+
+    def create_enemy(self, index):
+        """
+        Criar alien do nível atual
+
+        REQUISITO ATENDIDO: cada alien patrulha seu território
+
+        Args:
+            index: Índice do alien no nível
+
+        Returns:
+            SpaceKAlien: Novo alien (consome números do gerador do mundo)
+        """
+        data = self.level_data
+        x, y, territory = data.enemies[index].tolist()
+        return SpaceKAlien(x, y, ENEMY_TYPES[data.enemy_types[index]], territory, self.rng,
+                           self.aliens)
+
+    def save_enemy(self, index, alien):
+        """
+        Guardar um alien vivo cujo pedaço foi descartado
+
+        Args:
+            index: Índice do alien no nível
+            alien: SpaceKAlien que vai sair dos arrays
+        """
+        self.aliens.park(alien, index)
+
+    def restore_enemy(self, index):
+        """
+        Recolocar um alien guardado quando seu pedaço volta
+
+        Args:
+            index: Índice do alien no nível
+
+        Returns:
+            SpaceKAlien: Alien com vida, posição e timers de quando saiu
+                         (sem novos sorteios do gerador), ou None se ele
+                         nunca saiu da janela
+        """
+        values = self.aliens.unpark(index)
+        if values is None:
+            return None
+        alien_type = ENEMY_TYPES[self.level_data.enemy_types[index]]
+        return SpaceKAlien.from_values(alien_type, values, self.aliens)
+
+    def create_powerup(self, index):
+        """Criar power-up do nível atual a partir do seu índice"""
+        data = self.level_data
+        x, y = data.powerups[index].tolist()
+        return SpaceKPowerup(x, y, POWERUP_TYPES[data.powerup_types[index]])
+
+    def create_coin(self, index):
+        """Criar moeda K do nível atual a partir do seu índice"""
+        x, y = self.level_data.coins[index].tolist()
+        return SpaceKCoin(x, y)
+
+    def create_platform(self, index):
+        """Criar Rect de uma plataforma do nível atual a partir do seu índice"""
+        return Rect(*self.level_data.platforms[index].tolist())
+
+    def update_stream(self):
+        """
+        Carregar e descartar pedaços do nível conforme câmera e jogador
+
+        A faixa viva cobre a tela e o jogador (logo depois de trocar de
+        nível a câmera ainda está longe do jogador). A grade de plataformas
+        só é refeita quando a janela de pedaços muda.
+        """
+        left = min(self.camera_x, self.player_x)
+        right = max(self.camera_x + self.width, self.player_x)
+        if self.stream.update(left, right):
+            self.stream.fill_platform_grid(self.platform_grid)
+            self.aliens.retain(self.enemies)  # Tirar dos arrays os aliens descartados
+
+    def update_enemies(self):
+        """
+        Atualizar aliens com nível de detalhe pela distância da câmera
+
+        Aliens cujo território chega perto da tela (enemy_wake_margin) têm
+        a simulação completa. Os que ficam longe (enemy_sleep_margin)
+        dormem: não são atualizados e, ao acordar, a patrulha é calculada
+        pelo tempo que passou. Tudo vetorizado por tipo (ver spacek_aliens.py).
+        """
+        self.aliens.update(self)
+        self.enemies_active = self.aliens.active
+        self.enemies_sleeping = self.aliens.sleeping
+
+    def rebuild_dynamic_grids(self):
+        """
+        Redistribuir aliens, power-ups e moedas nas grades espaciais
+
+        Chamado a cada passo depois que as entidades se movem, para que
+        as consultas de colisão vejam as posições atuais.
+        """
+        self.enemy_grid.clear()
+        for enemy, x, y in self.aliens.awake_entries():
+            self.enemy_grid.insert(enemy, x, y, ALIEN_WIDTH, ALIEN_HEIGHT)
+
+        self.powerup_grid.clear()
+        for powerup in self.powerups:
+            if not powerup.collected:
+                self.powerup_grid.insert(powerup, powerup.x, powerup.y, powerup.width, powerup.height)
+
+        self.coin_grid.clear()
+        for coin in self.coins:
+            if not coin.collected:
+                self.coin_grid.insert(coin, coin.x, coin.y, coin.width, coin.height)
+
+    def find_landing_platform(self, old_x, old_y):
+        """
+        Encontrar a plataforma onde o astronauta pousa neste frame
+
+        Args:
+            old_x, old_y: Posição do astronauta antes do movimento
+
+        Returns:
+            Rect: Plataforma atingida primeiro durante a queda, ou None
+
+        Usa colisão contínua (swept AABB) entre a posição anterior e a
+        atual, então quedas rápidas não atravessam plataformas finas.
+        Continua valendo a regra de antes: só pousa se estiver caindo e
+        se o centro do astronauta estava sobre a plataforma.
+        """
+        if self.player_vy <= 0:
+            return None
+
+        dx = self.player_x - old_x
+        dy = self.player_y - old_y
+        center_x = old_x + 15
+        player_rect = Rect(self.player_x, self.player_y, 30, 40)
+
+        best_plat = None
+        best_time = None
+        for plat in self.platform_grid.query(*swept_bounds(old_x, old_y, 30, 40, dx, dy)):
+            if not (plat.left < center_x < plat.right):
+                continue
+            hit_time = swept_aabb(old_x, old_y, 30, 40, dx, dy,
+                                  plat.x, plat.y, plat.width, plat.height)
+            if hit_time is None:
+                if not player_rect.colliderect(plat):
+                    continue
+                hit_time = 1.0  # Sobreposição só por arredondamento do Rect
+            if best_time is None or hit_time < best_time:
+                best_plat = plat
+                best_time = hit_time
+        return best_plat
+
+    def find_laser_target(self, laser, start_x):
+        """
+        Encontrar o primeiro alien atingido pelo laser neste frame
+
+        Args:
+            laser: SpaceKLaser já movido para a posição final
+            start_x: Posição X do laser antes do movimento
+
+        Returns:
+            SpaceKAlien: Alien atingido primeiro ao longo do trajeto, ou None
+        """
+        dx = laser.x - start_x
+        laser_rect = Rect(laser.x, laser.y, laser.width, laser.height)
+
+        best_enemy = None
+        best_time = None
+        for enemy in self.enemy_grid.query(*swept_bounds(start_x, laser.y, laser.width, laser.height, dx, 0)):
+            if not enemy.alive:
+                continue
+            hit_time = swept_aabb(start_x, laser.y, laser.width, laser.height, dx, 0,
+                                  enemy.x, enemy.y, enemy.width, enemy.height)
+            if hit_time is None:
+                enemy_rect = Rect(enemy.x, enemy.y, enemy.width, enemy.height)
+                if not laser_rect.colliderect(enemy_rect):
+                    continue
+                hit_time = 1.0  # Sobreposição só por arredondamento do Rect
+            if best_time is None or hit_time < best_time:
+                best_enemy = enemy
+                best_time = hit_time
+        return best_enemy
+
+    # ===============================
+    # EVENTOS E EFEITOS
+    # ===============================
+
+    def emit_sound(self, sound_type, x=None):
+        """
+        Pedir a reprodução de um som (o adaptador decide como tocar)
+
+        Args:
+            sound_type (str): Tipo de som (mesmas chaves de sound_files)
+            x: Posição X do som no mundo (None = som do jogador, sempre audível)
+        """
+        self.sound_events.append((sound_type, x))
+
+    def create_particles(self, x, y, color, count=8, particle_type="normal"):
+        """
+        Criar explosão de partículas para efeitos visuais
+
+        Args:
+            x, y: Posição da explosão
+            color: Cor das partículas
+            count: Número de partículas
+            particle_type: Tipo das partículas
+        """
+        self.particles.spawn_burst(x, y, safe_color(color), count, particle_type)
+
+    def pool_stats(self):
+        """
+        Ocupação dos pools de objetos de vida curta
+
+        Returns:
+            dict: Estatísticas do pool de lasers e do sistema de partículas
+        """
+        return {"lasers": self.laser_pool.stats(), "particles": self.particles.stats()}
+
+    # ===============================
+    # AÇÕES DO JOGADOR
+    # ===============================
+
+    def player_jump(self):
+        """Pulo normal no chão ou impulso do jetpack no ar"""
+        if self.player_on_ground:
+            # Pulo normal
+            self.player_vy = -self.player_jump_speed
+            self.emit_sound("jump")  # Som jump.mp3
+            self.create_particles(self.player_x + 15, self.player_y + 40, (255, 255, 255), 12, "smoke")
+        elif self.player_jetpack_fuel > 0:
+            # Jetpack (pulo aéreo)
+            self.player_vy -= self.jetpack_boost
+            self.player_jetpack_fuel -= 4
+            # Som de jetpack ocasional
+            if self.player_jetpack_fuel % 25 == 0:
+                self.emit_sound("jetpack")  # Som jetpack.mp3
+
+    def player_shoot(self):
+        """Disparar laser na direção em que o astronauta está olhando"""
+        if len(self.lasers) >= MAX_LASERS:
+            return  # Limite de lasers simultâneos
+        laser_x = self.player_x + (45 if self.player_facing == 1 else -20)
+        laser_y = self.player_y + 20
+        self.lasers.append(self.laser_pool.acquire(laser_x, laser_y, self.player_facing))
+        self.emit_sound("laser_shoot")  # Som laser_shoot.mp3
+        self.create_particles(laser_x, laser_y, (0, 255, 255), 10, "spark")
+
+    def take_damage(self):
+        """
+        Função chamada quando o astronauta recebe dano
+
+        Gerencia:
+        - Redução de vidas
+        - Período de invulnerabilidade
+        - Efeitos sonoros e visuais
+        - Reset de posição se ainda tem vidas
+        """
+        # Não aplicar dano se ainda invulnerável
+        if self.player_invulnerable > 0:
+            return
+
+        # Aplicar dano
+        self.player_lives -= 1
+        self.player_invulnerable = self.invulnerable_ticks  # Passos de invulnerabilidade (~3 segundos)
+
+        # Efeitos de dano
+        self.emit_sound("hurt")  # Som de impacto
+        self.create_particles(self.player_x + 15, self.player_y + 20, (255, 100, 100), 25, "spark")
+
+        # Se ainda tem vidas, resetar posição
+        if self.player_lives > 0:
+            self.player_x = max(100, self.camera_x + 100)  # Reset relativo à câmera
+            self.player_y = 500
+            self.player_vx = 0
+            self.player_vy = 0
+            self.save_previous_positions()  # Teletransporte: não interpolar
+
+    def collect_powerup(self, powerup):
+        """
+        Função para coletar power-ups
+
+        Args:
+            powerup: Objeto power-up coletado
+        """
+        # Marcar como coletado
+        powerup.collected = True
+
+        # Efeitos de coleta
+        self.emit_sound("powerup")  # Som de power-up
+        self.create_particles(powerup.x + 15, powerup.y + 15, (255, 255, 0), 20, "spark")
+
+        # Aplicar efeito baseado no tipo
+        if powerup.powerup_type == "energy":
+            self.player_energy = min(100, self.player_energy + 60)
+            self.score += 200
+        elif powerup.powerup_type == "oxygen":
+            self.oxygen = min(100, self.oxygen + 80)
+            self.score += 150
+        elif powerup.powerup_type == "life":
+            self.player_lives += 1
+            self.score += 750
+        elif powerup.powerup_type == "jetpack":
+            self.player_jetpack_fuel = 100
+            self.score += 300
+        elif powerup.powerup_type == "shield":
+            self.player_has_shield = True
+            self.player_shield_timer = self.shield_ticks  # 10 segundos de escudo
+            self.score += 400
+        elif powerup.powerup_type == "speed":
+            self.score += 250
+
+    # ===============================
+    # PASSOS DA SIMULAÇÃO
+    # ===============================
+
+    def update_menu_stars(self, frames=None):
+        """
+        Atualizar apenas as estrelas de fundo (usado na tela de menu)
+
+        Args:
+            frames: Quadros de 1/60 s a avançar de uma vez (None = um
+                    passo; o modo ocioso do menu anda vários em um quadro só)
+        """
+        if frames is None:
+            frames = self.frame_step
+        self.stars.update(frames, frames, -20, self.width + 20)
+
+    def step(self, inputs=None):
+        """
+        Avançar a simulação em um passo (tick_dt segundos)
+
+        REQUISITO ATENDIDO: "Jogo com mecânica lógica, sem bugs"
+
+        Args:
+            inputs: SpaceKInput com os controles deste frame (None = sem teclas)
+
+        Returns:
+            str: Estado do mundo após o passo ("playing", "gameover", "victory")
+
+        Gerencia:
+        - Física do jogador (gravidade, movimento, colisões)
+        - Comportamento dos inimigos
+        - Sistema de projéteis
+        - Efeitos visuais
+        - Lógica de progressão do jogo
+        """
+        if inputs is None:
+            inputs = SpaceKInput()
+
+        # Sons deste passo (o adaptador lê depois de step())
+        self.sound_events = []
+        self.tick += 1
+
+        if self.state == "victory":
+            self.step_victory()
+        elif self.state == "playing":
+            self.step_playing(inputs)
+
+        return self.state
+
+    def step_victory(self):
+        """Atualizar partículas de celebração da tela de vitória"""
+        prof = self.profiler
+        if prof is not None:
+            mark = perf_counter()
+        self.particles.update()
+        if prof is not None:
+            prof.lap("sim.particles", mark)
+
+        # Adicionar novas partículas de celebração ocasionalmente
+        if self.rng.randint(0, self.victory_spark_odds) == 0:
+            speed_x, speed_min, speed_max = VICTORY_SPARK_SPEED
+            tick_dt = self.tick_dt
+            self.particles.emit(
+                self.rng.randint(0, self.width), self.rng.randint(0, self.height//3),
+                (255, 255, 0), self.rng.uniform(-speed_x * tick_dt, speed_x * tick_dt),
+                self.rng.uniform(speed_min * tick_dt, speed_max * tick_dt),
+                self.victory_spark_lifetime, "spark"
+            )
+
+    def save_previous_positions(self):
+        """
+        Guardar as posições atuais como posições do passo anterior
+
+        A tela pode ser desenhada entre dois passos da simulação; ela
+        interpola entre as posições "prev_" e as atuais para o movimento
+        ficar suave mesmo quando a taxa de quadros é diferente da taxa
+        da simulação.
+        """
+        self.prev_camera_x = self.camera_x
+        self.prev_player_x = self.player_x
+        self.prev_player_y = self.player_y
+        self.aliens.save_previous()
+        for laser in self.lasers:
+            laser.prev_x = laser.x
+
+    def step_playing(self, inputs):
+        """
+        Avançar um frame da partida em andamento
+
+        Args:
+            inputs: SpaceKInput com os controles deste frame
+        """
+        # Medição de tempo por seção (só quando há um profiler ligado)
+        prof = self.profiler
+        if prof is not None:
+            mark = perf_counter()
+
+        self.save_previous_positions()
+
+        # ===============================
+        # AÇÕES DISPARADAS NESTE FRAME
+        # ===============================
+        if inputs.jump:
+            self.player_jump()
+        if inputs.shoot:
+            self.player_shoot()
+
+        # ===============================
+        # SISTEMA DE ANIMAÇÃO DO HERÓI
+        # ===============================
+        # Atualizar animações do astronauta (REQUISITO: animações de sprite)
+        self.hero.update_animation(self.player_on_ground, self.player_vx, self.frame_step)
+
+        # ===============================
+        # SISTEMA DE ESCUDO
+        # ===============================
+        # Gerenciar tempo de duração do escudo
+        if self.player_has_shield:
+            self.player_shield_timer -= 1
+            if self.player_shield_timer <= 0:
+                self.player_has_shield = False
+
+        # ===============================
+        # FÍSICA DO JOGADOR
+        # ===============================
+        # Sistema de movimento contínuo baseado em teclas pressionadas
+        if inputs.move_left and not inputs.move_right:
+            # Acelerar para a esquerda
+            self.player_vx -= self.player_acceleration
+            if self.player_vx < -self.player_max_speed:
+                self.player_vx = -self.player_max_speed
+            self.player_facing = -1
+        elif inputs.move_right and not inputs.move_left:
+            # Acelerar para a direita
+            self.player_vx += self.player_acceleration
+            if self.player_vx > self.player_max_speed:
+                self.player_vx = self.player_max_speed
+            self.player_facing = 1
+        else:
+            # Aplicar atrito quando nenhuma tecla está pressionada
+            self.player_vx *= self.player_friction
+            # Parar completamente se a velocidade for muito baixa
+            if abs(self.player_vx) < self.player_stop_speed:
+                self.player_vx = 0
+
+        # Aplicar gravidade apenas se não estiver no chão
+        if not self.player_on_ground:
+            self.player_vy += self.player_gravity  # Força da gravidade
+
+        # Limitar velocidade máxima de queda
+        if self.player_vy > self.player_max_fall_speed:
+            self.player_vy = self.player_max_fall_speed
+
+        # Salvar posição anterior para detectar colisões corretas
+        old_player_x = self.player_x
+        old_player_y = self.player_y
+
+        # Aplicar movimento
+        self.player_x += self.player_vx  # Movimento horizontal
+        self.player_y += self.player_vy  # Movimento vertical (inclui gravidade)
+
+        # Limitar movimento para não sair da tela pela esquerda
+        if self.player_x < 0:
+            self.player_x = 0
+
+        if prof is not None:
+            mark = prof.lap("sim.player", mark)
+
+        # ===============================
+        # SISTEMA DE COLISÃO COM PLATAFORMAS
+        # ===============================
+        self.player_on_ground = False
+
+        # Colisão contínua: encontra a plataforma tocada durante a queda,
+        # mesmo que a posição final já tenha passado por ela
+        plat = self.find_landing_platform(old_player_x, old_player_y)
+        if plat is not None:
+            self.player_y = plat.top - 40     # Posicionar em cima da plataforma
+            self.player_vy = 0                # Parar queda
+            self.player_on_ground = True      # Marcar como no chão
+            # Recarregar jetpack quando toca o chão
+            self.player_jetpack_fuel = min(100, self.player_jetpack_fuel + self.jetpack_refuel)
+
+        if prof is not None:
+            mark = prof.lap("sim.collision", mark)
+
+        player_rect = Rect(self.player_x, self.player_y, 30, 40)  # Hitbox do jogador
+
+        # ===============================
+        # SISTEMA DE CÂMERA
+        # ===============================
+        # Câmera que segue o jogador suavemente
+        target_camera = max(0, self.player_x - self.width // 2.5)  # Posição alvo da câmera
+        self.camera_x += (target_camera - self.camera_x) * self.camera_follow  # Movimento suave
+
+        # Carregar os pedaços do nível que entraram na janela da câmera
+        self.update_stream()
+
+        # ===============================
+        # ATUALIZAR ELEMENTOS DE FUNDO
+        # ===============================
+        # Atualizar estrelas com efeito parallax: movimento mais lento que a
+        # câmera, estrelas que saíram da tela voltam pela direita e o brilho
+        # avança (todas de uma vez, ver spacek_stars.py)
+        self.stars.update(self.star_drift, self.star_drift,
+                          self.camera_x - 200, self.camera_x + self.width + 200)
+
+        if prof is not None:
+            mark = prof.lap("sim.background", mark)
+
+        # ===============================
+        # ATUALIZAR INIMIGOS (REQUISITO)
+        # ===============================
+        # Atualizar os aliens que se movem em territórios perto da câmera
+        self.update_enemies()
+
+        if prof is not None:
+            mark = prof.lap("sim.enemies", mark)
+
+        # ===============================
+        # ATUALIZAR POWER-UPS E MOEDAS
+        # ===============================
+        for powerup in self.powerups:
+            powerup.update(self.frame_step)
+
+        for coin in self.coins:
+            coin.update(self.frame_step)
+
+        if prof is not None:
+            mark = prof.lap("sim.items", mark)
+
+        # Atualizar grades espaciais com as novas posições
+        self.rebuild_dynamic_grids()
+
+        if prof is not None:
+            mark = prof.lap("sim.collision", mark)
+
+        # ===============================
+        # SISTEMA DE PROJÉTEIS LASER
+        # ===============================
+        # Atualizar todos os lasers disparados
+        for laser in self.lasers[:]:  # Usar cópia da lista para remoção segura
+            start_x = laser.x  # Posição antes do movimento (colisão contínua)
+            laser.update(self.camera_x, self.width, self.tick_dt)
+
+            if not laser.alive:
+                self.lasers.remove(laser)  # Remover lasers mortos
+                self.laser_pool.release(laser)
+            else:
+                # Verificar colisão laser-inimigo ao longo de todo o movimento
+                enemy = self.find_laser_target(laser, start_x)
+                if enemy is not None:
+                    # Laser acertou inimigo
+                    self.emit_sound("laser_hit", enemy.x)  # Som de acerto
+                    enemy.take_damage(self)       # Aplicar dano
+                    laser.alive = False           # Destruir laser
+
+        if prof is not None:
+            mark = prof.lap("sim.lasers", mark)
+
+        # ===============================
+        # SISTEMA DE PARTÍCULAS VISUAIS
+        # ===============================
+        # Atualizar e limpar partículas (todas de uma vez, ver spacek_particles.py)
+        self.particles.update()
+
+        if prof is not None:
+            mark = prof.lap("sim.particles", mark)
+
+        # ===============================
+        # COLISÃO JOGADOR-INIMIGO
+        # ===============================
+        # Verificar se jogador colidiu com algum inimigo
+        if self.player_invulnerable <= 0 and not self.player_has_shield:
+            for enemy in self.enemy_grid.query_rect(player_rect):
+                if enemy.alive:
+                    enemy_rect = Rect(enemy.x, enemy.y, enemy.width, enemy.height)
+                    if player_rect.colliderect(enemy_rect):
+                        self.take_damage()  # Jogador recebe dano
+                        break  # Parar após primeira colisão
+        else:
+            # Decrementar timer de invulnerabilidade
+            self.player_invulnerable -= 1
+
+        # ===============================
+        # SISTEMA DE COLETA
+        # ===============================
+        # Verificar coleta de power-ups próximos
+        for powerup in self.powerup_grid.query_rect(player_rect):
+            if not powerup.collected:
+                powerup_rect = Rect(powerup.x, powerup.y, powerup.width, powerup.height)
+                if player_rect.colliderect(powerup_rect):
+                    self.collect_powerup(powerup)
+
+        # Verificar coleta de moedas próximas
+        for coin in self.coin_grid.query_rect(player_rect):
+            if not coin.collected:
+                coin_rect = Rect(coin.x, coin.y, coin.width, coin.height)
+                if player_rect.colliderect(coin_rect):
+                    # Coletar moeda
+                    coin.collected = True
+                    self.coins_collected += 1
+                    self.score += 100
+                    self.emit_sound("collect")  # Som de coleta
+                    # Efeito visual de coleta
+                    self.create_particles(coin.x + 8, coin.y + 8, (255, 215, 0), 15, "spark")
+
+        if prof is not None:
+            mark = prof.lap("sim.collision", mark)
+
+        # ===============================
+        # SISTEMA DE SOBREVIVÊNCIA
+        # ===============================
+        # Consumir oxigênio gradualmente
+        self.oxygen -= self.oxygen_drain
+        if self.oxygen <= 0:
+            self.take_damage()  # Dano por falta de oxigênio
+            self.oxygen = 100   # Resetar oxigênio
+
+        # Verificar morte por queda
+        if self.player_y > self.height + 100:
+            self.take_damage()
+
+        # ===============================
+        # PROGRESSÃO DE NÍVEIS
+        # ===============================
+        # Verificar se jogador chegou ao final do nível
+        if self.player_x > self.level_end_x:
+            if self.level_loader.has_level(self.current_level + 1):
+                # Resetar posição do jogador (antes de carregar: o
+                # streaming começa pelos pedaços onde ele vai aparecer)
+                self.player_x = 100
+                self.player_y = 500
+                self.player_vx = 0
+                self.player_vy = 0
+
+                # Avançar para o próximo nível
+                self.current_level += 1
+                self.load_level(self.current_level)
+                self.save_previous_positions()  # Teletransporte: não interpolar
+
+                # Bônus por completar nível
+                self.score += 3000
+                self.emit_sound("powerup")  # Som de sucesso
+
+                # Efeito visual de celebração
+                self.create_particles(self.player_x + 15, self.player_y + 20, (0, 255, 0), 40, "spark")
+            else:
+                # Jogador completou todos os níveis
+                self.state = "victory"
+                if self.score > self.high_score:
+                    self.high_score = self.score
+
+        # ===============================
+        # VERIFICAR GAME OVER
+        # ===============================
+        if self.player_lives <= 0:
+            self.state = "gameover"
+            if self.score > self.high_score:
+                self.high_score = self.score
+
+        if prof is not None:
+            prof.lap("sim.rules", mark)